@@ -0,0 +1,81 @@
+"""
+Benchmark: compiled glossary lookups vs per-call markdown building, and
+loading the compiled glossary from its pickle cache vs compiling the JSON.
+
+Run with:
+    python -m benchmarks.bench_glossary [lookups]
+"""
+
+import pickle
+import sys
+import time
+
+from tools.trading_vernacular import GLOSSARY, GLOSSARY_FILE, glossary_store
+from utils.glossary import CATEGORY_SECTIONS, CompiledGlossary, load_glossary_file
+
+
+QUERIES = ("wti", "Contango", "crack spread", "HENRY HUB", "mmbtu", "opec", "long", "basis")
+
+
+def build_explanation(term: str) -> str:
+    """The pre-refactor pattern: normalize, then concatenate on every call."""
+    entry = GLOSSARY[term.lower().strip()]
+    response = f"## {entry['full_name']}\n\n"
+    response += f"**Term**: `{term}`\n\n"
+    response += f"### Definition\n{entry['definition']}\n\n"
+    response += f"### Trading Context\n{entry['context']}\n"
+    return response
+
+
+def build_listing() -> str:
+    """The pre-refactor pattern: rescan every category against the glossary."""
+    response = "## Energy Trading Glossary\n\n"
+    for category, (heading, by_definition) in CATEGORY_SECTIONS.items():
+        response += f"{heading}\n"
+        for term, entry in GLOSSARY.items():
+            if entry.get("category") == category:
+                summary = f"{entry['definition'][:60]}..." if by_definition else entry["full_name"]
+                response += f"- **{term}**: {summary}\n"
+        response += "\n"
+    response += "*Use `explain_trading_term` to get detailed explanations.*"
+    return response
+
+
+def rate(func, lookups: int) -> float:
+    """Calls per second over `lookups` calls."""
+    start = time.perf_counter()
+    for i in range(lookups):
+        func(QUERIES[i % len(QUERIES)])
+    return lookups / (time.perf_counter() - start)
+
+
+def main() -> None:
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    start = time.perf_counter()
+    compiled = CompiledGlossary(load_glossary_file(GLOSSARY_FILE))
+    compile_ms = (time.perf_counter() - start) * 1000
+    blob = pickle.dumps(compiled, protocol=pickle.HIGHEST_PROTOCOL)
+    start = time.perf_counter()
+    pickle.loads(blob)
+    unpickle_ms = (time.perf_counter() - start) * 1000
+
+    def explain_compiled_lookup(query: str) -> str:
+        current = glossary_store.get()
+        return current.rendered[current.lookup(query)]
+
+    explain_built = rate(build_explanation, lookups)
+    explain_compiled = rate(explain_compiled_lookup, lookups)
+    list_built = rate(lambda q: build_listing(), lookups // 10)
+    list_compiled = rate(lambda q: glossary_store.get().listing("all"), lookups)
+
+    print(f"Glossary benchmark ({len(GLOSSARY)} terms, {lookups:,} lookups)")
+    print(f"  load: compile JSON {compile_ms:.2f} ms, unpickle cache {unpickle_ms:.2f} ms")
+    print(f"  explain, built per call:   {explain_built:12,.0f} /s")
+    print(f"  explain, compiled:         {explain_compiled:12,.0f} /s  ({explain_compiled / explain_built:.1f}x)")
+    print(f"  list all, built per call:  {list_built:12,.0f} /s")
+    print(f"  list all, compiled:        {list_compiled:12,.0f} /s  ({list_compiled / list_built:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
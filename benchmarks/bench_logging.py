@@ -0,0 +1,103 @@
+"""
+Benchmark: time a tool call spends in logging on the request thread, with
+synchronous handlers and f-string messages vs the queue pipeline with lazy
+%-formatting, JSON output and sampled per-call INFO lines.
+
+The console is simulated by a stream whose writes take a fixed time, like
+stdout piped to a slow consumer.
+
+Run with:
+    python -m benchmarks.bench_logging [calls] [write_microseconds]
+"""
+
+import logging
+import sys
+import time
+
+from utils.logging import JsonFormatter, create_queue_handler
+
+
+class SlowStream:
+    """A stream whose every write blocks (without holding the GIL) for `delay` seconds."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.writes = 0
+
+    def write(self, text: str) -> None:
+        self.writes += 1
+        time.sleep(self.delay)
+
+    def flush(self) -> None:
+        pass
+
+
+def tool_call_fstrings(logger: logging.Logger, i: int) -> None:
+    """The pre-refactor pattern: f-strings built even for disabled DEBUG lines."""
+    series_id, frequency = "RWTC", "daily"
+    logger.info(f"Rolling analytics: series={series_id}, windows={'20,60'}")
+    logger.debug(f"Series cache hit: {series_id} ({frequency})")
+    logger.debug(f"rolling_analytics (io) took {i * 0.001:.1f} ms")
+
+
+def tool_call_lazy(logger: logging.Logger, i: int) -> None:
+    """Lazy %-formatting: disabled lines cost one level check."""
+    series_id, frequency = "RWTC", "daily"
+    logger.info("Rolling analytics: series=%s, windows=%s", series_id, "20,60")
+    logger.debug("Series cache hit: %s (%s)", series_id, frequency)
+    logger.debug("%s (%s) took %.1f ms", "rolling_analytics", "io", i * 0.001)
+
+
+def measure(call, logger: logging.Logger, calls: int):
+    """(mean, p99) microseconds per call on the calling thread."""
+    timings = []
+    for i in range(calls):
+        start = time.perf_counter()
+        call(logger, i)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return sum(timings) / calls * 1e6, timings[int(calls * 0.99)] * 1e6
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers[:] = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    write_us = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    text_format = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+    sync_stream = SlowStream(write_us / 1e6)
+    sync_handler = logging.StreamHandler(sync_stream)
+    sync_handler.setFormatter(text_format)
+    sync_mean, sync_p99 = measure(tool_call_fstrings, make_logger("tools.bench_sync", sync_handler), calls)
+
+    results = []
+    for sample_every in (1, 10):
+        stream = SlowStream(write_us / 1e6)
+        console = logging.StreamHandler(stream)
+        console.setFormatter(JsonFormatter())
+        queue_handler, listener = create_queue_handler([console], sample_every)
+        logger = make_logger(f"tools.bench_queue_{sample_every}", queue_handler)
+        listener.start()
+        mean, p99 = measure(tool_call_lazy, logger, calls)
+        listener.stop()
+        results.append((sample_every, mean, p99, stream.writes))
+
+    print(f"Logging benchmark ({calls:,} tool calls, {write_us:.0f} us per console write)")
+    print(f"  sync handler, f-strings:          mean {sync_mean:7.2f} us  p99 {sync_p99:7.2f} us  ({sync_stream.writes:,} lines)")
+    for sample_every, mean, p99, writes in results:
+        label = f"queue + JSON, lazy, 1 in {sample_every}:"
+        print(
+            f"  {label:<34}mean {mean:7.2f} us  p99 {p99:7.2f} us  ({writes:,} lines, "
+            f"{sync_mean / mean:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark: one-partition batch quantiles vs repeated np.percentile calls.
+
+Run with:
+    python -m benchmarks.bench_quantiles [samples]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from utils.quantiles import quantile_summary
+
+
+PROBS = (0.5, 0.025, 0.975, 0.16, 0.84, 0.01, 0.05)
+TAIL_PROBS = (0.05, 0.01)
+REPEATS = 5
+
+
+def separate_calls(values: np.ndarray) -> list:
+    """The pre-refactor pattern: one call (and one partition) per statistic."""
+    results = [np.median(values)]
+    results += [np.percentile(values, p * 100) for p in PROBS[1:]]
+    for tail in TAIL_PROBS:
+        cutoff = np.percentile(values, tail * 100)
+        results.append(values[values <= cutoff].mean())
+    return results
+
+
+def main() -> None:
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = np.random.default_rng(42).lognormal(4.2, 0.25, samples)
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        separate_calls(values)
+    separate_time = (time.perf_counter() - start) / REPEATS
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        quantile_summary(values, PROBS, TAIL_PROBS)
+    batch_time = (time.perf_counter() - start) / REPEATS
+
+    print(f"Quantile benchmark ({samples:,} samples, {len(PROBS)} quantiles, {len(TAIL_PROBS)} tails)")
+    print(f"  separate np.percentile calls: {separate_time * 1000:8.1f} ms")
+    print(f"  quantile_summary:             {batch_time * 1000:8.1f} ms")
+    print(f"  speedup:                      {separate_time / batch_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
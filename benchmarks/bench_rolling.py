@@ -0,0 +1,81 @@
+"""
+Benchmark: RollingEngine vs naive per-window recomputation.
+
+Run with:
+    python -m benchmarks.bench_rolling [points]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from utils.rolling import DEFAULT_PERCENTILES, RollingEngine
+from utils.volatility import log_returns
+
+
+WINDOWS = (20, 60, 250)
+
+
+def naive_rolling(values: np.ndarray, window: int) -> dict:
+    """Recompute every statistic from scratch for each window position."""
+    n = len(values)
+    out = {name: np.full(n, np.nan) for name in ("mean", "volatility", "zscore", "drawdown", "median")}
+    for i in range(window - 1, n):
+        chunk = values[i - window + 1 : i + 1]
+        mean = chunk.mean()
+        std = chunk.std(ddof=1)
+        out["mean"][i] = mean
+        out["zscore"][i] = (chunk[-1] - mean) / std
+        out["volatility"][i] = log_returns(chunk).std(ddof=1) * np.sqrt(252)
+        out["drawdown"][i] = chunk[-1] / chunk.max() - 1.0
+        out["median"][i] = np.median(chunk)
+    return out
+
+
+def naive_percentiles(values: np.ndarray, window: int) -> np.ndarray:
+    """np.percentile over each window position."""
+    out = np.full((len(values), len(DEFAULT_PERCENTILES)), np.nan)
+    probs = [p * 100 for p in DEFAULT_PERCENTILES]
+    for i in range(window - 1, len(values)):
+        out[i] = np.percentile(values[i - window + 1 : i + 1], probs)
+    return out
+
+
+def main() -> None:
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rng = np.random.default_rng(42)
+    values = 70.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, points)))
+
+    start = time.perf_counter()
+    for window in WINDOWS:
+        naive_rolling(values, window)
+    naive_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    RollingEngine(values).compute(WINDOWS, probs=(0.5,))
+    engine_time = time.perf_counter() - start
+
+    print(f"Rolling analytics benchmark ({points:,} points, windows {WINDOWS})")
+    print(f"  naive recomputation: {naive_time * 1000:8.1f} ms")
+    print(f"  RollingEngine:       {engine_time * 1000:8.1f} ms")
+    print(f"  speedup:             {naive_time / engine_time:8.1f}x")
+
+    # Percentiles are O(n·w) rather than O(n), so time them on their own
+    engine = RollingEngine(values)
+    print(f"Percentile metric {DEFAULT_PERCENTILES} (sorted window, O(n·w))")
+    for window in WINDOWS:
+        start = time.perf_counter()
+        naive_percentiles(values, window)
+        naive_time = time.perf_counter() - start
+        start = time.perf_counter()
+        engine.quantiles(window)
+        engine_time = time.perf_counter() - start
+        print(
+            f"  window {window:>4}: np.percentile {naive_time * 1000:8.1f} ms, "
+            f"RollingEngine {engine_time * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark: 10-point volatility sweep with pooled vs freshly drawn shocks.
+
+Run with:
+    python -m benchmarks.bench_sweep [simulations] [days]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from utils import simulation
+from utils.simulation import ShockPool, simulate_gbm
+
+
+VOLATILITIES = np.linspace(0.15, 0.60, 10)
+
+
+def run_sweep(simulations: int, days: int) -> float:
+    start = time.perf_counter()
+    for vol in VOLATILITIES:
+        simulate_gbm(70.0, vol, days, simulations)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    simulations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+
+    simulation.shock_pool = ShockPool(max_bytes=0)
+    start = time.perf_counter()
+    simulate_gbm(70.0, 0.3, days, simulations)
+    single = time.perf_counter() - start
+    unpooled = run_sweep(simulations, days)
+
+    simulation.shock_pool = ShockPool()
+    pooled = run_sweep(simulations, days)
+
+    print(f"Sensitivity sweep benchmark ({len(VOLATILITIES)} points, {simulations:,} paths x {days} days)")
+    print(f"  single simulation:     {single * 1000:8.1f} ms")
+    print(f"  sweep, fresh shocks:   {unpooled * 1000:8.1f} ms")
+    print(f"  sweep, pooled shocks:  {pooled * 1000:8.1f} ms ({pooled / single:.1f}x one simulation)")
+
+
+if __name__ == "__main__":
+    main()
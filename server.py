@@ -25,6 +25,11 @@ except ImportError:
     sys.exit(1)
 
 from utils.logging import setup_logging
+from utils.metrics import register_metrics_route
+from utils.prefetch import parse_series_list, start_warm_up
+from utils.snapshot import start_snapshot_scheduler, stop_snapshot_scheduler
+from utils.startup import startup_report
+from utils.tracing import configure_tracing
 from tools import register_all_tools
 
 
@@ -58,6 +63,24 @@ def parse_arguments() -> argparse.Namespace:
         default=os.getenv("SERVER_SECRET"),
         help="Server secret for authentication (can also use SERVER_SECRET env var)",
     )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        default=os.getenv("MARKET_SNAPSHOT", "true").lower() == "false",
+        help="Disable the background market snapshot refresh (or set MARKET_SNAPSHOT=false)",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=str,
+        default=os.getenv("EIA_WARMUP_SERIES"),
+        help="Comma-separated EIA series to prefetch at startup, or 'none' "
+             "(default: RWTC,RBRTE,MCRFPUS1,WTIPUUS,RNGWHHD; or EIA_WARMUP_SERIES env var)",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Profile cold-start imports (python -X importtime) and exit",
+    )
     return parser.parse_args()
 
 
@@ -89,7 +112,7 @@ def create_server(args: argparse.Namespace) -> NorthMCPServer:
     if args.transport == "streamable-http":
         server_kwargs["port"] = args.port
         server_kwargs["server_secret"] = args.server_secret
-        logging.info(f"Configuring server with streamable-http on port {args.port}")
+        logging.info("Configuring server with streamable-http on port %s", args.port)
     else:
         logging.info("Configuring server with stdio transport")
     
@@ -99,21 +122,22 @@ def create_server(args: argparse.Namespace) -> NorthMCPServer:
         logging.info("MCP server instance created successfully")
         return mcp
     except Exception as e:
-        logging.error(f"Failed to create MCP server: {e}")
+        logging.error("Failed to create MCP server: %s", e)
         sys.exit(1)
 
 
 def setup_signal_handlers(server: Optional[NorthMCPServer] = None) -> None:
     """Setup graceful shutdown signal handlers."""
     def signal_handler(signum, frame):
-        logging.info(f"Received signal {signum}, shutting down gracefully...")
+        logging.info("Received signal %s, shutting down gracefully...", signum)
+        stop_snapshot_scheduler()
         if server:
             try:
                 # The server should have a method to stop gracefully
                 # This is a placeholder - adjust based on actual North SDK API
                 logging.info("Server shutdown complete")
             except Exception as e:
-                logging.error(f"Error during shutdown: {e}")
+                logging.error("Error during shutdown: %s", e)
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
@@ -125,16 +149,21 @@ def main() -> None:
     # Parse command line arguments
     args = parse_arguments()
     
+    if args.startup_report:
+        print(startup_report())
+        return
+    
     # Setup logging
     setup_logging(debug=args.debug)
+    configure_tracing()
     
     logging.info("=" * 60)
     logging.info("Market Analysis Bot - MCP Server")
     logging.info("=" * 60)
-    logging.info(f"Transport: {args.transport}")
+    logging.info("Transport: %s", args.transport)
     if args.transport == "streamable-http":
-        logging.info(f"Port: {args.port}")
-    logging.info(f"Debug Mode: {args.debug}")
+        logging.info("Port: %s", args.port)
+    logging.info("Debug Mode: %s", args.debug)
     logging.info("=" * 60)
     
     # Validate configuration
@@ -148,9 +177,22 @@ def main() -> None:
         register_all_tools(mcp)
         logging.info("All tools registered successfully")
     except Exception as e:
-        logging.error(f"Failed to register tools: {e}")
+        logging.error("Failed to register tools: %s", e)
         sys.exit(1)
     
+    # Prometheus metrics next to /mcp; stdio clients use the server_stats tool
+    if args.transport == "streamable-http":
+        register_metrics_route(mcp)
+    
+    # Prefetch popular series and build the market snapshot in the background;
+    # neither delays server readiness
+    if os.getenv("EIA_API_KEY"):
+        start_warm_up(parse_series_list(args.warmup))
+        if args.no_snapshot:
+            logging.info("Market snapshot scheduler disabled")
+        else:
+            start_snapshot_scheduler()
+    
     # Setup signal handlers for graceful shutdown
     setup_signal_handlers(mcp)
     
@@ -158,7 +200,7 @@ def main() -> None:
     try:
         logging.info("Starting MCP server...")
         if args.transport == "streamable-http":
-            logging.info(f"Server available at: http://localhost:{args.port}/mcp")
+            logging.info("Server available at: http://localhost:%s/mcp", args.port)
             logging.info("Waiting for connections from North platform...")
         else:
             logging.info("Server running in stdio mode")
@@ -176,7 +218,7 @@ def main() -> None:
     except KeyboardInterrupt:
         logging.info("\nShutdown requested by user")
     except Exception as e:
-        logging.error(f"Server error: {e}", exc_info=True)
+        logging.error("Server error: %s", e, exc_info=True)
         sys.exit(1)
     finally:
         logging.info("Server stopped")
@@ -0,0 +1,13 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def glossary_cache_dir(tmp_path, monkeypatch):
+    """Keep compiled glossary caches out of the real ~/.cache."""
+    cache_dir = tmp_path / "glossary-cache"
+    monkeypatch.setenv("GLOSSARY_CACHE_DIR", str(cache_dir))
+    return cache_dir
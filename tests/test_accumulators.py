@@ -0,0 +1,92 @@
+"""
+Tests for mergeable streaming statistics.
+"""
+
+import pytest
+import numpy as np
+
+from utils.accumulators import MomentAccumulator, QuantileSketch, StreamingStats
+
+
+@pytest.fixture
+def samples():
+    return np.random.default_rng(5).lognormal(4.2, 0.3, 300_000)
+
+
+def test_moments_match_numpy(samples):
+    """Test chunked moments match NumPy full-array results."""
+    acc = MomentAccumulator()
+    for chunk in np.array_split(samples, 13):
+        acc.update(chunk)
+    
+    assert acc.count == samples.size
+    assert acc.mean == pytest.approx(samples.mean(), rel=1e-12)
+    assert acc.std() == pytest.approx(samples.std(), rel=1e-10)
+    assert acc.std(ddof=1) == pytest.approx(samples.std(ddof=1), rel=1e-10)
+    assert acc.min == samples.min()
+    assert acc.max == samples.max()
+
+
+def test_moments_merge_is_order_independent(samples):
+    """Test merging partial accumulators in any order gives the same result."""
+    parts = [MomentAccumulator().update(c) for c in np.array_split(samples, 5)]
+    forward = MomentAccumulator()
+    backward = MomentAccumulator()
+    for part in parts:
+        forward.merge(part)
+    for part in reversed(parts):
+        backward.merge(part)
+    
+    assert forward.mean == pytest.approx(backward.mean, rel=1e-12)
+    assert forward.m2 == pytest.approx(backward.m2, rel=1e-12)
+
+
+def test_sketch_exact_for_small_data():
+    """Test quantiles are exact below the exact limit."""
+    data = np.random.default_rng(1).normal(size=5000)
+    sketch = QuantileSketch().update(data)
+    probs = [0.025, 0.16, 0.5, 0.84, 0.975]
+    
+    assert sketch.is_exact
+    np.testing.assert_allclose(sketch.quantiles(probs), np.quantile(data, probs))
+
+
+def test_sketch_compressed_accuracy(samples):
+    """Test compressed t-digest quantiles stay within 0.5% of exact."""
+    stats = StreamingStats(exact_limit=10_000).update(samples)
+    probs = [0.01, 0.05, 0.5, 0.95, 0.99]
+    
+    assert not stats.is_exact
+    assert len(stats.sketch._means) <= stats.sketch.compression
+    np.testing.assert_allclose(stats.quantiles(probs), np.quantile(samples, probs), rtol=5e-3)
+
+
+def test_streaming_stats_combine_across_workers(samples):
+    """Test per-worker statistics combine to the single-pass result."""
+    parts = [StreamingStats(exact_limit=10_000).update(c) for c in np.array_split(samples, 8)]
+    combined = StreamingStats.combine(parts)
+    single = StreamingStats.from_array(samples)
+    
+    assert combined.count == single.count
+    assert combined.summary()["mean"] == pytest.approx(single.summary()["mean"], rel=1e-12)
+    assert combined.summary()["median"] == pytest.approx(np.median(samples), rel=5e-3)
+
+
+def test_summary_keys():
+    """Test summary reports requested quantiles."""
+    summary = StreamingStats.from_array(np.arange(11.0)).summary([0.1, 0.9])
+    
+    assert summary["count"] == 11
+    assert summary["median"] == 5.0
+    assert summary["range"] == 10.0
+    assert summary["q0.1"] == pytest.approx(1.0)
+    assert summary["q0.9"] == pytest.approx(9.0)
+
+
+def test_empty_stats():
+    """Test empty accumulators return NaN rather than raising."""
+    stats = StreamingStats()
+    
+    assert stats.count == 0
+    assert np.isnan(stats.quantiles([0.5])[0])
+    assert np.isnan(stats.moments.variance())
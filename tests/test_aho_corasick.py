@@ -0,0 +1,32 @@
+"""
+Tests for the Aho-Corasick matcher.
+"""
+
+from utils.aho_corasick import AhoCorasick, select_longest
+
+
+def test_finds_overlapping_patterns_in_one_pass():
+    """Test every occurrence is reported, including patterns inside others."""
+    automaton = AhoCorasick([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+
+    matches = sorted(automaton.iter_matches("ushers"))
+
+    assert matches == [(1, 4, 2), (2, 4, 1), (2, 6, 4)]
+
+
+def test_select_longest_prefers_longer_leftmost_match():
+    """Test "crack spread" beats "crack" and overlapping matches are dropped."""
+    automaton = AhoCorasick([("crack", "crack"), ("crack spread", "crack spread"), ("spread", "spread")])
+
+    selected = select_longest(automaton.iter_matches("the crack spread and a spread"))
+
+    assert [value for _, _, value in selected] == ["crack spread", "spread"]
+
+
+def test_empty_patterns_and_text():
+    """Test empty patterns are ignored and empty text has no matches."""
+    automaton = AhoCorasick([("", 0), ("wti", 1)])
+
+    assert list(automaton.iter_matches("")) == []
+    assert list(automaton.iter_matches("WTI")) == []
+    assert list(automaton.iter_matches("wti")) == [(0, 3, 1)]
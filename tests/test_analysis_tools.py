@@ -130,6 +130,32 @@ def test_calculate_statistics_single_value():
     assert "1 values" in result
 
 
+def test_calculate_statistics_zero_mean():
+    """Test a zero-mean dataset reports the coefficient of variation as n/a."""
+    from tools.analysis_tools import register_analysis_tools
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_analysis_tools(mcp)
+    
+    result = tool_functions["calculate_statistics"](
+        values="-2,-1,0,1,2",
+        label="Spread"
+    )
+    
+    assert "Error" not in result
+    assert "**Coefficient of Variation**: n/a" in result
+
+
 def test_calculate_statistics_invalid_input():
     """Test statistics with invalid input."""
     from tools.analysis_tools import register_analysis_tools
@@ -182,3 +208,467 @@ def test_calculate_statistics_empty():
     # Should handle gracefully
     assert "Error" in result or "0 values" in result
 
+
+
+def _register_with_series(monkeypatch, series):
+    """Register analysis tools against a cache pre-loaded with a series."""
+    from tools import analysis_tools
+    from utils.series_cache import SeriesCache
+    from unittest.mock import MagicMock
+    
+    cache = SeriesCache(api_key=None)
+    cache.put(series)
+    monkeypatch.setattr(analysis_tools, "get_series_cache", lambda: cache)
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    analysis_tools.register_analysis_tools(mcp)
+    return tool_functions
+
+
+def _wti_series(n=600):
+    """Synthetic daily WTI series with ~30% annual volatility."""
+    from utils.series_cache import CachedSeries
+    
+    rng = np.random.default_rng(11)
+    prices = 70.0 * np.exp(np.cumsum(rng.normal(0, 0.30 / np.sqrt(252), n)))
+    periods = [f"d{i:05d}" for i in range(n)]
+    return CachedSeries("RWTC", "daily", periods, prices)
+
+
+def test_historical_volatility_all_methods(monkeypatch):
+    """Test volatility tool reports every estimator for a cached series."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    result = tool_functions["historical_volatility"](series_id="RWTC")
+    
+    assert "Historical Volatility" in result
+    assert "Close-to-Close" in result
+    assert "EWMA" in result
+    assert "GARCH(1,1)" in result
+    assert "volatility_series=\"RWTC\"" in result
+
+
+def test_historical_volatility_invalid_method(monkeypatch):
+    """Test volatility tool rejects unknown estimators."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    result = tool_functions["historical_volatility"](method="yang_zhang")
+    
+    assert "Error" in result
+
+
+def test_monte_carlo_volatility_from_series(monkeypatch):
+    """Test simulation estimates volatility and start price from a series."""
+    series = _wti_series()
+    tool_functions = _register_with_series(monkeypatch, series)
+    
+    result = tool_functions["monte_carlo_simulation"](
+        current_price=0,
+        volatility_series="RWTC",
+        vol_method="close_to_close",
+        simulations=100
+    )
+    
+    assert f"${series.latest:.2f}" in result
+    assert "close_to_close from RWTC" in result
+
+
+def test_monte_carlo_requires_volatility(monkeypatch):
+    """Test simulation errors without volatility or a series."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    result = tool_functions["monte_carlo_simulation"](current_price=70.0)
+    
+    assert "Error" in result
+
+
+def test_monte_carlo_rejects_volatility_and_series(monkeypatch):
+    """Test an explicit volatility is not silently replaced by a series estimate."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    result = tool_functions["monte_carlo_simulation"](
+        current_price=70.0, volatility=0.3, volatility_series="RWTC"
+    )
+    
+    assert "Error" in result
+    assert "not both" in result
+
+
+def test_rolling_analytics_tool(monkeypatch):
+    """Test rolling analytics tool reports each window."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    result = tool_functions["rolling_analytics"](series_id="RWTC", windows="20,60,expanding")
+    
+    assert "Rolling Analytics" in result
+    assert "| 20-day |" in result
+    assert "| 60-day |" in result
+    assert "| expanding |" in result
+    assert "Recent History" in result
+
+
+def test_rolling_analytics_invalid_metric(monkeypatch):
+    """Test rolling analytics tool rejects unknown metrics."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    result = tool_functions["rolling_analytics"](metrics="mean,kurtosis")
+    
+    assert "Error" in result
+
+
+def test_calculate_statistics_json_and_base64():
+    """Test statistics accepts JSON arrays and base64 float64 buffers."""
+    from tools.analysis_tools import register_analysis_tools
+    from utils.value_input import encode_values
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_analysis_tools(mcp)
+    
+    result_json = tool_functions["calculate_statistics"](values="[10, 20, 30, 40, 50]")
+    result_b64 = tool_functions["calculate_statistics"](
+        values=encode_values(np.arange(10.0, 60.0, 10.0))
+    )
+    
+    for result in (result_json, result_b64):
+        assert "5 values" in result
+        assert "30.00" in result
+
+
+def test_calculate_statistics_series_reference(monkeypatch):
+    """Test statistics over a cached series reference."""
+    from utils import value_input
+    from utils.series_cache import SeriesCache
+    
+    series = _wti_series(n=250)
+    cache = SeriesCache(api_key=None)
+    cache.put(series)
+    monkeypatch.setattr(value_input, "get_series_cache", lambda: cache)
+    tool_functions = _register_with_series(monkeypatch, series)
+    
+    result = tool_functions["calculate_statistics"](values="series:RWTC", label="WTI")
+    
+    assert "250 values" in result
+    assert f"{series.values.mean():.2f}" in result
+
+
+def test_monte_carlo_percentiles_and_var():
+    """Test custom percentiles and VaR/CVaR tables."""
+    from tools.analysis_tools import register_analysis_tools
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_analysis_tools(mcp)
+    
+    result = tool_functions["monte_carlo_simulation"](
+        current_price=70.0,
+        volatility=0.30,
+        days=20,
+        simulations=2000,
+        percentiles="1,99",
+        risk_levels="95,99"
+    )
+    
+    assert "| P1 |" in result
+    assert "| P99 |" in result
+    assert "Value-at-Risk" in result
+    assert "| 99% |" in result
+    assert "Expected Shortfall" in result
+
+
+def test_position_risk_long_wti():
+    """Test VaR/ES for a long WTI position with explicit inputs."""
+    from tools.analysis_tools import register_analysis_tools
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_analysis_tools(mcp)
+    
+    result = tool_functions["position_risk"](
+        position="long 100 WTI",
+        current_price=70.0,
+        volatility=0.30,
+        days=1,
+        simulations=5000
+    )
+    
+    assert "Long 100 CL" in result
+    assert "1,000 barrels/contract" in result
+    assert "+100,000 barrels" in result
+    assert "| 95% |" in result
+    assert "| 99% |" in result
+    
+    # One-day 95% VaR ~ 1.645 * 0.30 / sqrt(252) * $7M notional ~ $218k
+    var_95 = result.split("| 95% | $")[1].split(" |")[0]
+    assert 180_000 < float(var_95.replace(",", "")) < 260_000
+
+
+def test_position_risk_uses_series_defaults(monkeypatch):
+    """Test price and volatility default from the contract's EIA series."""
+    series = _wti_series()
+    tool_functions = _register_with_series(monkeypatch, series)
+    
+    result = tool_functions["position_risk"](position="short 10 CL", simulations=1000)
+    
+    assert "Short 10 CL" in result
+    assert f"${series.latest:.2f} (latest RWTC" in result
+    assert "EWMA from RWTC" in result
+
+
+def test_position_risk_invalid_position():
+    """Test unparseable positions return an error."""
+    from tools.analysis_tools import register_analysis_tools
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_analysis_tools(mcp)
+    
+    result = tool_functions["position_risk"](position="lots of oil", current_price=70.0, volatility=0.3)
+    
+    assert "Error" in result
+
+
+def test_sensitivity_grid_simulation():
+    """Test grid evaluates every scenario and widens with volatility."""
+    from tools.analysis_tools import register_analysis_tools
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_analysis_tools(mcp)
+    
+    result = tool_functions["sensitivity_grid"](
+        current_price=70.0,
+        volatilities="0.2:0.4:3",
+        days="10,30",
+        simulations=1000
+    )
+    
+    assert "Sensitivity Grid" in result
+    assert "= 6 scenarios" in result
+    rows = [line for line in result.splitlines() if line.startswith("| ") and "%" in line.split("|")[1]]
+    assert len(rows) == 6
+    widths = [float(r.split("|")[6].split("$")[1].split(" ")[0]) for r in rows if "| 30 |" in r]
+    assert widths == sorted(widths)
+
+
+def test_sensitivity_grid_analytic_matches_simulation():
+    """Test the analytic fast path agrees with simulation for the mean."""
+    from tools.analysis_tools import register_analysis_tools
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_analysis_tools(mcp)
+    
+    result = tool_functions["sensitivity_grid"](
+        current_price=70.0, volatilities="0.3", drifts="0.001", days="20", method="analytic"
+    )
+    
+    assert "Analytic" in result
+    assert f"${70.0 * 1.001 ** 20:.2f}" in result
+
+
+def test_sensitivity_grid_invalid():
+    """Test invalid grids and methods return errors."""
+    from tools.analysis_tools import register_analysis_tools
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_analysis_tools(mcp)
+    
+    assert "Error" in tool_functions["sensitivity_grid"](current_price=70.0, volatilities="high")
+    assert "Error" in tool_functions["sensitivity_grid"](current_price=70.0, method="quasi")
+    assert "Error" in tool_functions["sensitivity_grid"](
+        current_price=70.0, volatilities="0.1:0.9:100", days="1:30:30"
+    )
+    
+    # Range counts are checked before any values are generated
+    huge = tool_functions["sensitivity_grid"](current_price=70.0, volatilities="0:1:100000000")
+    assert "Error" in huge and "between 1 and" in huge
+    assert "Error" in tool_functions["sensitivity_grid"](current_price=70.0, volatilities="0.2:0.4:-3")
+
+
+def test_monte_carlo_mean_reverting_model(monkeypatch):
+    """Test simulation runs the OU model for gas with custom parameters."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    result = tool_functions["monte_carlo_simulation"](
+        current_price=3.5,
+        volatility=0.6,
+        days=60,
+        simulations=500,
+        model="ou",
+        model_params='{"mean_reversion": 4, "long_run_price": 3.0}'
+    )
+    
+    assert "Mean-reverting (Schwartz one-factor) (mean_reversion=4, long_run_price=3)" in result
+    assert "reverts toward a long-run level" in result
+
+
+def test_monte_carlo_mean_reverting_rejects_drift(monkeypatch):
+    """Test OU does not silently ignore a drift."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    result = tool_functions["monte_carlo_simulation"](
+        current_price=3.5, volatility=0.6, drift=0.001, model="ou"
+    )
+    
+    assert "Error" in result
+    assert "long_run_price" in result
+
+
+def test_monte_carlo_invalid_model(monkeypatch):
+    """Test unknown models and malformed parameters return errors."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    unknown = tool_functions["monte_carlo_simulation"](current_price=70.0, volatility=0.3, model="heston")
+    bad_json = tool_functions["monte_carlo_simulation"](
+        current_price=70.0, volatility=0.3, model="merton", model_params="{jumps"
+    )
+    
+    non_numeric = tool_functions["monte_carlo_simulation"](
+        current_price=70.0, volatility=0.3, model="merton", model_params='{"jump_intensity": "high"}'
+    )
+    
+    assert "Unknown model" in unknown
+    assert "Invalid model_params" in bad_json
+    assert non_numeric == "❌ **Error**: model_params values must be numbers"
+
+
+def test_position_risk_jump_model_increases_tail_risk(monkeypatch):
+    """Test jump-diffusion raises 99% Expected Shortfall versus GBM."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    def shortfall(**kwargs):
+        result = tool_functions["position_risk"](
+            position="long 10 CL", current_price=70.0, volatility=0.3,
+            days=5, simulations=20000, confidence="99", **kwargs
+        )
+        return float(result.split("| 99% | $")[1].split(" | $")[1].split(" |")[0].replace(",", ""))
+    
+    jumps = shortfall(model="merton", model_params='{"jump_intensity": 25, "jump_volatility": 0.1}')
+    assert "Merton jump-diffusion" in tool_functions["position_risk"](
+        position="long 10 CL", current_price=70.0, volatility=0.3, model="merton"
+    )
+    assert jumps > shortfall()
+
+
+def test_monte_carlo_bootstrap_model(monkeypatch):
+    """Test bootstrap resamples the cached series' returns."""
+    series = _wti_series()
+    tool_functions = _register_with_series(monkeypatch, series)
+    
+    result = tool_functions["monte_carlo_simulation"](
+        current_price=0,
+        volatility_series="RWTC",
+        simulations=2000,
+        model="bootstrap",
+        model_params='{"block_size": 10, "lookback": 250}'
+    )
+    
+    assert f"${series.latest:.2f}" in result
+    assert "resampled from RWTC" in result
+    assert "Historical block bootstrap (block_size=10, last 250 returns)" in result
+
+
+def test_monte_carlo_bootstrap_requires_series(monkeypatch):
+    """Test bootstrap without a price history or with bad params errors."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    no_series = tool_functions["monte_carlo_simulation"](
+        current_price=70.0, volatility=0.3, model="bootstrap"
+    )
+    bad_param = tool_functions["monte_carlo_simulation"](
+        current_price=0, volatility_series="RWTC", model="bootstrap", model_params='{"blocks": 3}'
+    )
+    
+    negative = tool_functions["monte_carlo_simulation"](
+        current_price=0, volatility_series="RWTC", model="bootstrap", model_params='{"lookback": -250}'
+    )
+    
+    assert "needs a price history" in no_series
+    assert "Unknown parameter" in bad_param
+    assert "lookback must be 0" in negative
+
+
+def test_position_risk_bootstrap_uses_contract_series(monkeypatch):
+    """Test position risk resamples the contract's spot series."""
+    tool_functions = _register_with_series(monkeypatch, _wti_series())
+    
+    result = tool_functions["position_risk"](
+        position="long 5 WTI", current_price=70.0, model="bootstrap", simulations=5000
+    )
+    
+    assert "resampled from RWTC" in result
+    assert "| 99% | $" in result
@@ -0,0 +1,80 @@
+"""
+Tests for contract_codes module.
+"""
+
+import pytest
+
+
+def test_decode_position_list():
+    """Test a mixed position list decodes in one call with net lots."""
+    from tools.contract_codes import register_contract_code_tools
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_contract_code_tools(mcp)
+    
+    assert "decode_contracts" in tool_functions
+    result = tool_functions["decode_contracts"](contracts="long 10 CLZ25, short 2 NG Win-25 strip; XXZ25")
+    
+    assert "Contracts Decoded (6 contract months)" in result
+    assert "| CLZ25 | NYMEX WTI Crude Oil | 2025-12 | 2025-11-20" in result
+    assert "RNGWHHD" in result
+    assert "+10,000 barrels" in result
+    assert "-10 lots = -100,000 MMBtu" in result
+    assert "Not Decoded" in result and "XXZ25" in result
+
+
+def test_decode_nothing_valid():
+    """Test input with no decodable contracts returns an error."""
+    from tools.contract_codes import register_contract_code_tools
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_contract_code_tools(mcp)
+    
+    assert "Error" in tool_functions["decode_contracts"](contracts="lots of oil")
+    assert "Error" in tool_functions["decode_contracts"](contracts=" , ")
+
+
+def test_decode_strip_without_root():
+    """Test a bare strip uses default_contract (CL unless given)."""
+    from tools.contract_codes import register_contract_code_tools
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_contract_code_tools(mcp)
+    
+    result = tool_functions["decode_contracts"](contracts="Cal-26 strip")
+    assert "Contracts Decoded (12 contract months)" in result
+    assert "| CLF26 |" in result and "| CLZ26 |" in result
+    
+    gas = tool_functions["decode_contracts"](contracts="long 1 Win-25", default_contract="Henry Hub")
+    assert "| NGX25 |" in gas and "| NGH26 |" in gas
+    assert "Error" in tool_functions["decode_contracts"](contracts="Cal-26", default_contract="ZZ")
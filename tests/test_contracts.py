@@ -0,0 +1,112 @@
+"""
+Tests for futures contract specifications and position parsing.
+"""
+
+import pytest
+
+import datetime
+
+from utils.contracts import (
+    CONTRACT_SPECS,
+    expand_contracts,
+    last_trade_date,
+    parse_contract_code,
+    parse_contract_position,
+    parse_position,
+    resolve_contract,
+)
+
+
+def test_cl_multiplier_matches_glossary():
+    """Test CL uses the 1,000 barrel multiplier documented in the glossary."""
+    from tools.trading_vernacular import GLOSSARY
+    
+    assert CONTRACT_SPECS["CL"]["multiplier"] == 1000
+    assert "1,000 barrels" in GLOSSARY["nymex"]["context"]
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("long 100 WTI", (100.0, "CL")),
+    ("short 50 NG", (-50.0, "NG")),
+    ("-20 CL", (-20.0, "CL")),
+    ("Buy 10 Brent contracts", (10.0, "BZ")),
+    ("sell 5 henry hub", (-5.0, "NG")),
+])
+def test_parse_position(text, expected):
+    """Test position descriptions parse to signed contracts and a root."""
+    assert parse_position(text) == expected
+
+
+def test_parse_position_invalid():
+    """Test unparseable or unknown positions raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_position("lots of oil")
+    with pytest.raises(ValueError):
+        resolve_contract("ZZ")
+
+
+@pytest.mark.parametrize("code,expected", [
+    ("CLZ25", ("CL", 2025, 12)),
+    ("NGH26", ("NG", 2026, 3)),
+    ("BZZ25", ("BZ", 2025, 12)),
+    ("BZF2027", ("BZ", 2027, 1)),
+    ("rbk26", ("RB", 2026, 5)),
+    ("HOZ5", ("HO", 2025, 12)),
+])
+def test_parse_contract_code(code, expected):
+    """Test exchange codes parse to root, year and month."""
+    contract = parse_contract_code(code, today=datetime.date(2026, 10, 19))
+    assert (contract.root, contract.year, contract.month) == expected
+
+
+def test_parse_contract_code_invalid():
+    """Test bad month codes and unknown roots raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_contract_code("CLA25")
+    with pytest.raises(ValueError):
+        parse_contract_code("XXZ25")
+    # Roots are matched whole: no one-letter root B with month Z
+    with pytest.raises(ValueError):
+        parse_contract_code("BZ25")
+
+
+@pytest.mark.parametrize("symbol,expected", [
+    ("CLZ25", datetime.date(2025, 11, 20)),
+    ("CLG26", datetime.date(2026, 1, 20)),  # Jan 25 is a Sunday
+    ("NGH26", datetime.date(2026, 2, 25)),
+    ("BZZ25", datetime.date(2025, 10, 31)),
+    ("RBZ25", datetime.date(2025, 11, 28)),
+])
+def test_last_trade_date(symbol, expected):
+    """Test last trading days follow each contract's expiry rule."""
+    contract = parse_contract_code(symbol)
+    assert last_trade_date(contract.root, contract.year, contract.month) == expected
+
+
+def test_expand_strips():
+    """Test Cal, quarter and seasonal strips expand to their contract months."""
+    cal = expand_contracts("CL Cal-26 strip")
+    assert len(cal) == 12
+    assert cal[0].symbol == "CLF26" and cal[-1].symbol == "CLZ26"
+    
+    winter = [c.symbol for c in expand_contracts("NG Win-25")]
+    assert winter == ["NGX25", "NGZ25", "NGF26", "NGG26", "NGH26"]
+    
+    assert [c.symbol for c in expand_contracts("Q2 2026", default_root="BZ")] == ["BZJ26", "BZK26", "BZM26"]
+    assert len(expand_contracts("CLZ25-CLH26")) == 4
+    
+    # Strips without a root use the default (CL) or the given one
+    bare = [c.symbol for c in expand_contracts("Cal-26 strip")]
+    assert len(bare) == 12 and bare[0] == "CLF26"
+    assert expand_contracts("Cal-26", default_root="NG")[-1].symbol == "NGZ26"
+    with pytest.raises(ValueError):
+        expand_contracts("Cal-26", default_root="ZZ")
+
+
+def test_parse_contract_position():
+    """Test position items carry signed lots per contract month."""
+    assert parse_contract_position("long 10 CLZ25") == (10.0, [parse_contract_code("CLZ25")])
+    lots, months = parse_contract_position("short 5 NG Sum-26")
+    assert lots == -5.0
+    assert len(months) == 7
+    assert parse_contract_position("BZH26")[0] is None
@@ -113,7 +113,7 @@ def test_rate_limit_warning(caplog):
     assert "Approaching EIA API rate limit" in caplog.text
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_query_success(mock_get):
     """Test successful API query."""
     # Mock successful API response
@@ -137,7 +137,7 @@ def test_query_success(mock_get):
     assert len(result["response"]["data"]) == 2
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_query_404_error(mock_get):
     """Test API query with invalid path (404)."""
     # Mock 404 response
@@ -152,7 +152,7 @@ def test_query_404_error(mock_get):
         client.query(path="invalid/path", limit=100)
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_query_rate_limit_error(mock_get):
     """Test API query when rate limit exceeded (429)."""
     # Mock 429 response
@@ -166,3 +166,14 @@ def test_query_rate_limit_error(mock_get):
     with pytest.raises(Exception):
         client.query(path="petroleum/pri/spt", limit=100)
 
+
+
+def test_clients_share_pooled_session():
+    """Test every client reuses one pooled HTTP session by default."""
+    from utils.eia_client import EIAClient, get_session
+    
+    first = EIAClient(api_key="key-1")
+    second = EIAClient(api_key="key-2")
+    
+    assert first.session is second.session is get_session()
+    assert get_session().get_adapter("https://api.eia.gov")._pool_maxsize >= 8
@@ -0,0 +1,138 @@
+"""
+Tests for the compiled glossary.
+"""
+
+import pytest
+
+from tools.trading_vernacular import GLOSSARY
+from utils.glossary import CATEGORY_SECTIONS, CompiledGlossary
+
+
+def test_compiled_glossary_prerenders_terms():
+    """Test every term is rendered once with its definition and context."""
+    compiled = CompiledGlossary(GLOSSARY)
+    
+    assert len(compiled) == len(GLOSSARY)
+    assert compiled.lookup("CL") == "wti"
+    assert compiled.rendered["wti"].startswith("## West Texas Intermediate")
+    assert GLOSSARY["contango"]["context"] in compiled.rendered["contango"]
+
+
+def test_compiled_glossary_category_index():
+    """Test categories keep glossary order and listings exist for each category."""
+    compiled = CompiledGlossary(GLOSSARY)
+    
+    assert set(compiled.categories) == set(CATEGORY_SECTIONS)
+    assert compiled.categories["measurements"] == ("mcf", "mmbtu")
+    assert sum(len(keys) for keys in compiled.categories.values()) == len(GLOSSARY)
+    assert "Thousand Cubic Feet" in compiled.listing(" Measurements ")
+    assert "Contango" not in compiled.listing("measurements")
+    assert all(heading in compiled.listing("all") for heading, _ in CATEGORY_SECTIONS.values())
+    assert compiled.listing("weather") is None
+
+
+def test_compiled_glossary_is_immutable():
+    """Test the compiled view cannot be modified, even through its mappings."""
+    compiled = CompiledGlossary(GLOSSARY)
+    
+    with pytest.raises(AttributeError):
+        compiled.rendered = {}
+    with pytest.raises(TypeError):
+        compiled.rendered["wti"] = "changed"
+    with pytest.raises(TypeError):
+        compiled.entries["wti"]["full_name"] = "changed"
+
+
+def _write_glossary(path, definition, mtime_ns=None):
+    """Write a one-term glossary file, optionally forcing its mtime."""
+    import json
+    import os
+    
+    terms = {"WTI": {"full_name": "West Texas Intermediate", "definition": definition, "context": "NYMEX CL."}}
+    path.write_text(json.dumps({"terms": terms}))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_glossary_file_validates(tmp_path):
+    """Test keys are lowercased and entries missing fields are rejected."""
+    from utils.glossary import load_glossary_file
+    
+    path = tmp_path / "glossary.json"
+    _write_glossary(path, "Light sweet crude.")
+    assert list(load_glossary_file(path)) == ["wti"]
+    
+    path.write_text('{"terms": {"wti": {"full_name": "WTI"}}}')
+    with pytest.raises(ValueError, match="definition, context"):
+        load_glossary_file(path)
+    path.write_text("{not json")
+    with pytest.raises(ValueError, match="Invalid glossary file"):
+        load_glossary_file(path)
+
+
+def test_store_uses_pickle_cache(tmp_path, monkeypatch):
+    """Test a second store loads the compiled glossary from the disk cache."""
+    import utils.glossary as glossary_module
+    from utils.glossary import GlossaryStore
+    
+    path = tmp_path / "glossary.json"
+    _write_glossary(path, "Light sweet crude.")
+    first = GlossaryStore(path, cache_dir=tmp_path / "cache").get()
+    assert len(list((tmp_path / "cache").glob("glossary-*.pickle"))) == 1
+    
+    def fail(path):
+        raise AssertionError("compiled instead of loading the cache")
+    
+    monkeypatch.setattr(glossary_module, "load_glossary_file", fail)
+    second = GlossaryStore(path, cache_dir=tmp_path / "cache").get()
+    
+    assert second.rendered == first.rendered
+    assert second.lookup("WTI") == "wti"
+    with pytest.raises(TypeError):
+        second.entries["wti"]["definition"] = "changed"
+
+
+def test_store_hot_reloads_on_mtime_change(tmp_path):
+    """Test edits are picked up and a broken edit keeps the previous version."""
+    from utils.glossary import GlossaryStore
+    
+    path = tmp_path / "glossary.json"
+    _write_glossary(path, "Light sweet crude.", mtime_ns=1_000_000_000)
+    store = GlossaryStore(path, cache_dir=tmp_path / "cache", check_seconds=0)
+    original = store.get()
+    
+    _write_glossary(path, "Cushing-delivered crude.", mtime_ns=2_000_000_000)
+    reloaded = store.get()
+    assert reloaded is not original
+    assert "Cushing-delivered" in reloaded.rendered["wti"]
+    
+    path.write_text("{broken", encoding="utf-8")
+    assert store.get() is reloaded
+
+
+
+def test_store_removes_older_caches(glossary_cache_dir, tmp_path):
+    """Test a reload leaves only the current cache file in the default cache dir."""
+    from utils.glossary import GlossaryStore
+    
+    path = tmp_path / "glossary.json"
+    _write_glossary(path, "Light sweet crude.", mtime_ns=1_000_000_000)
+    store = GlossaryStore(path, check_seconds=0)
+    store.get()
+    first = list(glossary_cache_dir.glob("glossary-*.pickle"))
+    
+    _write_glossary(path, "Cushing-delivered crude.", mtime_ns=2_000_000_000)
+    store.get()
+    current = list(glossary_cache_dir.glob("glossary-*.pickle"))
+    
+    assert len(first) == len(current) == 1
+    assert first != current
+
+
+def test_find_terms_respects_word_boundaries():
+    """Test free-text extraction keeps original casing and skips partial words."""
+    compiled = CompiledGlossary(GLOSSARY)
+    
+    found = compiled.find_terms("Brent-WTI arb widened; carbon along the  Henry Hub curve, CL too")
+    
+    assert found == [("Brent-WTI", "arb"), ("arb", "arb"), ("Henry Hub", "henry hub"), ("CL", "wti")]
@@ -0,0 +1,44 @@
+"""
+Tests for lazy module.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from utils.lazy import LazyModule, lazy_import
+
+
+def test_lazy_module_loads_on_first_access():
+    """Test the proxy imports on first attribute access and then caches."""
+    module = LazyModule("colorsys")
+    assert "_lazy_target" not in module.__dict__
+    
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert module.__dict__["_lazy_target"] is sys.modules["colorsys"]
+    assert "hsv_to_rgb" in module.__dict__
+
+
+def test_lazy_import_returns_loaded_module():
+    """Test an already imported module is returned as is."""
+    import json
+    assert lazy_import("json") is json
+
+
+def test_lazy_module_missing_attribute():
+    """Test unknown attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        LazyModule("colorsys").not_a_function
+
+
+def test_tools_import_defers_heavy_dependencies():
+    """Test importing the tools package leaves numpy, pandas and requests unloaded."""
+    code = (
+        "import sys, tools; "
+        "print(','.join(m for m in ('numpy', 'pandas', 'requests') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
@@ -0,0 +1,62 @@
+"""
+Tests for logging module.
+"""
+
+import io
+import json
+import logging
+
+from utils.logging import JsonFormatter, SamplingFilter, create_queue_handler
+
+
+def make_record(name: str = "tools.example", level: int = logging.INFO, msg: str = "lookup: %s", args=("wti",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_json_formatter_includes_extra_fields():
+    """Test records format as one JSON object with the merged message and extras."""
+    record = make_record()
+    record.tool = "explain_trading_term"
+    
+    entry = json.loads(JsonFormatter().format(record))
+    
+    assert entry["message"] == "lookup: wti"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "tools.example"
+    assert entry["tool"] == "explain_trading_term"
+    assert "args" not in entry
+
+
+def test_sampling_filter_keeps_one_in_n_tool_info_lines():
+    """Test per-call INFO lines are sampled per logger; other records always pass."""
+    sampler = SamplingFilter(every=3)
+    
+    kept = [sampler.filter(make_record()) for _ in range(9)]
+    assert kept.count(True) == 3
+    assert sampler.filter(make_record(name="tools.other"))
+    assert all(sampler.filter(make_record(level=logging.WARNING)) for _ in range(5))
+    assert all(sampler.filter(make_record(name="utils.series_cache")) for _ in range(5))
+
+
+def test_queue_handler_writes_on_listener_thread():
+    """Test records reach the real handler through the queue, formatted lazily."""
+    stream = io.StringIO()
+    console = logging.StreamHandler(stream)
+    console.setFormatter(JsonFormatter())
+    queue_handler, listener = create_queue_handler([console])
+    
+    logger = logging.getLogger("tools.test_queue_handler")
+    logger.handlers[:] = [queue_handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    
+    listener.start()
+    try:
+        logger.info("Forward curve: series=%s, months=%d", "WTIPUUS", 12)
+        logger.debug("dropped at INFO: %s", "x")
+    finally:
+        listener.stop()
+    
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["message"] == "Forward curve: series=WTIPUUS, months=12"
@@ -0,0 +1,195 @@
+"""
+Tests for market_structure module.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _register(monkeypatch, prices, release="2025-10"):
+    """Register market structure tools against a cached STEO series."""
+    from tools import market_structure
+    from utils.series_cache import CachedSeries, SeriesCache
+    from utils.term_structure import ForwardCurveCache
+    from unittest.mock import MagicMock
+    
+    periods = pd.period_range("2025-01", periods=len(prices), freq="M").astype(str)
+    cache = SeriesCache(api_key=None)
+    cache.put(CachedSeries("WTIPUUS", "monthly", np.asarray(periods), prices))
+    monkeypatch.setattr(market_structure, "get_series_cache", lambda: cache)
+    monkeypatch.setattr(market_structure, "forward_curve_cache", ForwardCurveCache(lambda: release))
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    market_structure.register_market_structure_tools(mcp)
+    return tool_functions
+
+
+def test_forward_curve_backwardation(monkeypatch):
+    """Test a falling STEO forecast is reported as backwardation."""
+    tool_functions = _register(monkeypatch, np.linspace(80.0, 60.0, 24))
+    
+    result = tool_functions["forward_curve"](months=6)
+    
+    assert "Forward Curve: WTIPUUS" in result
+    assert "STEO release 2025-10" in result
+    assert "**Structure**: Backwardation" in result
+    assert "| 2025-10 |" in result
+    assert "| 2025-09 |" not in result
+
+
+def test_forward_curve_mixed_with_start(monkeypatch):
+    """Test a curve that turns is reported as mixed from an explicit start."""
+    prices = np.concatenate((np.linspace(60.0, 70.0, 12), np.linspace(69.0, 60.0, 12)))
+    tool_functions = _register(monkeypatch, prices)
+    
+    result = tool_functions["forward_curve"](start="2025-08", months=10)
+    
+    assert "**Structure**: Mixed" in result
+    assert "2025-08 to 2026-05" in result
+
+
+def test_forward_curve_error(monkeypatch):
+    """Test too few forecast months returns an error."""
+    tool_functions = _register(monkeypatch, np.linspace(80.0, 60.0, 10))
+    
+    result = tool_functions["forward_curve"]()
+    
+    assert "Error" in result
+
+
+def _register_spread_legs(monkeypatch, *series):
+    """Register tools against a cache holding the given spread legs."""
+    from tools import market_structure
+    from utils.series_cache import SeriesCache
+    from unittest.mock import MagicMock
+    
+    cache = SeriesCache(api_key=None)
+    for s in series:
+        cache.put(s)
+    monkeypatch.setattr(market_structure, "get_series_cache", lambda: cache)
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    market_structure.register_market_structure_tools(mcp)
+    return tool_functions
+
+
+def test_spread_analysis_brent_wti(monkeypatch):
+    """Test the Brent-WTI arb is computed on shared dates with rolling stats."""
+    from utils.series_cache import CachedSeries
+    
+    periods = np.array([f"2025-{m:02d}-{d:02d}" for m in (1, 2, 3) for d in range(1, 29)])
+    rng = np.random.default_rng(3)
+    wti = 70.0 + rng.normal(0, 1, periods.size).cumsum()
+    brent = wti + 4.0 + rng.normal(0, 0.3, periods.size)
+    tool_functions = _register_spread_legs(
+        monkeypatch,
+        CachedSeries("RWTC", "daily", periods, wti),
+        CachedSeries("RBRTE", "daily", periods[5:], brent[5:]),
+    )
+    
+    result = tool_functions["spread_analysis"](spread="brent-wti", windows="20", history=3)
+    
+    assert "Brent-WTI Arb" in result
+    assert "RBRTE − RWTC" in result
+    assert f"{brent[-1] - wti[-1]:+.2f} $/barrel" in result
+    assert f"**Aligned Observations**: {periods.size - 5}" in result
+    assert "| 20-day |" in result
+
+
+def test_spread_analysis_errors(monkeypatch):
+    """Test unknown spreads and disjoint legs return errors."""
+    from utils.series_cache import CachedSeries
+    
+    tool_functions = _register_spread_legs(
+        monkeypatch,
+        CachedSeries("RWTC", "daily", ["2025-01-01", "2025-01-02"], [70.0, 71.0]),
+        CachedSeries("RBRTE", "daily", ["2025-02-01", "2025-02-02"], [75.0, 76.0]),
+    )
+    
+    assert "Unknown spread" in tool_functions["spread_analysis"](spread="jet crack")
+    assert "fewer than 2 dates" in tool_functions["spread_analysis"](legs="RBRTE:1,RWTC:-1")
+    assert "Invalid window 1" in tool_functions["spread_analysis"](windows="20,1")
+
+
+def test_spread_analysis_rejects_mixed_frequencies(monkeypatch):
+    """Test legs with different frequencies are named instead of failing the join."""
+    from utils.series_cache import CachedSeries
+    
+    tool_functions = _register_spread_legs(
+        monkeypatch,
+        CachedSeries("RWTC", "daily", ["2025-01-01", "2025-01-02"], [70.0, 71.0]),
+        CachedSeries("WTIPUUS", "monthly", ["2025-01", "2025-02"], [72.0, 73.0]),
+    )
+    
+    result = tool_functions["spread_analysis"](legs="RWTC:1,WTIPUUS:-1")
+    
+    assert "Error" in result
+    assert "RWTC (daily)" in result and "WTIPUUS (monthly)" in result
+
+
+def test_market_snapshot_served_from_store(monkeypatch):
+    """Test the snapshot tool returns the pre-rendered snapshot."""
+    from tools import market_structure
+    from utils.snapshot import MarketSnapshot, SnapshotRow, SnapshotStore
+    
+    store = SnapshotStore()
+    store._snapshot = MarketSnapshot([
+        SnapshotRow("RWTC", "WTI Cushing Spot Price", 61.5, "2025-10-17", -1.2, 3.4, 0.31)
+    ])
+    monkeypatch.setattr(market_structure, "snapshot_store", store)
+    tool_functions = _register_spread_legs(monkeypatch)
+    
+    result = tool_functions["market_snapshot"]()
+    
+    assert result is store.current.rendered
+    assert "| WTI Cushing Spot Price | $61.50 | 2025-10-17 | -1.2% | +3.4% | 31.0% |" in result
+
+
+
+def test_market_snapshot_cold_call_builds_off_caller_thread(monkeypatch):
+    """Test a cold snapshot call answers at once and builds on another thread."""
+    import threading
+    from tools import market_structure
+    from utils.series_cache import CachedSeries, SeriesCache
+    from utils.snapshot import SnapshotStore
+    
+    periods = np.array([f"2025-09-{d:02d}" for d in range(1, 29)])
+    cache = SeriesCache(api_key=None)
+    cache.put(CachedSeries("RWTC", "daily", periods, 70.0 + np.sin(np.arange(28))))
+    build_threads = []
+    get_many = cache.get_many
+    
+    def recording_get_many(*args, **kwargs):
+        build_threads.append(threading.get_ident())
+        return get_many(*args, **kwargs)
+    
+    monkeypatch.setattr(cache, "get_many", recording_get_many)
+    store = SnapshotStore(series_ids=("RWTC",), cache=cache)
+    monkeypatch.setattr(market_structure, "snapshot_store", store)
+    tool_functions = _register_spread_legs(monkeypatch)
+    
+    cold = tool_functions["market_snapshot"]()
+    store.refresh_in_background().join(5)
+    warm = tool_functions["market_snapshot"]()
+    
+    assert "warming up" in cold
+    assert build_threads and threading.get_ident() not in build_threads
+    assert warm is store.current.rendered
@@ -0,0 +1,110 @@
+"""
+Tests for metrics module.
+"""
+
+import asyncio
+
+import pytest
+
+from utils.metrics import LatencySeries, MetricsRegistry, register_metrics_route
+
+
+def test_latency_quantiles():
+    """Test nearest-rank percentiles over the latency window."""
+    series = LatencySeries()
+    for ms in range(1, 101):
+        series.record(ms / 1000)
+    
+    p50, p95, p99 = series.quantiles()
+    assert p50 == pytest.approx(0.051)
+    assert p95 == pytest.approx(0.096)
+    assert p99 == pytest.approx(0.100)
+    assert LatencySeries().quantiles() == [None, None, None]
+
+
+def test_latency_window_is_bounded():
+    """Test only the most recent samples count towards percentiles."""
+    series = LatencySeries(window=10)
+    for _ in range(100):
+        series.record(1.0)
+    for _ in range(10):
+        series.record(0.001)
+    
+    assert series.calls == 110
+    assert series.quantiles()[2] == pytest.approx(0.001)
+
+
+def test_prometheus_rendering():
+    """Test tool, EIA and series cache metrics render in Prometheus text format."""
+    registry = MetricsRegistry()
+    registry.record_tool_call("spread_analysis", 0.2)
+    registry.record_tool_call("spread_analysis", 0.4, error=True)
+    registry.record_tool_cache_hit("spread_analysis")
+    registry.record_eia_request("petroleum/pri/spt", 0.8)
+    registry.record_series_cache(hit=True)
+    
+    text = registry.render_prometheus()
+    
+    assert '# TYPE market_analysis_tool_latency_seconds summary' in text
+    assert 'market_analysis_tool_calls_total{tool="spread_analysis"} 3' in text
+    assert 'market_analysis_tool_errors_total{tool="spread_analysis"} 1' in text
+    assert 'market_analysis_tool_cache_hits_total{tool="spread_analysis"} 1' in text
+    assert 'market_analysis_tool_latency_seconds_count{tool="spread_analysis"} 2' in text
+    assert 'market_analysis_eia_calls_total{path="petroleum/pri/spt"} 1' in text
+    assert 'market_analysis_series_cache_lookups_total{result="hit"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_snapshot_is_detached_from_live_tables():
+    """Test rendering works on copies, so tools first seen mid-render cannot resize them."""
+    registry = MetricsRegistry()
+    registry.record_tool_call("spread_analysis", 0.2)
+    
+    tools, eia, series_cache = registry.snapshot()
+    registry.record_tool_call("position_risk", 0.1)
+    registry.record_eia_request("steo", 0.3)
+    registry.record_series_cache(hit=False)
+    
+    assert [name for name, _ in tools] == ["spread_analysis"]
+    assert eia == []
+    assert series_cache == {"hits": 0, "misses": 0}
+    assert "position_risk" in registry.render_markdown()
+
+
+def test_metrics_route_requires_custom_routes():
+    """Test the route is skipped on servers without custom routes."""
+    from unittest.mock import MagicMock
+    
+    assert register_metrics_route(MagicMock(spec=["tool"])) is False
+    
+    mcp = MagicMock()
+    assert register_metrics_route(mcp) is True
+    mcp.custom_route.assert_called_once_with("/metrics", methods=["GET"])
+
+
+def test_server_stats_tool():
+    """Test server_stats reports calls recorded by the registry wrapper."""
+    from tools.registry import ToolSpec, wrap_tool
+    from tools.server_stats import register_server_stats_tool
+    from utils.metrics import metrics
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_server_stats_tool(mcp)
+    
+    failing = wrap_tool(lambda: "❌ **Error**: bad input", ToolSpec("failing_probe"))
+    asyncio.run(failing())
+    
+    result = tool_functions["server_stats"]()
+    
+    assert "## Server Stats" in result
+    assert "| failing_probe | 1 | 1 |" in result
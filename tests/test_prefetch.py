@@ -0,0 +1,60 @@
+"""
+Tests for the EIA series warm-up.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from utils.prefetch import DEFAULT_WARMUP_SERIES, parse_series_list, start_warm_up, warm_up
+from utils.series_cache import SeriesCache
+
+
+def test_parse_series_list():
+    """Test default, disabled and custom warm-up lists."""
+    assert parse_series_list(None) == DEFAULT_WARMUP_SERIES
+    assert parse_series_list("none") == ()
+    assert parse_series_list(" rwtc, RBRTE,RWTC ") == ("RWTC", "RBRTE")
+
+
+def test_warm_up_fetches_concurrently_and_tolerates_failures():
+    """Test series load in parallel and one failure does not stop the rest."""
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    
+    def query(**kwargs):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        if kwargs["facets"]["series"] == ["RBRTE"]:
+            raise RuntimeError("boom")
+        return {"response": {"data": [{"period": "2025-10-01", "value": 1.0}]}}
+    
+    client = Mock()
+    client.query.side_effect = query
+    cache = SeriesCache(client=client)
+    
+    results = warm_up(("RWTC", "RBRTE", "RNGWHHD", "WTIPUUS"), cache=cache)
+    
+    assert results["RBRTE"] == "boom"
+    assert results["RWTC"] is None
+    assert active["peak"] > 1
+    assert cache.get("RNGWHHD").latest == 1.0
+    assert client.query.call_count == 4
+
+
+def test_start_warm_up_runs_in_background():
+    """Test warm-up returns immediately on a daemon thread."""
+    client = Mock()
+    client.query.return_value = {"response": {"data": [{"period": "2025-10-01", "value": 2.0}]}}
+    cache = SeriesCache(client=client)
+    
+    thread = start_warm_up(("RWTC",), cache=cache)
+    thread.join(timeout=5)
+    
+    assert thread.daemon
+    assert cache.get("RWTC").latest == 2.0
+    assert start_warm_up(()) is None
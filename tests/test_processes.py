@@ -0,0 +1,98 @@
+"""
+Tests for the price process registry and the shared simulation engine.
+"""
+
+import pytest
+import numpy as np
+
+from utils.processes import PROCESSES, PriceProcess, get_process, register_process
+from utils.simulation import simulate_gbm, simulate_process
+
+
+def test_registry_contains_builtin_models():
+    """Test GBM, OU and Merton are registered and lookup is case-insensitive."""
+    assert {"gbm", "ou", "merton"} <= set(PROCESSES)
+    assert get_process(" OU ").name == "ou"
+    
+    with pytest.raises(ValueError):
+        get_process("heston")
+
+
+def test_gbm_process_matches_simulate_gbm():
+    """Test the engine reproduces the dedicated GBM simulator exactly."""
+    np.testing.assert_array_equal(
+        simulate_process("gbm", 70.0, 0.3, 10, 500, drift=0.001),
+        simulate_gbm(70.0, 0.3, 10, 500, drift=0.001),
+    )
+
+
+@pytest.mark.parametrize("model", ["gbm", "ou", "merton"])
+def test_step_function_matches_block_terminal(model):
+    """Test each model's fast terminal path agrees with stepping day by day."""
+    process = get_process(model)
+    params = process.resolve_params(3.5, 0.5, 0.0)
+    shocks = np.random.default_rng(0).standard_normal((40_000, 20))
+    
+    fast = process.terminal(3.5, shocks, np.random.default_rng(1), params)
+    stepped = PriceProcess.terminal(process, 3.5, shocks, np.random.default_rng(1), params)
+    
+    np.testing.assert_allclose(
+        np.quantile(fast, [0.05, 0.5, 0.95]),
+        np.quantile(stepped, [0.05, 0.5, 0.95]),
+        rtol=0.01,
+    )
+
+
+@pytest.mark.parametrize("model", ["ou", "merton"])
+def test_results_independent_of_workers_and_chunking(monkeypatch, model):
+    """Test threads and block boundaries do not change seeded results."""
+    from utils import simulation
+    
+    monkeypatch.setattr(simulation, "PATH_CHUNK_ROWS", 256)
+    serial = simulate_process(model, 3.5, 0.6, 15, 2000, workers=1)
+    threaded = simulate_process(model, 3.5, 0.6, 15, 2000, workers=4)
+    
+    np.testing.assert_array_equal(serial, threaded)
+
+
+def test_ou_reverts_to_long_run_price():
+    """Test OU paths converge on the long-run level, unlike GBM."""
+    terminal = simulate_process(
+        "ou", 5.0, 0.5, 504, 20_000, params={"long_run_price": 3.0, "mean_reversion": 4.0}
+    )
+    
+    assert np.median(terminal) == pytest.approx(3.0, rel=0.03)
+    assert terminal.std() < simulate_gbm(5.0, 0.5, 504, 20_000).std()
+
+
+def test_merton_jumps_fatten_tails_and_keep_mean():
+    """Test compensated jumps leave the mean unchanged but widen the tails."""
+    params = {"jump_intensity": 20, "jump_volatility": 0.1}
+    jumps = simulate_process("merton", 70.0, 0.2, 60, 50_000, params=params)
+    plain = simulate_gbm(70.0, 0.2, 60, 50_000)
+    
+    assert jumps.mean() == pytest.approx(70.0, rel=0.01)
+    assert np.quantile(jumps, 0.001) < np.quantile(plain, 0.001)
+
+
+def test_invalid_model_params():
+    """Test unknown and out-of-range parameters raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown parameter"):
+        simulate_process("gbm", 70.0, 0.3, 5, 10, params={"mean_reversion": 2})
+    with pytest.raises(ValueError):
+        simulate_process("ou", 70.0, 0.3, 5, 10, params={"mean_reversion": 0})
+
+
+def test_register_custom_process():
+    """Test a new model plugs into the engine through the registry."""
+    class Flat(PriceProcess):
+        name = "flat_test"
+        
+        def step(self, prices, shocks, rng, params):
+            pass
+    
+    register_process(Flat())
+    try:
+        np.testing.assert_array_equal(simulate_process("flat_test", 70.0, 0.3, 5, 10), 70.0)
+    finally:
+        PROCESSES.pop("flat_test")
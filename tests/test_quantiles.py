@@ -0,0 +1,60 @@
+"""
+Tests for batch quantile computation.
+"""
+
+import pytest
+import numpy as np
+
+from utils.quantiles import batch_quantiles, parse_percentiles, quantile_summary, row_quantiles
+
+
+def test_batch_quantiles_match_numpy():
+    """Test one-partition quantiles match np.quantile."""
+    data = np.random.default_rng(2).normal(70, 5, 10_001)
+    probs = [0.0, 0.01, 0.025, 0.16, 0.5, 0.84, 0.975, 1.0]
+    
+    np.testing.assert_allclose(batch_quantiles(data, probs), np.quantile(data, probs))
+
+
+def test_row_quantiles_match_numpy():
+    """Test per-row quantiles from one partition equal np.quantile along axis 1."""
+    values = np.random.default_rng(1).normal(size=(6, 501))
+    probs = [0.025, 0.16, 0.5, 0.84, 0.975]
+    
+    np.testing.assert_allclose(row_quantiles(values, probs), np.quantile(values, probs, axis=1).T)
+
+
+def test_quantile_summary_tail_means():
+    """Test tail means equal the average of the smallest ceil(p * n) values."""
+    data = np.arange(1.0, 101.0)
+    np.random.default_rng(0).shuffle(data)
+    
+    quantiles, tails = quantile_summary(data, [0.05], [0.05, 0.01, 0.001])
+    
+    assert quantiles[0] == pytest.approx(np.quantile(data, 0.05))
+    np.testing.assert_allclose(tails, [3.0, 1.0, 1.0])
+
+
+def test_quantile_summary_does_not_modify_input():
+    """Test the caller's array is left untouched."""
+    data = np.array([3.0, 1.0, 2.0])
+    quantile_summary(data, [0.5], [0.5])
+    
+    np.testing.assert_array_equal(data, [3.0, 1.0, 2.0])
+
+
+def test_quantile_summary_invalid():
+    """Test empty data and out-of-range probabilities raise ValueError."""
+    with pytest.raises(ValueError):
+        quantile_summary(np.empty(0), [0.5])
+    with pytest.raises(ValueError):
+        quantile_summary(np.ones(3), [1.5])
+
+
+def test_parse_percentiles():
+    """Test percentile list parsing."""
+    assert parse_percentiles("1, 5,99.5%") == pytest.approx([0.01, 0.05, 0.995])
+    with pytest.raises(ValueError):
+        parse_percentiles("101")
+    with pytest.raises(ValueError):
+        parse_percentiles("p95")
@@ -0,0 +1,216 @@
+"""
+Tests for registry module.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tools.registry import ToolRegistrar, ToolSpec, register_module, wrap_tool
+
+
+def test_tool_spec_validation():
+    """Test unknown cost classes and non-positive limits are rejected."""
+    with pytest.raises(ValueError):
+        ToolSpec("x", cost_class="gpu")
+    with pytest.raises(ValueError):
+        ToolSpec("x", max_concurrency=0)
+
+
+def test_cacheable_tool_reuses_response():
+    """Test identical arguments hit the response cache; others do not."""
+    calls = []
+    
+    def lookup(term: str) -> str:
+        calls.append(term)
+        return f"result {term} {len(calls)}"
+    
+    wrapped = wrap_tool(lookup, ToolSpec("lookup", cacheable=True))
+    
+    assert asyncio.run(wrapped(term="wti")) == "result wti 1"
+    assert asyncio.run(wrapped(term="wti")) == "result wti 1"
+    assert asyncio.run(wrapped(term="brent")) == "result brent 2"
+    assert wrapped.__name__ == "lookup"
+    assert wrapped.tool_spec.cacheable
+
+
+def test_tool_timeout_returns_error():
+    """Test an io tool that overruns its timeout returns an error message."""
+    release = threading.Event()
+    
+    def slow() -> str:
+        release.wait(5)
+        return "done"
+    
+    wrapped = wrap_tool(slow, ToolSpec("slow", cost_class="io", timeout=0.05))
+    try:
+        result = asyncio.run(wrapped())
+    finally:
+        release.set()
+    
+    assert "Error" in result
+    assert "did not finish" in result
+
+
+def test_pooled_tools_do_not_block_event_loop():
+    """Test io calls awaited together run on the pool concurrently."""
+    def slow() -> str:
+        time.sleep(0.2)
+        return "done"
+    
+    wrapped = wrap_tool(slow, ToolSpec("pooled", cost_class="io"))
+    
+    async def run_both():
+        return await asyncio.gather(wrapped(), wrapped())
+    
+    start = time.perf_counter()
+    results = asyncio.run(run_both())
+    
+    assert results == ["done", "done"]
+    assert time.perf_counter() - start < 0.35
+
+
+def test_calls_beyond_limit_queue_for_a_slot():
+    """Test calls beyond max_concurrency wait for a slot instead of failing."""
+    active = []
+    peak = []
+    lock = threading.Lock()
+    
+    def work() -> str:
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+        return "done"
+    
+    wrapped = wrap_tool(work, ToolSpec("queued", cost_class="io", max_concurrency=2))
+    
+    async def run_many():
+        return await asyncio.gather(*(wrapped() for _ in range(6)))
+    
+    assert asyncio.run(run_many()) == ["done"] * 6
+    assert max(peak) == 2
+
+
+def test_slot_wait_is_bounded():
+    """Test a call that cannot get a slot within timeout reports busy."""
+    release = threading.Event()
+    
+    def slow() -> str:
+        release.wait(5)
+        return "done"
+    
+    wrapped = wrap_tool(slow, ToolSpec("held", cost_class="io", timeout=0.1, max_concurrency=1))
+    
+    async def run_two():
+        first = asyncio.ensure_future(wrapped())
+        await asyncio.sleep(0.01)
+        second = await wrapped()
+        release.set()
+        return await first, second
+    
+    first, second = asyncio.run(run_two())
+    
+    # The first call timed out but keeps its slot, so the second never starts
+    assert "did not finish" in first
+    assert "busy" in second
+
+
+def test_timeout_starts_when_work_starts():
+    """Test calls queued in a shared pool are not timed out while waiting."""
+    def work() -> str:
+        time.sleep(0.15)
+        return "done"
+    
+    # Two compute tools share the 2-thread pool, so two of the four calls
+    # wait ~0.15s for a worker, then run for 0.15s: over the 0.25s timeout
+    # in total, but within it once started
+    first = wrap_tool(work, ToolSpec("compute_a", cost_class="compute", timeout=0.25))
+    second = wrap_tool(work, ToolSpec("compute_b", cost_class="compute", timeout=0.25))
+    
+    async def run_many():
+        return await asyncio.gather(first(), first(), second(), second())
+    
+    assert asyncio.run(run_many()) == ["done"] * 4
+
+
+def test_register_module_records_specs():
+    """Test the registrar wraps tools and falls back to a default spec."""
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    
+    def register(server):
+        @server.tool()
+        def priced(x: int) -> str:
+            return str(x)
+        
+        @server.tool()
+        def unlisted() -> str:
+            return "ok"
+    
+    registered = register_module(mcp, register, [ToolSpec("priced", cost_class="compute")])
+    
+    assert set(registered) == {"priced", "unlisted"}
+    assert registered["unlisted"].cost_class == "light"
+    assert asyncio.run(tool_functions["priced"](x=3)) == "3"
+    assert tool_functions["priced"].tool_spec.cost_class == "compute"
+
+
+def test_register_all_tools_counts_from_specs():
+    """Test every module's TOOL_SPECS matches the tools it registers."""
+    from unittest.mock import MagicMock
+    import tools
+    from tools.registry import TOOL_REGISTRY
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    tools.register_all_tools(mcp)
+    
+    declared = {spec.name for _, _, specs in tools.TOOL_MODULES for spec in specs}
+    assert declared == set(tool_functions)
+    assert declared <= set(TOOL_REGISTRY)
+
+
+def test_responses_carry_distinct_trace_ids():
+    """Test every call, cached or not, ends with its own trace ID while exporting."""
+    import re
+    from utils.tracing import InMemorySpanExporter, SimpleSpanProcessor, set_span_processor
+    
+    wrapped = wrap_tool(lambda term: f"result {term}", ToolSpec("traced", cacheable=True))
+    set_span_processor(SimpleSpanProcessor(InMemorySpanExporter()))
+    try:
+        first, second = asyncio.run(wrapped(term="wti")), asyncio.run(wrapped(term="wti"))
+    finally:
+        set_span_processor(None)
+    
+    ids = [re.search(r"<!-- trace_id: ([0-9a-f]{32}) -->$", r).group(1) for r in (first, second)]
+    assert ids[0] != ids[1]
+
+
+def test_responses_unchanged_without_exporter():
+    """Test no trace footer is added when spans are not exported."""
+    wrapped = wrap_tool(lambda: "❌ **Error**: bad input", ToolSpec("plain"))
+    
+    assert asyncio.run(wrapped()) == "❌ **Error**: bad input"
@@ -0,0 +1,52 @@
+"""
+Tests for the EIA release calendar.
+"""
+
+import datetime
+
+from utils.release_calendar import EASTERN, RELEASE_SCHEDULES, schedule_for_path
+
+
+def _et(*args):
+    return datetime.datetime(*args, tzinfo=EASTERN)
+
+
+def test_weekly_release_boundaries():
+    """Test the WPSR rolls over exactly at Wednesday 10:30 ET."""
+    wpsr = RELEASE_SCHEDULES["wpsr"]
+
+    assert wpsr.last_release(_et(2025, 10, 15, 10, 29)) == _et(2025, 10, 8, 10, 30)
+    assert wpsr.last_release(_et(2025, 10, 15, 10, 30)) == _et(2025, 10, 15, 10, 30)
+    assert wpsr.next_release(_et(2025, 10, 15, 10, 30)) == _et(2025, 10, 22, 10, 30)
+    assert wpsr.next_release(_et(2025, 10, 13, 9, 0)) == _et(2025, 10, 15, 10, 30)
+
+
+def test_weekly_release_converts_timezones():
+    """Test UTC times are compared in Eastern time."""
+    wngsr = RELEASE_SCHEDULES["wngsr"]
+    utc = datetime.datetime(2025, 10, 16, 14, 31, tzinfo=datetime.timezone.utc)
+
+    assert wngsr.last_release(utc) == _et(2025, 10, 16, 10, 30)
+
+
+def test_monthly_releases():
+    """Test STEO (first Tuesday on/after the 6th) and PSM (last business day)."""
+    steo = RELEASE_SCHEDULES["steo"]
+    psm = RELEASE_SCHEDULES["psm"]
+
+    assert steo.last_release(_et(2025, 10, 7, 11, 59)) == _et(2025, 9, 9, 12, 0)
+    assert steo.next_release(_et(2025, 10, 7, 11, 59)) == _et(2025, 10, 7, 12, 0)
+    assert steo.next_release(_et(2025, 12, 10)) == _et(2026, 1, 6, 12, 0)
+    assert psm.last_release(_et(2025, 11, 15)) == _et(2025, 10, 31, 10, 0)
+    assert psm.next_release(_et(2025, 11, 15)).date() == datetime.date(2025, 11, 28)
+
+
+def test_schedule_for_path():
+    """Test paths map to schedules by longest prefix."""
+    assert schedule_for_path("petroleum/pri/spt").key == "wpsr"
+    assert schedule_for_path("/natural-gas/stor/wkly/data").key == "wngsr"
+    assert schedule_for_path("petroleum/sum/sndw").key == "wpsr"
+    assert schedule_for_path("petroleum/sum/snd").key == "psm"
+    assert schedule_for_path("steo").key == "steo"
+    assert schedule_for_path("electricity/retail-sales") is None
+    assert schedule_for_path(None) is None
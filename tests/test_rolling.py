@@ -0,0 +1,79 @@
+"""
+Tests for the rolling-window analytics engine.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from utils.rolling import EXPANDING, RollingEngine, parse_windows
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(3)
+    return 70.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, 500)))
+
+
+def test_rolling_mean_and_std_match_pandas(prices):
+    """Test prefix-sum mean/std match pandas rolling windows."""
+    engine = RollingEngine(prices)
+    series = pd.Series(prices)
+    
+    np.testing.assert_allclose(engine.mean(20), series.rolling(20).mean(), rtol=1e-9)
+    np.testing.assert_allclose(engine.std(20), series.rolling(20).std(), rtol=1e-7)
+    np.testing.assert_allclose(engine.mean(EXPANDING), series.expanding().mean(), rtol=1e-9)
+
+
+def test_rolling_volatility_matches_pandas(prices):
+    """Test rolling volatility uses N - 1 returns for an N-observation window."""
+    engine = RollingEngine(prices)
+    expected = np.log(pd.Series(prices)).diff().rolling(19).std() * np.sqrt(252)
+    
+    np.testing.assert_allclose(engine.volatility(20), expected, rtol=1e-7)
+
+
+def test_rolling_quantiles_match_pandas(prices):
+    """Test sorted-window quantiles match pandas linear interpolation."""
+    engine = RollingEngine(prices)
+    result = engine.quantiles(30, (0.05, 0.5, 0.95))
+    series = pd.Series(prices)
+    
+    np.testing.assert_allclose(result[:, 0], series.rolling(30).quantile(0.05))
+    np.testing.assert_allclose(result[:, 1], series.rolling(30).median())
+
+
+def test_drawdown():
+    """Test expanding and rolling drawdown from peak."""
+    engine = RollingEngine([100.0, 120.0, 90.0, 110.0, 80.0])
+    
+    np.testing.assert_allclose(engine.drawdown(), [0.0, 0.0, -0.25, -1 / 12, -1 / 3])
+    np.testing.assert_allclose(engine.drawdown(2)[1:], [0.0, -0.25, 0.0, -3 / 11])
+
+
+def test_compute_multiple_windows(prices):
+    """Test compute returns every (metric, window) pair."""
+    results = RollingEngine(prices).compute([20, 60, EXPANDING], ["mean", "zscore"])
+    
+    assert set(results) == {
+        (m, w) for m in ("mean", "zscore") for w in (20, 60, EXPANDING)
+    }
+    assert np.isnan(results[("mean", 60)][58])
+    assert not np.isnan(results[("mean", 60)][59])
+
+
+def test_compute_invalid_inputs(prices):
+    """Test invalid metrics and windows raise ValueError."""
+    engine = RollingEngine(prices)
+    
+    with pytest.raises(ValueError):
+        engine.compute([20], ["skew"])
+    with pytest.raises(ValueError):
+        engine.compute([1], ["mean"])
+
+
+def test_parse_windows():
+    """Test window list parsing."""
+    assert parse_windows("20, 60,expanding") == [20, 60, EXPANDING]
+    with pytest.raises(ValueError):
+        parse_windows("twenty")
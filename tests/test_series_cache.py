@@ -0,0 +1,202 @@
+"""
+Tests for the EIA series cache.
+"""
+
+import time
+
+import pytest
+import numpy as np
+from unittest.mock import Mock
+
+from utils.release_calendar import RELEASE_SCHEDULES
+from utils.series_cache import CachedSeries, SeriesCache, records_to_series
+
+
+def _mock_client(records):
+    """Create a mock EIA client returning the given records."""
+    client = Mock()
+    client.query.return_value = {"response": {"data": records}}
+    return client
+
+
+def test_records_to_series_sorts_and_coerces():
+    """Test EIA records are sorted oldest first and values coerced to float."""
+    records = [
+        {"period": "2025-10-03", "value": "61.88"},
+        {"period": "2025-10-01", "value": 62.37},
+        {"period": "2025-10-02", "value": None},
+    ]
+    series = records_to_series("RWTC", "daily", records)
+    
+    assert list(series.periods) == ["2025-10-01", "2025-10-03"]
+    assert series.values.dtype == np.float64
+    assert series.latest == pytest.approx(61.88)
+    assert not series.values.flags.writeable
+
+
+def test_cache_fetches_once():
+    """Test repeated gets are served from memory."""
+    client = _mock_client([{"period": "2025-10-01", "value": 62.0}])
+    cache = SeriesCache(client=client)
+    
+    first = cache.get("rwtc")
+    second = cache.get("RWTC")
+    
+    assert first is second
+    assert client.query.call_count == 1
+    kwargs = client.query.call_args.kwargs
+    assert kwargs["path"] == "petroleum/pri/spt"
+    assert kwargs["facets"] == {"series": ["RWTC"]}
+    assert kwargs["frequency"] == "daily"
+
+
+def test_cache_refetches_after_ttl():
+    """Test stale entries from paths without a release schedule are refetched."""
+    client = _mock_client([{"period": "2025-10", "value": 62.0}])
+    cache = SeriesCache(client=client, ttl_seconds=0)
+    
+    cache.get("ELEC.SALES", path="electricity/retail-sales")
+    cache.get("ELEC.SALES", path="electricity/retail-sales")
+    
+    assert client.query.call_count == 2
+
+
+def test_cache_put_and_invalidate():
+    """Test manual insertion and invalidation."""
+    client = _mock_client([{"period": "2025-10-01", "value": 62.0}])
+    cache = SeriesCache(client=client)
+    cache.put(CachedSeries("RWTC", "daily", ["2025-09-30"], [60.0]))
+    
+    assert cache.get("RWTC").latest == 60.0
+    assert client.query.call_count == 0
+    
+    cache.invalidate("RWTC")
+    assert cache.get("RWTC").latest == 62.0
+
+
+def test_cache_unknown_series_requires_path():
+    """Test unknown series without a path raise ValueError."""
+    cache = SeriesCache(client=_mock_client([]))
+    
+    with pytest.raises(ValueError) as exc_info:
+        cache.get("NOTASERIES")
+    
+    assert "Unknown series" in str(exc_info.value)
+
+
+def test_cache_missing_api_key():
+    """Test fetching without an API key raises ValueError."""
+    cache = SeriesCache(api_key=None)
+    
+    with pytest.raises(ValueError) as exc_info:
+        cache.get("RWTC")
+    
+    assert "EIA_API_KEY" in str(exc_info.value)
+
+
+def test_cached_series_returns_computed_once():
+    """Test log-returns are precomputed lazily, read-only and reused."""
+    series = CachedSeries("RWTC", "daily", ["a", "b", "c"], [70.0, 77.0, 70.0])
+    
+    returns = series.returns
+    
+    np.testing.assert_allclose(returns, [np.log(1.1), -np.log(1.1)])
+    assert not returns.flags.writeable
+    assert series.returns is returns
+
+
+def test_get_many_fetches_only_missing_series():
+    """Test cached series are reused and missing ones fetched once each."""
+    client = _mock_client([{"period": "2025-10-01", "value": 62.0}])
+    cache = SeriesCache(client=client)
+    cache.put(CachedSeries("RWTC", "daily", ["2025-10-01"], [61.0]))
+    
+    result = cache.get_many(["rwtc", "RBRTE", "RNGWHHD", "RBRTE"])
+    
+    assert list(result) == ["RWTC", "RBRTE", "RNGWHHD"]
+    assert result["RWTC"].latest == 61.0
+    assert client.query.call_count == 2
+
+
+def test_concurrent_gets_share_one_fetch():
+    """Test simultaneous misses for one series trigger a single EIA request."""
+    import threading
+    import time
+    
+    def slow_query(**kwargs):
+        time.sleep(0.05)
+        return {"response": {"data": [{"period": "2025-10-01", "value": 62.0}]}}
+    
+    client = Mock()
+    client.query.side_effect = slow_query
+    cache = SeriesCache(client=client)
+    threads = [threading.Thread(target=cache.get, args=("RWTC",)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert client.query.call_count == 1
+
+
+def _released_series(latest_value, hours_before_release=1):
+    """Cached RWTC series fetched some hours before the latest WPSR release."""
+    release = RELEASE_SCHEDULES["wpsr"].last_release().timestamp()
+    return CachedSeries(
+        "RWTC", "daily", ["2025-09-30", "2025-10-01"], [60.0, latest_value],
+        fetched_at=release - hours_before_release * 3600, path="petroleum/pri/spt",
+    )
+
+
+def test_scheduled_series_kept_until_next_release():
+    """Test a series fetched after the latest release is served without any request."""
+    client = _mock_client([{"period": "2025-10-02", "value": 63.0}])
+    cache = SeriesCache(client=client, ttl_seconds=0)
+    cache.put(_released_series(62.0, hours_before_release=-1))
+    
+    assert cache.get("RWTC").latest == 62.0
+    assert client.query.call_count == 0
+
+
+def test_release_probe_keeps_unchanged_series():
+    """Test an unchanged one-row probe revalidates the cached copy."""
+    client = _mock_client([{"period": "2025-10-01", "value": "62.0"}])
+    cache = SeriesCache(client=client)
+    cached = _released_series(62.0)
+    cache.put(cached)
+    
+    assert cache.get("RWTC") is cached
+    assert cache.get("RWTC") is cached
+    assert client.query.call_count == 1
+    assert client.query.call_args.kwargs["limit"] == 1
+    assert cache.awaiting_release(cached) == (time.time() - cached.fetched_at < 25 * 3600)
+
+
+def test_release_probe_refetches_changed_series():
+    """Test a probe that sees a new period triggers a full refetch."""
+    client = _mock_client([{"period": "2025-10-02", "value": 63.0}])
+    cache = SeriesCache(client=client)
+    cache.put(_released_series(62.0))
+    
+    series = cache.get("RWTC")
+    
+    assert series.latest == 63.0
+    assert series.path == "petroleum/pri/spt"
+    assert [c.kwargs["limit"] for c in client.query.call_args_list] == [1, SeriesCache.FETCH_LIMIT]
+    assert not cache.awaiting_release(series)
+
+
+def test_release_probe_network_error_serves_cached_copy():
+    """Test a failed probe serves the cached copy and probes again next call."""
+    import requests
+    
+    client = Mock()
+    client.query.side_effect = requests.ConnectionError("EIA unreachable")
+    cache = SeriesCache(client=client)
+    cached = _released_series(62.0)
+    cache.put(cached)
+    
+    assert cache.get("RWTC") is cached
+    assert cache.get("RWTC") is cached
+    assert client.query.call_count == 2
+    assert all(c.kwargs["limit"] == 1 for c in client.query.call_args_list)
@@ -0,0 +1,166 @@
+"""
+Tests for the vectorized Monte Carlo simulator.
+"""
+
+import pytest
+import numpy as np
+
+from utils.simulation import TerminalPriceCache, simulate_gbm
+
+
+def test_simulate_gbm_matches_scalar_loop():
+    """Test vectorized paths reproduce the original per-step loop exactly."""
+    rng = np.random.RandomState(42)
+    expected = []
+    for _ in range(50):
+        price = 70.0
+        for _ in range(10):
+            price *= 1 + rng.normal(0.0005, 0.25 / np.sqrt(252))
+        expected.append(price)
+    
+    np.testing.assert_allclose(simulate_gbm(70.0, 0.25, 10, 50, 0.0005), expected)
+
+
+def test_simulate_gbm_chunking_is_seamless(monkeypatch):
+    """Test results do not depend on the path chunk size."""
+    from utils import simulation
+    
+    full = simulate_gbm(70.0, 0.3, 5, 1000)
+    monkeypatch.setattr(simulation, "PATH_CHUNK_ROWS", 64)
+    
+    np.testing.assert_array_equal(simulate_gbm(70.0, 0.3, 5, 1000), full)
+
+
+def test_simulate_gbm_invalid():
+    """Test invalid parameters raise ValueError."""
+    with pytest.raises(ValueError):
+        simulate_gbm(70.0, 0.3, 0, 10)
+    with pytest.raises(ValueError):
+        simulate_gbm(70.0, -0.3, 5, 10)
+
+
+def test_terminal_price_cache_reuses_distribution():
+    """Test identical inputs hit the cache and return a read-only array."""
+    cache = TerminalPriceCache(max_entries=2)
+    first = cache.get("gbm", 70.0, 0.3, 5, 100)
+    second = cache.get("gbm", 70.0, 0.3, 5, 100)
+    
+    assert first is second
+    assert cache.hits == 1
+    assert not first.flags.writeable
+    
+    cache.get("gbm", 71.0, 0.3, 5, 100)
+    cache.get("gbm", 72.0, 0.3, 5, 100)
+    assert cache.get("gbm", 70.0, 0.3, 5, 100) is not first
+
+
+def test_shock_pool_reused_across_sweep():
+    """Test a volatility sweep draws shocks once and rescales them."""
+    from utils.simulation import shock_pool
+    
+    shock_pool.clear()
+    misses = shock_pool.misses
+    results = [simulate_gbm(70.0, vol, 20, 500, seed=7) for vol in (0.1, 0.2, 0.3, 0.4)]
+    
+    assert shock_pool.misses == misses + 1
+    spreads = [r.std() for r in results]
+    assert spreads == sorted(spreads)
+
+
+def test_shock_pool_eviction_and_oversize():
+    """Test the pool stays within its byte budget and skips oversized matrices."""
+    from utils.simulation import ShockPool
+    
+    pool = ShockPool(max_bytes=100 * 10 * 8 * 2)
+    pool.get(1, 10, 100)
+    pool.get(2, 10, 100)
+    pool.get(3, 10, 100)
+    
+    assert pool.nbytes <= pool.max_bytes
+    assert pool.get(4, 10, 1000) is None
+
+
+def test_unpooled_shocks_match_pooled(monkeypatch):
+    """Test block-drawn shocks reproduce the pooled matrix exactly."""
+    from utils import simulation
+    
+    pooled = simulate_gbm(70.0, 0.3, 5, 300, seed=3)
+    monkeypatch.setattr(simulation, "shock_pool", simulation.ShockPool(max_bytes=0))
+    monkeypatch.setattr(simulation, "PATH_CHUNK_ROWS", 64)
+    
+    np.testing.assert_array_equal(simulate_gbm(70.0, 0.3, 5, 300, seed=3), pooled)
+
+
+def test_gbm_grid_matches_individual_runs():
+    """Test each grid row equals a standalone simulation with the same seed."""
+    from utils.simulation import simulate_gbm_grid
+    
+    grid = simulate_gbm_grid(70.0, [0.2, 0.4], [0.0, 0.001], 15, 800, seed=9)
+    
+    assert grid.shape == (4, 800)
+    np.testing.assert_allclose(grid[1], simulate_gbm(70.0, 0.2, 15, 800, 0.001, seed=9))
+    np.testing.assert_allclose(grid[2], simulate_gbm(70.0, 0.4, 15, 800, 0.0, seed=9))
+
+
+def test_gbm_grid_horizons_share_paths():
+    """Test several horizons are prefixes of the paths to the longest one."""
+    from utils.simulation import simulate_gbm_grid
+    
+    grid = simulate_gbm_grid(70.0, [0.2, 0.4], [0.0], [5, 15], 400, seed=9)
+    
+    assert grid.shape == (2, 2, 400)
+    np.testing.assert_allclose(grid[1], simulate_gbm_grid(70.0, [0.2, 0.4], [0.0], 15, 400, seed=9))
+    assert not np.allclose(grid[0], grid[1])
+
+
+def test_analytic_quantiles_close_to_simulation():
+    """Test the lognormal approximation tracks simulated quantiles."""
+    from utils.simulation import analytic_gbm_quantiles
+    
+    means, quantiles = analytic_gbm_quantiles(70.0, [0.3], [0.0], 30, [0.025, 0.5, 0.975])
+    simulated = simulate_gbm(70.0, 0.3, 30, 20_000)
+    
+    assert means[0] == pytest.approx(70.0)
+    np.testing.assert_allclose(
+        quantiles[0], np.quantile(simulated, [0.025, 0.5, 0.975]), rtol=0.01
+    )
+
+
+def test_bootstrap_matches_explicit_resampling():
+    """Test block sums reproduce concatenating the sampled return blocks."""
+    from utils.simulation import simulate_bootstrap
+    
+    returns = np.random.default_rng(5).normal(0, 0.02, 300)
+    terminal = simulate_bootstrap(70.0, returns, 12, 50, block_size=5, drift=None, seed=1)
+    
+    rng = np.random.default_rng(1)
+    picks = rng.integers(0, 296, size=(50, 2))
+    last = rng.integers(0, 296, size=50)
+    expected = [
+        70.0 * np.exp(sum(returns[p:p + 5].sum() for p in row) + returns[q:q + 2].sum())
+        for row, q in zip(picks, last)
+    ]
+    np.testing.assert_allclose(terminal, expected)
+
+
+def test_bootstrap_keeps_fat_tails_and_drift():
+    """Test resampled fat-tailed returns give wider tails than GBM at equal volatility."""
+    from utils.simulation import simulate_bootstrap
+    
+    returns = np.random.default_rng(2).standard_t(3, 5000) * 0.01
+    vol = returns.std() * np.sqrt(252)
+    boot = simulate_bootstrap(70.0, returns, 1, 200_000, block_size=1)
+    gbm = simulate_gbm(70.0, vol, 1, 200_000)
+    
+    assert boot.mean() == pytest.approx(70.0, rel=1e-3)
+    assert np.quantile(boot, 0.001) < np.quantile(gbm, 0.001)
+
+
+def test_bootstrap_invalid():
+    """Test too little history and bad block sizes raise ValueError."""
+    from utils.simulation import simulate_bootstrap
+    
+    with pytest.raises(ValueError):
+        simulate_bootstrap(70.0, np.zeros(3), 10, 10, block_size=5)
+    with pytest.raises(ValueError):
+        simulate_bootstrap(70.0, np.zeros(30), 10, 10, block_size=0)
@@ -0,0 +1,79 @@
+"""
+Tests for the materialized market snapshot.
+"""
+
+import datetime
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from utils.series_cache import CachedSeries, SeriesCache
+from utils.snapshot import EASTERN, SnapshotStore, next_refresh, snapshot_row
+
+
+def _daily_series(series_id, prices, end="2025-10-17"):
+    """Business-day series ending on `end`."""
+    periods = pd.bdate_range(end=end, periods=len(prices)).strftime("%Y-%m-%d").to_numpy()
+    return CachedSeries(series_id, "daily", periods, prices)
+
+
+def test_snapshot_row_changes_use_calendar_days():
+    """Test WoW/MoM compare against the last price at least 7/30 days earlier."""
+    prices = np.arange(1.0, 61.0)
+    row = snapshot_row(_daily_series("RWTC", prices))
+    
+    # 5 business days back is exactly one week; 30 calendar days is 22 business days here
+    assert row.week_change == pytest.approx((60 / 55 - 1) * 100)
+    assert row.month_change == pytest.approx((60 / 38 - 1) * 100)
+    assert row.volatility > 0
+    assert row.period == "2025-10-17"
+
+
+def test_store_refresh_swaps_prerendered_snapshot():
+    """Test refresh builds a rendered snapshot from the cache and get() reuses it."""
+    cache = SeriesCache(api_key=None)
+    for series_id, level in (("RWTC", 70.0), ("RBRTE", 74.0), ("RNGWHHD", 3.2)):
+        cache.put(_daily_series(series_id, level + np.sin(np.arange(40))))
+    store = SnapshotStore(cache=cache)
+    
+    snapshot = store.refresh(force=False)
+    
+    assert store.get() is snapshot
+    assert "WTI Cushing Spot Price" in snapshot.rendered
+    assert "Henry Hub" in snapshot.rendered
+    assert snapshot.rendered.count("| 2025-10-17 |") == 3
+
+
+def test_next_refresh_follows_release_calendar():
+    """Test the scheduler targets the next Wednesday release plus grace."""
+    tuesday = datetime.datetime(2025, 10, 14, 12, 0, tzinfo=EASTERN)
+    during_grace = datetime.datetime(2025, 10, 15, 10, 32, tzinfo=EASTERN)
+    wednesday_late = datetime.datetime(2025, 10, 15, 11, 0, tzinfo=EASTERN)
+    
+    assert next_refresh(tuesday) == datetime.datetime(2025, 10, 15, 10, 35, tzinfo=EASTERN)
+    assert next_refresh(during_grace) == datetime.datetime(2025, 10, 15, 10, 35, tzinfo=EASTERN)
+    assert next_refresh(wednesday_late) == datetime.datetime(2025, 10, 22, 10, 35, tzinfo=EASTERN)
+
+
+def test_store_get_rebuilds_stale_snapshot():
+    """Test get() rebuilds once the next release has passed, keeping the old copy on failure."""
+    from utils.snapshot import MarketSnapshot
+    
+    cache = SeriesCache(api_key=None)
+    cache.put(_daily_series("RWTC", 70.0 + np.sin(np.arange(40))))
+    store = SnapshotStore(series_ids=("RWTC",), cache=cache)
+    week_old = datetime.datetime.now(EASTERN) - datetime.timedelta(days=8)
+    stale = MarketSnapshot([], built_at=week_old.timestamp())
+    store._snapshot = stale
+    
+    assert store.is_stale(stale)
+    rebuilt = store.get()
+    assert rebuilt is not stale
+    assert not store.is_stale(rebuilt)
+    assert store.get() is rebuilt
+    
+    # A stale snapshot is still served when the rebuild fails
+    store._snapshot = stale
+    cache.invalidate()
+    assert store.get() is stale
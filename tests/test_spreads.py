@@ -0,0 +1,61 @@
+"""
+Tests for spread alignment and calculation.
+"""
+
+import pytest
+import numpy as np
+
+from utils.series_cache import CachedSeries
+from utils.spreads import (
+    align_series,
+    compute_spread,
+    describe_legs,
+    parse_legs,
+    resolve_spread,
+)
+
+
+def test_align_series_inner_joins_on_period():
+    """Test only shared periods survive, sorted oldest first."""
+    wti = CachedSeries("RWTC", "daily", ["2025-01-03", "2025-01-01", "2025-01-02"], [3.0, 1.0, 2.0])
+    brent = CachedSeries("RBRTE", "daily", ["2025-01-02", "2025-01-03", "2025-01-04"], [12.0, 13.0, 14.0])
+    
+    frame = align_series([brent, wti])
+    
+    assert list(frame.index) == ["2025-01-02", "2025-01-03"]
+    np.testing.assert_array_equal(frame["RWTC"], [2.0, 3.0])
+    np.testing.assert_array_equal(frame["RBRTE"], [12.0, 13.0])
+
+
+def test_compute_crack_spread():
+    """Test the 3-2-1 crack converts product $/gal to $/bbl per crude barrel."""
+    definition = resolve_spread("321")
+    gas, ulsd, wti = (leg for leg, _ in definition["legs"])
+    frame = align_series([
+        CachedSeries(gas, "daily", ["d1"], [2.0]),
+        CachedSeries(ulsd, "daily", ["d1"], [2.5]),
+        CachedSeries(wti, "daily", ["d1"], [70.0]),
+    ])
+    
+    spread = compute_spread(frame, definition["legs"], definition["divisor"])
+    
+    assert spread.iloc[0] == pytest.approx((2 * 2.0 * 42 + 2.5 * 42 - 3 * 70.0) / 3)
+
+
+def test_parse_legs_and_describe():
+    """Test custom legs parse and render as a formula."""
+    legs = parse_legs("rbrte:1, RWTC:-1")
+    
+    assert legs == [("RBRTE", 1.0), ("RWTC", -1.0)]
+    assert describe_legs(legs) == "RBRTE − RWTC"
+    assert describe_legs([("A", 2.0), ("B", -3.0)], 3.0) == "(2×A − 3×B) / 3"
+
+
+def test_invalid_spreads():
+    """Test unknown names and malformed legs raise ValueError."""
+    with pytest.raises(ValueError):
+        resolve_spread("jet crack")
+    with pytest.raises(ValueError):
+        parse_legs("RBRTE:one,RWTC:-1")
+    with pytest.raises(ValueError):
+        parse_legs("RBRTE:1")
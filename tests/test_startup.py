@@ -0,0 +1,22 @@
+"""
+Tests for startup module.
+"""
+
+from utils.startup import parse_importtime
+
+
+def test_parse_importtime():
+    """Test importtime lines parse to module, timings and nesting depth."""
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     utils.contracts\n"
+        "import time:      1500 |       1620 |   tools.analysis_tools\n"
+        "import time:       900 |       2520 | tools\n"
+        "WARNING:root:unrelated log line\n"
+    )
+    
+    assert parse_importtime(stderr) == [
+        ("utils.contracts", 120, 120, 2),
+        ("tools.analysis_tools", 1500, 1620, 1),
+        ("tools", 900, 2520, 0),
+    ]
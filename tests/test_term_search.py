@@ -0,0 +1,59 @@
+"""
+Tests for the glossary search index.
+"""
+
+from utils.term_search import TermIndex, edit_distance, trigrams
+
+
+GLOSSARY = {
+    "contango": {"full_name": "Contango", "definition": "Futures above spot; rewards storage."},
+    "crack spread": {
+        "full_name": "Crack Spread",
+        "definition": "Refined product prices minus crude.",
+        "aliases": ["3-2-1", "crack"],
+    },
+    "henry hub": {"full_name": "Henry Hub", "definition": "Louisiana gas hub.", "aliases": ["hh", "ng"]},
+}
+
+
+def test_trigrams_ignore_punctuation_and_pad_short_terms():
+    """Test "3-2-1" and "321" share trigrams and two-letter terms produce trigrams."""
+    assert trigrams("3-2-1") == trigrams("321")
+    assert trigrams("CL") == {"  c", " cl", "cl "}
+
+
+def test_edit_distance_counts_transpositions_once():
+    """Test adjacent transpositions cost 1."""
+    assert edit_distance("contnago", "contango") == 1
+    assert edit_distance("nymx", "nymex") == 1
+    assert edit_distance("", "abc") == 3
+
+
+def test_lookup_exact_keys_names_and_aliases():
+    """Test exact lookup is case-insensitive across keys, full names and aliases."""
+    index = TermIndex(GLOSSARY)
+
+    assert index.lookup("HH") == "henry hub"
+    assert index.lookup("  Crack   Spread ") == "crack spread"
+    assert index.lookup("3-2-1") == "crack spread"
+    assert index.lookup("contnago") is None
+
+
+def test_search_ranks_typos_first():
+    """Test misspellings rank their term first with a high score."""
+    index = TermIndex(GLOSSARY)
+
+    for query, key in (("contnago", "contango"), ("crak sprd", "crack spread"), ("henryhub", "henry hub")):
+        matches = index.search(query)
+        assert matches[0].key == key
+        assert matches[0].score >= 0.6
+
+
+def test_search_uses_definitions_and_limits():
+    """Test definition words contribute matches and results are limited and deduplicated."""
+    index = TermIndex(GLOSSARY)
+
+    matches = index.search("storage", limit=2, min_score=0.5)
+    assert [m.key for m in matches] == ["contango"]
+    assert matches[0].matched == "storage"
+    assert index.search("xyzzy") == []
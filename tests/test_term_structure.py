@@ -0,0 +1,85 @@
+"""
+Tests for forward curve construction and caching.
+"""
+
+import datetime
+
+import pytest
+import numpy as np
+
+from utils.series_cache import CachedSeries
+from utils.term_structure import (
+    ForwardCurveCache,
+    build_forward_curve,
+    classify_structure,
+    steo_release,
+)
+
+
+def _steo_series(prices, first="2025-01"):
+    """Monthly STEO-style series starting at `first`."""
+    import pandas as pd
+    
+    periods = pd.period_range(first, periods=len(prices), freq="M").astype(str)
+    return CachedSeries("WTIPUUS", "monthly", np.asarray(periods), prices)
+
+
+def test_classify_structure():
+    """Test contango, backwardation, flat and mixed curves."""
+    assert classify_structure([0.5, 0.4, 0.3]) == "contango"
+    assert classify_structure([-0.5, -0.1]) == "backwardation"
+    assert classify_structure([0.01, -0.02]) == "flat"
+    assert classify_structure([0.5, -0.5]) == "mixed"
+    assert classify_structure([0.5, 0.0, 0.2]) == "contango"
+
+
+def test_build_forward_curve_starts_at_release():
+    """Test history before the release month is excluded and spreads are diffs."""
+    series = _steo_series(np.arange(60.0, 84.0))
+    
+    curve = build_forward_curve(series, release="2025-10", months=6)
+    
+    assert str(curve.curve.index[0]) == "2025-10"
+    assert len(curve) == 6
+    np.testing.assert_allclose(curve.spreads, 1.0)
+    assert curve.structure() == "contango"
+    assert curve.annualized_carry() > 0
+
+
+def test_build_forward_curve_invalid():
+    """Test short curves and non-monthly series raise ValueError."""
+    series = _steo_series([70.0, 71.0, 72.0])
+    
+    with pytest.raises(ValueError):
+        build_forward_curve(series, release="2025-03")
+    with pytest.raises(ValueError):
+        build_forward_curve(CachedSeries("RWTC", "daily", ["2025-01-01", "2025-01-02"], [1.0, 2.0]), "2025-01")
+
+
+def test_steo_release_rolls_on_first_tuesday_after_sixth():
+    """Test the release month switches on the publication Tuesday."""
+    # 2025-10-07 is the first Tuesday on or after the 6th
+    assert steo_release(datetime.date(2025, 10, 6)) == "2025-09"
+    assert steo_release(datetime.date(2025, 10, 7)) == "2025-10"
+    assert steo_release(datetime.date(2025, 1, 2)) == "2024-12"
+
+
+def test_forward_curve_cache_per_release():
+    """Test curves are reused within a release and rebuilt after the next one."""
+    release = {"value": "2025-03"}
+    cache = ForwardCurveCache(release_fn=lambda: release["value"])
+    loads = []
+    
+    def load(series_id):
+        loads.append(series_id)
+        return _steo_series(np.linspace(70.0, 60.0, 24))
+    
+    first = cache.get("WTIPUUS", load)
+    assert cache.get("WTIPUUS", load) is first
+    assert len(loads) == 1
+    assert first.structure() == "backwardation"
+    
+    release["value"] = "2025-04"
+    second = cache.get("WTIPUUS", load)
+    assert len(loads) == 2
+    assert str(second.curve.index[0]) == "2025-04"
@@ -0,0 +1,125 @@
+"""
+Tests for tracing module.
+"""
+
+import io
+import json
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+
+from utils.eia_client import EIAClient
+from utils.logging import TraceContextFilter
+from utils.tracing import (
+    BatchSpanProcessor,
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    SimpleSpanProcessor,
+    configure_tracing,
+    current_trace_id,
+    get_tracer,
+    set_span_processor,
+)
+
+
+tracer = get_tracer(__name__)
+
+
+@pytest.fixture
+def exporter():
+    """Collect finished spans in memory for the duration of a test."""
+    exporter = InMemorySpanExporter()
+    set_span_processor(SimpleSpanProcessor(exporter))
+    yield exporter
+    set_span_processor(None)
+
+
+def test_child_spans_share_trace_and_link_to_parent(exporter):
+    """Test nested spans join the enclosing trace and restore context on exit."""
+    with tracer.start_as_current_span("tool.example") as root:
+        with tracer.start_as_current_span("eia.query", {"eia.path": "steo"}) as child:
+            assert current_trace_id() == root.trace_id
+
+    assert current_trace_id() is None
+    assert [span.name for span in exporter.spans] == ["eia.query", "tool.example"]
+    assert child.trace_id == root.trace_id
+    assert child.parent_id == root.span_id
+    assert root.parent_id is None
+    assert child.attributes["eia.path"] == "steo"
+    assert child.duration_ms >= 0
+
+
+def test_separate_calls_get_separate_traces(exporter):
+    """Test each root span starts a new trace."""
+    with tracer.start_as_current_span("first") as first:
+        pass
+    with tracer.start_as_current_span("second") as second:
+        pass
+
+    assert first.trace_id != second.trace_id
+    assert len(first.trace_id) == 32
+    assert len(first.span_id) == 16
+
+
+def test_exception_marks_span_error(exporter):
+    """Test an escaping exception is recorded on the span and re-raised."""
+    with pytest.raises(ValueError):
+        with tracer.start_as_current_span("format_response"):
+            raise ValueError("bad column")
+
+    span = exporter.spans[0]
+    assert span.status == "ERROR"
+    assert span.events[0]["attributes"]["exception.type"] == "ValueError"
+    assert span.events[0]["attributes"]["exception.message"] == "bad column"
+
+
+def test_batch_processor_writes_json_lines():
+    """Test the background exporter flushes queued spans on shutdown."""
+    stream = io.StringIO()
+    processor = BatchSpanProcessor(JsonLinesSpanExporter(stream=stream))
+    set_span_processor(processor)
+    try:
+        with tracer.start_as_current_span("tool.example", {"tool.name": "example"}):
+            pass
+    finally:
+        set_span_processor(None)
+
+    entry = json.loads(stream.getvalue().splitlines()[0])
+    assert entry["name"] == "tool.example"
+    assert entry["attributes"]["tool.name"] == "example"
+    assert entry["status"]["code"] == "UNSET"
+
+
+def test_configure_tracing_rejects_unknown_exporter():
+    """Test an unknown TRACE_EXPORTER is an error, not silently ignored."""
+    with pytest.raises(ValueError, match="Unknown TRACE_EXPORTER"):
+        configure_tracing("zipkin")
+
+
+@patch('requests.Session.get')
+def test_eia_query_spans(mock_get, exporter):
+    """Test EIAClient.query emits HTTP and decode spans under one query span."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"response": {"data": [{"period": "2025-10", "value": 71.5}]}}
+    mock_get.return_value = mock_response
+
+    EIAClient(api_key="test-key").query(path="petroleum/pri/spt", limit=10)
+
+    spans = {span.name: span for span in exporter.spans}
+    assert set(spans) == {"eia.http", "eia.json_decode", "eia.query"}
+    query = spans["eia.query"]
+    assert spans["eia.http"].parent_id == query.span_id
+    assert spans["eia.http"].attributes["http.status_code"] == 200
+    assert query.attributes["eia.path"] == "petroleum/pri/spt"
+    assert query.attributes["eia.records"] == 1
+
+
+def test_trace_filter_stamps_log_records():
+    """Test log records inside a span carry its trace_id."""
+    record = logging.LogRecord("tools.example", logging.INFO, __file__, 1, "msg", (), None)
+    with tracer.start_as_current_span("tool.example") as span:
+        TraceContextFilter().filter(record)
+
+    assert record.trace_id == span.trace_id
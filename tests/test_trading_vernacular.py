@@ -193,3 +193,149 @@ def test_glossary_coverage():
         assert "full_name" in GLOSSARY[term]
         assert "context" in GLOSSARY[term]
 
+
+def test_explain_term_aliases():
+    """Test trader shorthand resolves to the glossary entry."""
+    from tools.trading_vernacular import register_vernacular_tool
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_vernacular_tool(mcp)
+    
+    assert "West Texas Intermediate" in tool_functions["explain_trading_term"](term="CL")
+    assert "Henry Hub" in tool_functions["explain_trading_term"](term="NG")
+    assert "Crack Spread" in tool_functions["explain_trading_term"](term="3-2-1")
+
+
+def test_explain_term_typo_resolves():
+    """Test a clear misspelling is explained in one call."""
+    from tools.trading_vernacular import register_vernacular_tool
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_vernacular_tool(mcp)
+    
+    result = tool_functions["explain_trading_term"](term="backwardaton")
+    
+    assert "## Backwardation" in result
+    assert "Closest match" in result
+    assert "not found" not in result.lower()
+
+
+def test_explain_term_ambiguous_suggests():
+    """Test an ambiguous query returns ranked suggestions."""
+    from tools.trading_vernacular import register_vernacular_tool
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_vernacular_tool(mcp)
+    
+    result = tool_functions["explain_trading_term"](term="spread")
+    
+    assert "not found" in result.lower()
+    assert "Did You Mean" in result
+    assert "`crack spread`" in result
+
+
+def test_list_terms_unknown_category():
+    """Test an unknown category returns an error naming the valid ones."""
+    from tools.trading_vernacular import register_vernacular_tool
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_vernacular_tool(mcp)
+    
+    result = tool_functions["list_trading_terms"](category="weather")
+    
+    assert "Error" in result
+    assert "positions" in result
+
+
+def test_explain_terms_free_text():
+    """Test the batch tool explains every term in a sentence in one call."""
+    from tools.trading_vernacular import register_vernacular_tool
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_vernacular_tool(mcp)
+    
+    result = tool_functions["explain_trading_terms"](
+        text="the Brent-WTI arb widened as Cushing drew and the prompt went into backwardation"
+    )
+    
+    assert "Trading Terms Explained (4)" in result
+    for name in ("## Arbitrage", "## Cushing, Oklahoma", "## Prompt Month", "## Backwardation"):
+        assert name in result
+    assert result.index("## Arbitrage") < result.index("## Backwardation")
+
+
+def test_explain_terms_list_with_typos():
+    """Test list items resolve through aliases and fuzzy matching."""
+    from tools.trading_vernacular import register_vernacular_tool
+    from unittest.mock import MagicMock
+    
+    mcp = MagicMock()
+    tool_functions = {}
+    
+    def mock_tool():
+        def decorator(func):
+            tool_functions[func.__name__] = func
+            return func
+        return decorator
+    
+    mcp.tool = mock_tool
+    register_vernacular_tool(mcp)
+    
+    result = tool_functions["explain_trading_terms"](text="CL, contnago, foobar")
+    
+    assert "## West Texas Intermediate" in result
+    assert "## Contango" in result
+    assert "**Not recognized**: `foobar`" in result
+    
+    none_found = tool_functions["explain_trading_terms"](text="the weather was nice")
+    assert "No trading terms found" in none_found
@@ -0,0 +1,91 @@
+"""
+Tests for numeric input parsing.
+"""
+
+import pytest
+import numpy as np
+
+from utils import value_input
+from utils.series_cache import CachedSeries, SeriesCache
+from utils.value_input import detect_format, encode_values, parse_values
+
+
+def test_detect_format():
+    """Test automatic format detection."""
+    assert detect_format("71.5,70.2") == "csv"
+    assert detect_format(" [71.5, 70.2]") == "json"
+    assert detect_format("base64:AAAA") == "base64"
+    assert detect_format("series:RWTC") == "series"
+
+
+def test_parse_csv():
+    """Test comma-separated parsing with whitespace."""
+    arr, fmt = parse_values("71.5, 70.2 ,72.1")
+    
+    assert fmt == "csv"
+    np.testing.assert_array_equal(arr, [71.5, 70.2, 72.1])
+
+
+def test_parse_json_array():
+    """Test JSON array parsing."""
+    arr, fmt = parse_values("[1, 2.5, -3e2]")
+    
+    assert fmt == "json"
+    np.testing.assert_array_equal(arr, [1.0, 2.5, -300.0])
+
+
+def test_parse_base64_round_trip_is_zero_copy():
+    """Test base64 buffers decode to a read-only view."""
+    original = np.linspace(60.0, 80.0, 1000)
+    arr, fmt = parse_values(encode_values(original))
+    
+    assert fmt == "base64"
+    np.testing.assert_array_equal(arr, original)
+    assert arr.base is not None
+    assert not arr.flags.writeable
+
+
+def test_parse_series_reference(monkeypatch):
+    """Test series references resolve to cached values without copying."""
+    cache = SeriesCache(api_key=None)
+    series = CachedSeries("RWTC", "weekly", ["2025-W40", "2025-W41"], [61.0, 62.0])
+    cache.put(series)
+    monkeypatch.setattr(value_input, "get_series_cache", lambda: cache)
+    
+    arr, fmt = parse_values("series:rwtc@weekly")
+    
+    assert fmt == "series"
+    assert arr is series.values
+
+
+@pytest.mark.parametrize("values,input_format", [
+    ("abc,def", "auto"),
+    ("1,,2", "csv"),
+    ("1,2,", "csv"),
+    (",1,2", "auto"),
+    ("[1, 2", "json"),
+    ("[[1, 2]]", "auto"),
+    ('["1", 2]', "json"),
+    ("[true, 2]", "json"),
+    ("base64:not-base64!", "auto"),
+    ("AAAA", "base64"),
+    ("1,nan", "csv"),
+    ("1,2", "xml"),
+])
+def test_parse_invalid(values, input_format):
+    """Test malformed inputs raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_values(values, input_format)
+
+
+def test_parse_nested_json_error_names_json():
+    """Test nested arrays get a JSON error, not the CSV hint."""
+    with pytest.raises(ValueError, match="flat array of numbers"):
+        parse_values("[[1, 2]]")
+
+
+@pytest.mark.parametrize("values", ["", "   ", " \n\t"])
+def test_parse_blank_text_error(values):
+    """Test blank CSV input is reported as empty, not parsed as [-1.0]."""
+    with pytest.raises(ValueError, match="No values provided"):
+        parse_values(values, "csv")
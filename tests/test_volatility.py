@@ -0,0 +1,81 @@
+"""
+Tests for volatility estimators.
+"""
+
+import pytest
+import numpy as np
+
+from utils.volatility import (
+    close_to_close_vol,
+    estimate_volatility,
+    ewma_vol,
+    garch11_vol,
+    log_returns,
+    periods_per_year,
+)
+
+
+def _gbm_prices(vol=0.30, n=1000, seed=7):
+    """Generate a daily GBM price path with known annual volatility."""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0, vol / np.sqrt(252), n)
+    return 70.0 * np.exp(np.cumsum(returns))
+
+
+def test_log_returns_drops_non_positive_prices():
+    """Test that returns through negative prices are dropped."""
+    prices = np.array([20.0, 10.0, -37.63, 10.0, 11.0])
+    returns = log_returns(prices)
+    
+    assert np.all(np.isfinite(returns))
+    assert len(returns) == 2
+    assert returns[0] == pytest.approx(np.log(0.5))
+
+
+def test_close_to_close_recovers_known_vol():
+    """Test close-to-close estimator on simulated data."""
+    returns = log_returns(_gbm_prices(vol=0.30, n=5000))
+    
+    assert close_to_close_vol(returns, 252) == pytest.approx(0.30, rel=0.05)
+
+
+def test_ewma_constant_returns():
+    """Test EWMA equals absolute return magnitude for constant squared returns."""
+    returns = np.array([0.01, -0.01] * 50)
+    
+    assert ewma_vol(returns, 1, 0.94) == pytest.approx(0.01)
+
+
+def test_ewma_invalid_decay():
+    """Test EWMA rejects invalid decay factors."""
+    with pytest.raises(ValueError):
+        ewma_vol(np.array([0.01, 0.02, 0.03]), 252, 1.5)
+
+
+def test_garch_fit():
+    """Test GARCH(1,1) returns stationary parameters and sensible volatility."""
+    returns = log_returns(_gbm_prices(vol=0.25, n=1500))
+    fit = garch11_vol(returns, 252)
+    
+    assert fit["alpha"] + fit["beta"] < 1.0
+    assert 0.15 < fit["volatility"] < 0.40
+    assert fit["long_run_volatility"] == pytest.approx(0.25, rel=0.1)
+
+
+def test_estimate_volatility_methods():
+    """Test dispatch by method name and lookback."""
+    prices = _gbm_prices()
+    
+    for method in ("close_to_close", "ewma", "garch"):
+        vol = estimate_volatility(prices, method=method, lookback=252)
+        assert 0.1 < vol < 0.6
+    
+    with pytest.raises(ValueError):
+        estimate_volatility(prices, method="parkinson")
+
+
+def test_periods_per_year_invalid():
+    """Test annualization rejects unknown frequencies."""
+    assert periods_per_year("weekly") == 52
+    with pytest.raises(ValueError):
+        periods_per_year("hourly")
@@ -9,13 +9,32 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from north_mcp_python_sdk import NorthMCPServer
 
-from .hello_world import register_hello_world
-from .eia_data_extractor import register_eia_data_extractor
-from .analysis_tools import register_analysis_tools
-from .trading_vernacular import register_vernacular_tool
+from . import (
+    analysis_tools,
+    contract_codes,
+    eia_data_extractor,
+    hello_world,
+    market_structure,
+    server_stats,
+    trading_vernacular,
+)
+from .registry import TOOL_REGISTRY, ToolSpec, register_module
 
 logger = logging.getLogger(__name__)
 
+# Tool modules in registration order: (label, register function, tool specs).
+# A new module is added here once; its tools and their metadata come from
+# the module's TOOL_SPECS.
+TOOL_MODULES = [
+    ("hello_world", hello_world.register_hello_world, hello_world.TOOL_SPECS),
+    ("eia_data_extractor", eia_data_extractor.register_eia_data_extractor, eia_data_extractor.TOOL_SPECS),
+    ("analysis_tools", analysis_tools.register_analysis_tools, analysis_tools.TOOL_SPECS),
+    ("trading_vernacular", trading_vernacular.register_vernacular_tool, trading_vernacular.TOOL_SPECS),
+    ("market_structure", market_structure.register_market_structure_tools, market_structure.TOOL_SPECS),
+    ("contract_codes", contract_codes.register_contract_code_tools, contract_codes.TOOL_SPECS),
+    ("server_stats", server_stats.register_server_stats_tool, server_stats.TOOL_SPECS),
+]
+
 
 def register_all_tools(mcp: "NorthMCPServer") -> None:
     """
@@ -24,48 +43,21 @@ def register_all_tools(mcp: "NorthMCPServer") -> None:
     Args:
         mcp: The NorthMCPServer instance
     
-    This function discovers and registers all tool modules. Add new tool
-    registration calls here as tools are implemented.
+    Each module in TOOL_MODULES registers through a ToolRegistrar, which
+    wraps every tool with its ToolSpec (cost class, response caching,
+    timeout, concurrency limit) and records it in TOOL_REGISTRY. A module
+    that fails to register is logged and skipped.
     """
     logger.info("Registering MCP tools...")
     
-    # Track registration count
-    registered_count = 0
-    
-    # Register hello_world tool
-    try:
-        register_hello_world(mcp)
-        registered_count += 1
-        logger.info("✓ hello_world tool registered")
-    except Exception as e:
-        logger.error(f"✗ Failed to register hello_world tool: {e}")
-    
-    # Register EIA data extractor tool (Sprint 2)
-    try:
-        register_eia_data_extractor(mcp)
-        registered_count += 1
-        logger.info("✓ eia_data_extractor tool registered")
-    except Exception as e:
-        logger.error(f"✗ Failed to register eia_data_extractor tool: {e}")
+    for label, register, specs in TOOL_MODULES:
+        try:
+            registered = register_module(mcp, register, specs)
+            logger.info("✓ %s registered (%s)", label, ", ".join(registered))
+        except Exception as e:
+            logger.error("✗ Failed to register %s: %s", label, e)
     
-    # Register analysis tools (Sprint 3)
-    try:
-        register_analysis_tools(mcp)
-        registered_count += 2  # Monte Carlo + statistics
-        logger.info("✓ analysis_tools registered (Monte Carlo, statistics)")
-    except Exception as e:
-        logger.error(f"✗ Failed to register analysis_tools: {e}")
+    logger.info("Tool registration complete: %d tool(s) registered", len(TOOL_REGISTRY))
     
-    # Register trading vernacular tool (Sprint 3)
-    try:
-        register_vernacular_tool(mcp)
-        registered_count += 2  # explain_term + list_terms
-        logger.info("✓ trading_vernacular tool registered")
-    except Exception as e:
-        logger.error(f"✗ Failed to register trading_vernacular tool: {e}")
-    
-    logger.info(f"Tool registration complete: {registered_count} tool(s) registered")
-    
-    if registered_count == 0:
+    if not TOOL_REGISTRY:
         logger.warning("No tools were registered successfully")
-
@@ -2,19 +2,175 @@
 Analysis Tools - Statistical analysis and simulations for energy trading.
 """
 
+import json
 import logging
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 if TYPE_CHECKING:
     from north_mcp_python_sdk import NorthMCPServer
 
-import numpy as np
-import pandas as pd
-
+from tools.registry import ToolSpec
+from utils.accumulators import StreamingStats
 from utils.auth import get_authenticated_user
+from utils.rolling import ROLLING_METRICS, RollingEngine, parse_windows, window_label
+from utils.quantiles import parse_percentiles, quantile_summary, row_quantiles
+from utils.contracts import CONTRACT_SPECS, parse_position
+from utils.lazy import lazy_import
+from utils.processes import get_process
+from utils.series_cache import get_series_cache
+from utils.simulation import (
+    analytic_gbm_quantiles,
+    simulate_gbm_grid,
+    terminal_price_cache,
+)
+from utils.value_input import parse_values
+from utils.volatility import (
+    DEFAULT_LOOKBACK,
+    VOL_METHODS,
+    close_to_close_vol,
+    estimate_volatility,
+    ewma_vol,
+    garch11_vol,
+    log_returns,
+    periods_per_year,
+)
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
 
 logger = logging.getLogger(__name__)
 
+TOOL_SPECS = [
+    ToolSpec("monte_carlo_simulation", cost_class="compute", timeout=60.0, max_concurrency=2),
+    ToolSpec("calculate_statistics", cost_class="io", cacheable=True),
+    ToolSpec("historical_volatility", cost_class="io", cacheable=True),
+    ToolSpec("rolling_analytics", cost_class="io", cacheable=True),
+    ToolSpec("position_risk", cost_class="compute", timeout=60.0, max_concurrency=2),
+    ToolSpec("sensitivity_grid", cost_class="compute", timeout=60.0, max_concurrency=2),
+]
+
+# Quantiles for the 95% and 68% confidence intervals (lower, upper)
+CONFIDENCE_PROBS = (0.025, 0.975, 0.16, 0.84)
+
+# Largest parameter grid evaluated by sensitivity_grid
+MAX_GRID_POINTS = 500
+
+# Historical block-bootstrap model and its parameters (lookback 0 = all returns)
+BOOTSTRAP_MODEL = "bootstrap"
+BOOTSTRAP_DEFAULTS = {"block_size": 5, "lookback": 0}
+
+
+def _parse_grid(text: str, name: str) -> List[float]:
+    """
+    Parse grid values given as a list ("0.2,0.3,0.4") or range ("0.2:0.6:5").
+
+    A range is start:stop:count with both ends included; count is checked
+    against MAX_GRID_POINTS before any values are generated.
+    """
+    text = text.strip()
+    try:
+        if ":" in text:
+            start, stop, count = text.split(":")
+            start, stop, count = float(start), float(stop), int(count)
+        else:
+            return [float(v) for v in text.split(",") if v.strip()]
+    except ValueError:
+        raise ValueError(
+            f"Invalid {name} '{text}'. Use a list like 0.2,0.3,0.4 or a range like 0.2:0.6:5"
+        )
+    if not 1 <= count <= MAX_GRID_POINTS:
+        raise ValueError(f"{name} range count must be between 1 and {MAX_GRID_POINTS}, got {count}")
+    return np.linspace(start, stop, count).tolist()
+
+
+def _parse_model_params(text: str) -> Dict[str, Any]:
+    """Parse model parameters given as a JSON object (empty string = defaults)."""
+    if not text.strip():
+        return {}
+    try:
+        params = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(
+            f'Invalid model_params JSON: {e}. Use e.g. {{"mean_reversion": 2.5}}'
+        )
+    if not isinstance(params, dict):
+        raise ValueError('model_params must be a JSON object, e.g. {"jump_intensity": 8}')
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in params.values()):
+        raise ValueError("model_params values must be numbers")
+    return params
+
+
+def _is_bootstrap(model: str) -> bool:
+    return model.strip().lower() == BOOTSTRAP_MODEL
+
+
+def _bootstrap_params(params: Dict[str, Any]) -> Dict[str, int]:
+    """Validate bootstrap model parameters and fill in defaults."""
+    unknown = set(params) - set(BOOTSTRAP_DEFAULTS)
+    if unknown:
+        raise ValueError(
+            f"Unknown parameter(s) for bootstrap: {', '.join(sorted(unknown))}. "
+            f"Valid: {', '.join(BOOTSTRAP_DEFAULTS)}"
+        )
+    resolved = {k: int(params.get(k, v)) for k, v in BOOTSTRAP_DEFAULTS.items()}
+    if resolved["block_size"] < 1:
+        raise ValueError("block_size must be at least 1")
+    if resolved["lookback"] < 0:
+        raise ValueError("lookback must be 0 (all returns) or a positive number of returns")
+    return resolved
+
+
+def _model_summary(model: str, params: Dict[str, Any]) -> str:
+    """One-line model description including any non-default parameters."""
+    if _is_bootstrap(model):
+        resolved = _bootstrap_params(params)
+        history = f"last {resolved['lookback']} returns" if resolved["lookback"] > 0 else "full history"
+        return f"Historical block bootstrap (block_size={resolved['block_size']}, {history})"
+    process = get_process(model)
+    if not params:
+        return process.label
+    details = ", ".join(f"{k}={v:g}" for k, v in params.items())
+    return f"{process.label} ({details})"
+
+
+def _model_description(model: str) -> str:
+    if _is_bootstrap(model):
+        return "Resamples blocks of historical daily returns, keeping their fat tails."
+    return get_process(model).description
+
+
+def _bootstrap_volatility(series: Any, params: Dict[str, Any]) -> float:
+    """Annualized close-to-close volatility of the returns being resampled."""
+    lookback = _bootstrap_params(params)["lookback"]
+    returns = series.returns[-lookback:] if lookback > 0 else series.returns
+    return close_to_close_vol(returns, periods_per_year(series.frequency))
+
+
+def _simulate_terminal(
+    model: str,
+    params: Dict[str, Any],
+    series: Any,
+    current_price: float,
+    volatility: float,
+    days: int,
+    simulations: int,
+    drift: float
+) -> "np.ndarray":
+    """Cached terminal prices for a registered process or the bootstrap model."""
+    if not _is_bootstrap(model):
+        return terminal_price_cache.get(
+            model, current_price, volatility, days, simulations, drift, params=params
+        )
+    if series is None:
+        raise ValueError("The bootstrap model needs a price history; set volatility_series (e.g., \"RWTC\")")
+    if series.frequency != "daily":
+        raise ValueError(f"The bootstrap model needs a daily series; {series.series_id} is {series.frequency}")
+    resolved = _bootstrap_params(params)
+    return terminal_price_cache.get_bootstrap(
+        series, current_price, days, simulations,
+        block_size=resolved["block_size"], drift=drift, lookback=resolved["lookback"],
+    )
+
 
 def register_analysis_tools(mcp: "NorthMCPServer") -> None:
     """
@@ -27,23 +183,49 @@ def register_analysis_tools(mcp: "NorthMCPServer") -> None:
     @mcp.tool()
     def monte_carlo_simulation(
         current_price: float,
-        volatility: float,
+        volatility: Optional[float] = None,
         days: int = 30,
         simulations: int = 1000,
-        drift: float = 0.0
+        drift: float = 0.0,
+        volatility_series: str = "",
+        vol_method: str = "ewma",
+        percentiles: str = "",
+        risk_levels: str = "",
+        model: str = "gbm",
+        model_params: str = ""
     ) -> str:
         """
         Run Monte Carlo simulation for price forecasting.
         
-        Simulates potential future price paths using geometric Brownian motion.
-        Useful for risk analysis and scenario planning.
+        Simulates potential future price paths using geometric Brownian motion
+        (default), a mean-reverting Schwartz one-factor model, Merton
+        jump-diffusion or a block bootstrap of historical returns. Useful for
+        risk analysis and scenario planning.
         
         Args:
             current_price: Starting price (e.g., 71.50 for WTI at $71.50/barrel)
-            volatility: Annual volatility as decimal (e.g., 0.25 for 25%)
+            volatility: Annual volatility as decimal (e.g., 0.25 for 25%);
+                give either this or volatility_series, not both
             days: Number of days to simulate (default: 30)
             simulations: Number of simulation paths (default: 1000)
             drift: Expected daily return as decimal (default: 0.0)
+            volatility_series: Optional EIA series ID (e.g., "RWTC") to estimate
+                volatility from instead of passing it by hand. With a series,
+                current_price=0 uses the latest observed price.
+            vol_method: Estimator for volatility_series - "close_to_close",
+                "ewma" or "garch" (default: "ewma")
+            percentiles: Optional extra percentiles of the final price,
+                e.g. "1,5,95,99"
+            risk_levels: Optional VaR/Expected Shortfall confidence levels in
+                percent, e.g. "95,99"
+            model: Price process - "gbm", "ou" (mean-reverting, suited to
+                natural gas), "merton" (jump-diffusion) or "bootstrap"
+                (resamples volatility_series' daily returns) (default: "gbm")
+            model_params: Optional JSON of model parameters, e.g.
+                {"mean_reversion": 3, "long_run_price": 3.5} for "ou",
+                {"jump_intensity": 5, "jump_mean": 0, "jump_volatility": 0.08}
+                for "merton" (intensity in jumps/year, jump sizes in log terms)
+                or {"block_size": 5, "lookback": 1000} for "bootstrap"
         
         Returns:
             Formatted results with price distribution and confidence intervals
@@ -51,46 +233,80 @@ def register_analysis_tools(mcp: "NorthMCPServer") -> None:
         Example:
             current_price=71.50, volatility=0.25, days=30
             Simulates WTI price over next 30 days with 25% annual volatility
+            
+            current_price=0, volatility_series="RWTC", vol_method="garch"
+            Simulates from the latest WTI spot price with GARCH volatility
+            
+            current_price=0, volatility_series="RNGWHHD", model="ou"
+            Mean-reverting Henry Hub scenarios from the latest spot price
+            
+            current_price=0, volatility_series="RWTC", model="bootstrap"
+            WTI scenarios built from resampled 5-day blocks of real returns
         """
-        logger.info(f"Monte Carlo simulation: price={current_price}, vol={volatility}, days={days}")
+        logger.info("Monte Carlo simulation: price=%s, vol=%s, days=%s", current_price, volatility, days)
         
         user = get_authenticated_user()
         if user:
-            logger.info(f"Simulation requested by: {user.email}")
+            logger.info("Simulation requested by: %s", user.email)
         
         try:
-            # Convert annual volatility to daily
-            daily_vol = volatility / np.sqrt(252)  # 252 trading days/year
-            
-            # Run simulations
-            np.random.seed(42)  # For reproducibility in demo
-            results = []
+            custom_probs = parse_percentiles(percentiles) if percentiles else []
+            risk_probs = parse_percentiles(risk_levels) if risk_levels else []
+            tail_probs = [1.0 - level for level in risk_probs]
+            params = _parse_model_params(model_params)
+            model_name = _model_summary(model, params)
             
-            for _ in range(simulations):
-                price = current_price
-                for _ in range(days):
-                    # Geometric Brownian motion
-                    change = np.random.normal(drift, daily_vol)
-                    price = price * (1 + change)
-                results.append(price)
+            vol_source = ""
+            series = None
+            if volatility_series and volatility is not None:
+                return (
+                    "❌ **Error**: Provide either `volatility` or `volatility_series`, not both. "
+                    "Omit `volatility` to estimate it from the series."
+                )
+            if volatility_series:
+                series = get_series_cache().get(volatility_series)
+                if _is_bootstrap(model):
+                    volatility = _bootstrap_volatility(series, params)
+                    vol_source = f" (realized, resampled from {series.series_id})"
+                else:
+                    volatility = estimate_volatility(
+                        series.values,
+                        method=vol_method,
+                        frequency=series.frequency,
+                        lookback=DEFAULT_LOOKBACK.get(series.frequency),
+                    )
+                    vol_source = f" ({vol_method} from {series.series_id})"
+                if current_price <= 0:
+                    current_price = series.latest
+            elif volatility is None:
+                return (
+                    "❌ **Error**: Provide `volatility` (e.g., 0.25) or "
+                    "`volatility_series` (e.g., \"RWTC\")"
+                )
             
-            results = np.array(results)
+            # Run vectorized simulation (cached for repeated inputs)
+            results = _simulate_terminal(
+                model, params, series, current_price, volatility, days, simulations, drift
+            )
             
             # Calculate statistics
-            mean_price = np.mean(results)
-            median_price = np.median(results)
-            std_dev = np.std(results)
+            mean_price = results.mean()
+            std_dev = results.std()
             
-            # Confidence intervals
-            ci_95_lower = np.percentile(results, 2.5)
-            ci_95_upper = np.percentile(results, 97.5)
-            ci_68_lower = np.percentile(results, 16)
-            ci_68_upper = np.percentile(results, 84)
+            # Median, confidence intervals, requested percentiles and VaR
+            # cutoffs/tail means all come from a single partition
+            probs = [0.5, *CONFIDENCE_PROBS, *custom_probs, *tail_probs]
+            quantiles, tail_means = quantile_summary(results, probs, tail_probs)
+            median_price = quantiles[0]
+            ci_95_lower, ci_95_upper, ci_68_lower, ci_68_upper = quantiles[1:5]
+            custom_values = quantiles[5:5 + len(custom_probs)]
+            var_cutoffs = quantiles[5 + len(custom_probs):]
             
             # Build response
             response = f"## Monte Carlo Price Simulation\n\n"
             response += f"**Starting Price**: ${current_price:.2f}\n"
-            response += f"**Volatility**: {volatility*100:.1f}% annual\n"
+            response += f"**Volatility**: {volatility*100:.1f}% annual{vol_source}\n"
+            response += f"**Model**: {model_name}\n"
             response += f"**Time Horizon**: {days} days\n"
             response += f"**Simulations**: {simulations:,}\n\n"
             
@@ -107,6 +323,25 @@ def register_analysis_tools(mcp: "NorthMCPServer") -> None:
             response += f"| 95% | ${ci_95_lower:.2f} | ${ci_95_upper:.2f} | ${ci_95_upper - ci_95_lower:.2f} |\n"
             response += f"| 68% | ${ci_68_lower:.2f} | ${ci_68_upper:.2f} | ${ci_68_upper - ci_68_lower:.2f} |\n\n"
             
+            if custom_probs:
+                response += f"### Percentiles\n\n"
+                response += f"| Percentile | Price |\n"
+                response += f"|------------|-------|\n"
+                for prob, value in zip(custom_probs, custom_values):
+                    response += f"| P{prob*100:g} | ${value:.2f} |\n"
+                response += "\n"
+            
+            if risk_probs:
+                response += f"### Value-at-Risk (per unit)\n\n"
+                response += f"| Confidence | VaR | Expected Shortfall (CVaR) |\n"
+                response += f"|------------|-----|---------------------------|\n"
+                for level, cutoff, tail_mean in zip(risk_probs, var_cutoffs, tail_means):
+                    response += (
+                        f"| {level*100:g}% | ${current_price - cutoff:.2f} | "
+                        f"${current_price - tail_mean:.2f} |\n"
+                    )
+                response += "\n"
+            
             # Interpretation
             upside = ((ci_95_upper - current_price) / current_price) * 100
             downside = ((current_price - ci_95_lower) / current_price) * 100
@@ -116,54 +351,64 @@ def register_analysis_tools(mcp: "NorthMCPServer") -> None:
             response += f"- **Downside Risk (95% CI)**: -{downside:.1f}%\n"
             response += f"- **Expected Change**: {((mean_price - current_price) / current_price) * 100:+.1f}%\n\n"
             
-            response += f"*Simulation uses geometric Brownian motion. Past volatility may not predict future movement.*"
+            response += f"*{_model_description(model)} Past volatility may not predict future movement.*"
             
             return response
             
+        except ValueError as e:
+            return f"❌ **Error**: {str(e)}"
         except Exception as e:
-            logger.error(f"Monte Carlo simulation error: {e}", exc_info=True)
+            logger.error("Monte Carlo simulation error: %s", e, exc_info=True)
             return f"❌ **Simulation Error**: {str(e)}"
     
     @mcp.tool()
     def calculate_statistics(
         values: str,
-        label: str = "Data"
+        label: str = "Data",
+        input_format: str = "auto"
     ) -> str:
         """
         Calculate statistical measures for a dataset.
         
         Args:
-            values: Comma-separated numbers (e.g., "71.5,70.2,72.1,69.8")
+            values: The dataset in one of these forms:
+                - Comma-separated numbers (e.g., "71.5,70.2,72.1,69.8")
+                - JSON array (e.g., "[71.5, 70.2, 72.1]")
+                - Base64 little-endian float64 buffer prefixed with "base64:"
+                - Cached EIA series reference (e.g., "series:RWTC" or
+                  "series:RWTC@weekly")
             label: Label for the dataset (e.g., "WTI Prices")
+            input_format: "auto" (detect), "csv", "json", "base64" or "series"
         
         Returns:
             Statistical summary with mean, median, std dev, min, max, range
         
         Example:
             values="71.5,70.2,72.1,69.8,71.0", label="WTI Weekly Prices"
+            values="series:RWTC", label="WTI Daily History"
         """
-        logger.info(f"Statistics calculation for: {label}")
+        logger.info("Statistics calculation for: %s", label)
         
         try:
-            # Parse values
-            data = [float(v.strip()) for v in values.split(",")]
+            # Parse values (vectorized; base64 and series inputs are zero-copy)
+            arr, _ = parse_values(values, input_format)
             
-            if len(data) == 0:
+            if len(arr) == 0:
                 return "❌ **Error**: No values provided"
             
-            arr = np.array(data)
-            
-            # Calculate statistics
-            mean = np.mean(arr)
-            median = np.median(arr)
-            std_dev = np.std(arr)
-            min_val = np.min(arr)
-            max_val = np.max(arr)
-            range_val = max_val - min_val
+            # Calculate statistics in a single pass over the data
+            stats = StreamingStats.from_array(arr)
+            summary = stats.summary()
+            mean = summary["mean"]
+            median = summary["median"]
+            std_dev = summary["std"]
+            min_val = summary["min"]
+            max_val = summary["max"]
+            range_val = summary["range"]
             
             # Build response
             response = f"## Statistical Analysis: {label}\n\n"
-            response += f"**Sample Size**: {len(data)} values\n\n"
+            response += f"**Sample Size**: {len(arr)} values\n\n"
             
             response += f"| Measure | Value |\n"
             response += f"|---------|-------|\n"
@@ -174,19 +419,445 @@ def register_analysis_tools(mcp: "NorthMCPServer") -> None:
             response += f"| Maximum | {max_val:.2f} |\n"
             response += f"| Range | {range_val:.2f} |\n\n"
             
-            # Coefficient of variation
-            cv = (std_dev / mean) * 100
+            # Coefficient of variation (undefined for a zero mean)
             response += f"### Variability\n\n"
-            response += f"- **Coefficient of Variation**: {cv:.1f}%\n"
-            response += f"- **Volatility**: {'High' if cv > 10 else 'Moderate' if cv > 5 else 'Low'}\n"
+            if mean == 0:
+                response += f"- **Coefficient of Variation**: n/a (mean is zero)\n"
+                response += f"- **Volatility**: n/a\n"
+            else:
+                cv = (std_dev / mean) * 100
+                response += f"- **Coefficient of Variation**: {cv:.1f}%\n"
+                response += f"- **Volatility**: {'High' if cv > 10 else 'Moderate' if cv > 5 else 'Low'}\n"
+            
+            if not stats.is_exact:
+                response += f"\n*Median estimated with a t-digest sketch ({len(arr):,} values).*\n"
             
             return response
             
         except ValueError as e:
-            return f"❌ **Error**: Invalid number format. Use comma-separated values like: 71.5,70.2,72.1"
+            return f"❌ **Error**: {str(e)}"
         except Exception as e:
-            logger.error(f"Statistics calculation error: {e}", exc_info=True)
+            logger.error("Statistics calculation error: %s", e, exc_info=True)
             return f"❌ **Calculation Error**: {str(e)}"
     
+    @mcp.tool()
+    def historical_volatility(
+        series_id: str = "RWTC",
+        frequency: str = "",
+        lookback: int = 0,
+        method: str = "all",
+        ewma_decay: float = 0.94
+    ) -> str:
+        """
+        Estimate annualized realized volatility from an EIA price series.
+        
+        Computes log-returns from the cached series and applies close-to-close,
+        EWMA (RiskMetrics) and GARCH(1,1) estimators. The result can be passed
+        straight to monte_carlo_simulation.
+        
+        Args:
+            series_id: EIA series ID (e.g., "RWTC" for WTI, "RBRTE" for Brent,
+                "RNGWHHD" for Henry Hub)
+            frequency: Data frequency (default: series default, e.g. daily)
+            lookback: Number of most recent returns to use (default: 252 daily,
+                104 weekly, 60 monthly)
+            method: "all", "close_to_close", "ewma" or "garch" (default: "all")
+            ewma_decay: EWMA decay factor lambda (default: 0.94)
+        
+        Returns:
+            Volatility estimates with a ready-to-use simulation call
+        
+        Example:
+            series_id="RWTC", method="all"
+            Annualized WTI volatility from daily Cushing spot prices
+        """
+        logger.info("Historical volatility: series=%s, method=%s", series_id, method)
+        
+        if method != "all" and method not in VOL_METHODS:
+            return (
+                f"❌ **Error**: Invalid method '{method}'. "
+                f"Use: all, {', '.join(VOL_METHODS)}"
+            )
+        
+        try:
+            series = get_series_cache().get(series_id, frequency or None)
+            periods = periods_per_year(series.frequency)
+            window = lookback or DEFAULT_LOOKBACK.get(series.frequency)
+            returns = log_returns(series.values)[-window:]
+            
+            estimates = {}
+            garch_fit = None
+            if method in ("all", "close_to_close"):
+                estimates["close_to_close"] = close_to_close_vol(returns, periods)
+            if method in ("all", "ewma"):
+                estimates["ewma"] = ewma_vol(returns, periods, ewma_decay)
+            if method in ("all", "garch"):
+                garch_fit = garch11_vol(returns, periods)
+                estimates["garch"] = garch_fit["volatility"]
+            
+            labels = {
+                "close_to_close": "Close-to-Close",
+                "ewma": f"EWMA (λ={ewma_decay})",
+                "garch": "GARCH(1,1) forecast",
+            }
+            
+            response = f"## Historical Volatility: {series.name}\n\n"
+            response += f"**Series**: {series.series_id} ({series.frequency})\n"
+            response += f"**Latest**: {series.latest:.2f} ({series.latest_period})\n"
+            response += f"**Returns Used**: {len(returns)} (through {series.latest_period})\n\n"
+            
+            response += f"| Estimator | Annualized Volatility |\n"
+            response += f"|-----------|-----------------------|\n"
+            for name, vol in estimates.items():
+                response += f"| {labels[name]} | {vol*100:.1f}% |\n"
+            
+            if garch_fit:
+                response += f"\n**GARCH Parameters**: α={garch_fit['alpha']:.3f}, "
+                response += f"β={garch_fit['beta']:.3f}, "
+                response += f"long-run vol {garch_fit['long_run_volatility']*100:.1f}%\n"
+            
+            preferred = "ewma" if "ewma" in estimates else next(iter(estimates))
+            response += f"\n### Use in Simulation\n\n"
+            response += (
+                f"`monte_carlo_simulation(current_price={series.latest:.2f}, "
+                f"volatility={estimates[preferred]:.4f})` or "
+                f"`monte_carlo_simulation(current_price=0, volatility_series=\"{series.series_id}\", "
+                f"vol_method=\"{preferred}\")`\n"
+            )
+            
+            return response
+            
+        except ValueError as e:
+            return f"❌ **Error**: {str(e)}"
+        except Exception as e:
+            logger.error("Historical volatility error: %s", e, exc_info=True)
+            return f"❌ **Volatility Error**: {str(e)}"
+    
+    @mcp.tool()
+    def rolling_analytics(
+        series_id: str = "RWTC",
+        windows: str = "20,60,expanding",
+        metrics: str = "mean,volatility,zscore,drawdown,percentile",
+        frequency: str = "",
+        history: int = 5
+    ) -> str:
+        """
+        Rolling and expanding window analytics over a cached EIA series.
+        
+        Computes rolling mean, annualized volatility, z-score, drawdown from
+        peak and 5th/50th/95th percentiles for several window sizes in one call.
+        
+        Args:
+            series_id: EIA series ID (e.g., "RWTC", "RBRTE", "RNGWHHD")
+            windows: Comma-separated window sizes in observations, or
+                "expanding" (default: "20,60,expanding")
+            metrics: Comma-separated subset of mean, volatility, zscore,
+                drawdown, percentile (default: all)
+            frequency: Data frequency (default: series default, e.g. daily)
+            history: Number of recent rows to show for the first window (default: 5)
+        
+        Returns:
+            Latest value of each metric per window plus recent history
+        
+        Example:
+            series_id="RWTC", windows="20,60"
+            20- and 60-day WTI mean, vol, z-score, drawdown and percentiles
+        """
+        logger.info("Rolling analytics: series=%s, windows=%s", series_id, windows)
+        
+        try:
+            window_list = parse_windows(windows)
+            metric_list = [m.strip().lower() for m in metrics.split(",") if m.strip()]
+            
+            series = get_series_cache().get(series_id, frequency or None)
+            engine = RollingEngine(series.values, series.frequency)
+            results = engine.compute(window_list, metric_list)
+            
+            columns = []
+            if "mean" in metric_list:
+                columns.append(("Mean", "mean", None, "{:.2f}"))
+            if "volatility" in metric_list:
+                columns.append(("Volatility", "volatility", None, "{:.1%}"))
+            if "zscore" in metric_list:
+                columns.append(("Z-Score", "zscore", None, "{:+.2f}"))
+            if "drawdown" in metric_list:
+                columns.append(("Drawdown", "drawdown", None, "{:.1%}"))
+            if "percentile" in metric_list:
+                columns.append(("P5", "percentile", 0, "{:.2f}"))
+                columns.append(("Median", "percentile", 1, "{:.2f}"))
+                columns.append(("P95", "percentile", 2, "{:.2f}"))
+            
+            def cell(metric, column, fmt, window, row):
+                value = results[(metric, window)][row]
+                if column is not None:
+                    value = value[column]
+                return "n/a" if np.isnan(value) else fmt.format(value)
+            
+            response = f"## Rolling Analytics: {series.name}\n\n"
+            response += f"**Series**: {series.series_id} ({series.frequency}, {len(series)} points)\n"
+            response += f"**Latest**: {series.latest:.2f} ({series.latest_period})\n\n"
+            
+            response += "| Window | " + " | ".join(c[0] for c in columns) + " |\n"
+            response += "|--------|" + "|".join("-" * (len(c[0]) + 2) for c in columns) + "|\n"
+            for window in window_list:
+                cells = []
+                for _, metric, column, fmt in columns:
+                    cells.append(cell(metric, column, fmt, window, -1))
+                response += f"| {window_label(window, series.frequency)} | " + " | ".join(cells) + " |\n"
+            
+            if history > 0 and columns:
+                window = window_list[0]
+                rows = range(max(len(series) - history, 0), len(series))
+                response += f"\n### Recent History ({window_label(window, series.frequency)})\n\n"
+                response += "| Period | Value | " + " | ".join(c[0] for c in columns) + " |\n"
+                response += "|--------|-------|" + "|".join("-" * (len(c[0]) + 2) for c in columns) + "|\n"
+                for row in reversed(rows):
+                    cells = []
+                    for _, metric, column, fmt in columns:
+                        cells.append(cell(metric, column, fmt, window, row))
+                    response += (
+                        f"| {series.periods[row]} | {series.values[row]:.2f} | "
+                        + " | ".join(cells) + " |\n"
+                    )
+            
+            return response
+            
+        except ValueError as e:
+            return (
+                f"❌ **Error**: {str(e)}\n\n"
+                f"Valid metrics: {', '.join(ROLLING_METRICS)}. "
+                f"Windows look like: 20,60,expanding"
+            )
+        except Exception as e:
+            logger.error("Rolling analytics error: %s", e, exc_info=True)
+            return f"❌ **Rolling Analytics Error**: {str(e)}"
+    
+    @mcp.tool()
+    def position_risk(
+        position: str,
+        current_price: float = 0.0,
+        volatility: Optional[float] = None,
+        days: int = 1,
+        simulations: int = 10000,
+        drift: float = 0.0,
+        confidence: str = "95,99",
+        multiplier: float = 0.0,
+        model: str = "gbm",
+        model_params: str = ""
+    ) -> str:
+        """
+        Value-at-Risk and Expected Shortfall for a futures position.
+        
+        Simulates the underlying with the chosen price process and revalues the
+        position (contracts x multiplier x price change) on every path in one
+        vectorized pass. Simulated prices are cached, so changing only the
+        position reuses the same distribution.
+        
+        Args:
+            position: Position description, e.g. "long 100 WTI", "short 50 NG",
+                "-20 CL" (contracts: CL/WTI, BZ/Brent, NG/Henry Hub)
+            current_price: Starting price (default: 0 = latest EIA spot price)
+            volatility: Annual volatility as decimal (default: EWMA estimate
+                from the contract's EIA spot series)
+            days: Risk horizon in trading days (default: 1)
+            simulations: Number of simulation paths (default: 10000)
+            drift: Expected daily return as decimal (default: 0.0)
+            confidence: Comma-separated confidence levels in percent (default: "95,99")
+            multiplier: Units per contract (default: exchange spec, e.g. 1,000
+                barrels for CL)
+            model: Price process - "gbm", "ou", "merton" or "bootstrap"
+                (resamples the contract's EIA spot returns) (default: "gbm")
+            model_params: Optional JSON of model parameters (see
+                monte_carlo_simulation)
+        
+        Returns:
+            P&L distribution with VaR and Expected Shortfall per confidence level
+        
+        Example:
+            position="long 100 WTI", current_price=71.50, volatility=0.30, days=1
+            One-day 95%/99% VaR for 100 NYMEX CL contracts (100,000 barrels)
+        """
+        logger.info("Position risk: position='%s', days=%s", position, days)
+        
+        try:
+            contracts, root = parse_position(position)
+            spec = CONTRACT_SPECS[root]
+            units = multiplier or spec["multiplier"]
+            levels = parse_percentiles(confidence)
+            if not levels:
+                return "❌ **Error**: Provide at least one confidence level (e.g., \"95,99\")"
+            params = _parse_model_params(model_params)
+            model_name = _model_summary(model, params)
+            
+            price_note = ""
+            vol_note = ""
+            series = None
+            if current_price <= 0 or volatility is None or _is_bootstrap(model):
+                series = get_series_cache().get(spec["series_id"])
+                if current_price <= 0:
+                    current_price = series.latest
+                    price_note = f" (latest {series.series_id}, {series.latest_period})"
+                if _is_bootstrap(model):
+                    volatility = _bootstrap_volatility(series, params)
+                    vol_note = f" (realized, resampled from {series.series_id})"
+                elif volatility is None:
+                    volatility = estimate_volatility(
+                        series.values,
+                        method="ewma",
+                        frequency=series.frequency,
+                        lookback=DEFAULT_LOOKBACK.get(series.frequency),
+                    )
+                    vol_note = f" (EWMA from {series.series_id})"
+            
+            terminal = _simulate_terminal(
+                model, params, series, current_price, volatility, days, simulations, drift
+            )
+            exposure = contracts * units
+            pnl = exposure * (terminal - current_price)
+            
+            tail_probs = [1.0 - level for level in levels]
+            probs = [0.05, 0.5, 0.95, *tail_probs]
+            quantiles, tail_means = quantile_summary(pnl, probs, tail_probs)
+            
+            side = "Long" if contracts > 0 else "Short" if contracts < 0 else "Flat"
+            response = f"## Position Risk: {side} {abs(contracts):g} {root}\n\n"
+            response += f"**Contract**: {spec['name']} ({units:,.0f} {spec['unit']}/contract)\n"
+            response += f"**Exposure**: {exposure:+,.0f} {spec['unit']} "
+            response += f"(${abs(exposure) * current_price:,.0f} notional)\n"
+            response += f"**Price**: ${current_price:.2f}{price_note}\n"
+            response += f"**Volatility**: {volatility*100:.1f}% annual{vol_note}\n"
+            response += f"**Model**: {model_name}\n"
+            response += f"**Horizon**: {days} day(s), {simulations:,} simulations\n\n"
+            
+            response += f"### P&L Distribution\n\n"
+            response += f"| Statistic | P&L |\n"
+            response += f"|-----------|-----|\n"
+            response += f"| Mean | ${pnl.mean():,.0f} |\n"
+            response += f"| Std Dev | ${pnl.std():,.0f} |\n"
+            response += f"| 5th Percentile | ${quantiles[0]:,.0f} |\n"
+            response += f"| Median | ${quantiles[1]:,.0f} |\n"
+            response += f"| 95th Percentile | ${quantiles[2]:,.0f} |\n\n"
+            
+            response += f"### Value-at-Risk\n\n"
+            response += f"| Confidence | VaR | Expected Shortfall |\n"
+            response += f"|------------|-----|--------------------|\n"
+            for level, cutoff, tail_mean in zip(levels, quantiles[3:], tail_means):
+                response += f"| {level*100:g}% | ${max(-cutoff, 0.0):,.0f} | ${max(-tail_mean, 0.0):,.0f} |\n"
+            
+            response += (
+                f"\n*VaR is the loss not exceeded with the given confidence over "
+                f"{days} day(s); Expected Shortfall is the average loss beyond it.*"
+            )
+            
+            return response
+            
+        except ValueError as e:
+            return f"❌ **Error**: {str(e)}"
+        except Exception as e:
+            logger.error("Position risk error: %s", e, exc_info=True)
+            return f"❌ **Risk Calculation Error**: {str(e)}"
+    
+    @mcp.tool()
+    def sensitivity_grid(
+        current_price: float,
+        volatilities: str = "0.2:0.5:4",
+        drifts: str = "0",
+        days: str = "30",
+        simulations: int = 5000,
+        method: str = "simulation"
+    ) -> str:
+        """
+        Price-distribution sensitivity to volatility, drift and horizon.
+        
+        Evaluates every combination in one call instead of one
+        monte_carlo_simulation call per value. All grid points reuse the same
+        random shocks, so differences between rows reflect the parameters only.
+        
+        Args:
+            current_price: Starting price (e.g., 71.50)
+            volatilities: Annual volatilities as a list ("0.2,0.3,0.4") or
+                range start:stop:count ("0.2:0.5:4")
+            drifts: Expected daily returns, list or range (default: "0")
+            days: Horizons in days, list or range (default: "30")
+            simulations: Paths per grid point (default: 5000)
+            method: "simulation" (same model as monte_carlo_simulation) or
+                "analytic" (closed-form lognormal approximation, instant)
+        
+        Returns:
+            Table of mean and 95%/68% confidence intervals per grid point
+        
+        Example:
+            current_price=71.50, volatilities="0.2:0.6:5", days="10,30,90"
+            How the WTI 95% CI widens with volatility and horizon
+        """
+        logger.info("Sensitivity grid: vols=%s, drifts=%s, days=%s", volatilities, drifts, days)
+        
+        if method not in ("simulation", "analytic"):
+            return "❌ **Error**: method must be \"simulation\" or \"analytic\""
+        
+        try:
+            vol_values = _parse_grid(volatilities, "volatilities")
+            drift_values = _parse_grid(drifts, "drifts")
+            day_values = [int(round(d)) for d in _parse_grid(days, "days")]
+            points = len(vol_values) * len(drift_values) * len(day_values)
+            if points == 0:
+                return "❌ **Error**: Provide at least one value for each parameter"
+            if points > MAX_GRID_POINTS:
+                return f"❌ **Error**: Grid has {points} points; maximum is {MAX_GRID_POINTS}"
+            
+            probs = [0.025, 0.975, 0.16, 0.84]
+            if method == "analytic":
+                results = [
+                    analytic_gbm_quantiles(current_price, vol_values, drift_values, horizon, probs)
+                    for horizon in day_values
+                ]
+                means = np.stack([mean for mean, _ in results])
+                quantiles = np.stack([q for _, q in results])
+            else:
+                # One simulation to the longest horizon; shorter horizons are
+                # read off the same paths, and every row's quantiles come
+                # from a single partition
+                terminal = simulate_gbm_grid(
+                    current_price, vol_values, drift_values, day_values, simulations
+                )
+                means = terminal.mean(axis=2)
+                quantiles = row_quantiles(
+                    terminal.reshape(-1, simulations), probs
+                ).reshape(len(day_values), -1, len(probs))
+            
+            rows = []
+            for h, horizon in enumerate(day_values):
+                index = 0
+                for vol in vol_values:
+                    for drift_value in drift_values:
+                        rows.append((vol, drift_value, horizon, means[h, index], quantiles[h, index]))
+                        index += 1
+            
+            response = f"## Sensitivity Grid\n\n"
+            response += f"**Starting Price**: ${current_price:.2f}\n"
+            response += f"**Grid**: {len(vol_values)} volatilities × {len(drift_values)} drifts "
+            response += f"× {len(day_values)} horizons = {points} scenarios\n"
+            if method == "analytic":
+                response += f"**Method**: Analytic (lognormal approximation)\n\n"
+            else:
+                response += f"**Method**: Simulation ({simulations:,} paths per scenario, shared shocks and paths across horizons)\n\n"
+            
+            response += "| Volatility | Drift | Days | Mean | 95% CI | 95% Width | 68% CI |\n"
+            response += "|------------|-------|------|------|--------|-----------|--------|\n"
+            for vol, drift_value, horizon, mean, q in rows:
+                response += (
+                    f"| {vol*100:.1f}% | {drift_value*100:+.2f}% | {horizon} | ${mean:.2f} | "
+                    f"${q[0]:.2f}–${q[1]:.2f} | ${q[1] - q[0]:.2f} "
+                    f"({(q[1] - q[0]) / current_price * 100:.1f}%) | ${q[2]:.2f}–${q[3]:.2f} |\n"
+                )
+            
+            return response
+            
+        except ValueError as e:
+            return f"❌ **Error**: {str(e)}"
+        except Exception as e:
+            logger.error("Sensitivity grid error: %s", e, exc_info=True)
+            return f"❌ **Sensitivity Grid Error**: {str(e)}"
+    
     logger.debug("Analysis tools registered")
 
@@ -0,0 +1,134 @@
+"""
+Contract Code Tools - Decode exchange contract codes, strips and position lists.
+"""
+
+import datetime
+import logging
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from north_mcp_python_sdk import NorthMCPServer
+
+from tools.registry import ToolSpec
+from utils.contracts import CONTRACT_SPECS, parse_contract_position, resolve_contract
+
+logger = logging.getLogger(__name__)
+
+# Not cacheable: single-digit years and the "(expired)" marker depend on today's date
+TOOL_SPECS = [
+    ToolSpec("decode_contracts"),
+]
+
+# Rows shown in one response; a few Cal strips already reach this
+MAX_CONTRACT_ROWS = 120
+
+_ITEM_SEPARATORS = re.compile(r"[,;\n]")
+
+
+def register_contract_code_tools(mcp: "NorthMCPServer") -> None:
+    """
+    Register contract code tools with the MCP server.
+
+    Args:
+        mcp: The NorthMCPServer instance
+    """
+
+    @mcp.tool()
+    def decode_contracts(contracts: str, default_contract: str = "CL") -> str:
+        """
+        Decode futures contract codes, strips and whole position lists in one call.
+
+        Understands exchange codes (root + month code + year, e.g. "CLZ25",
+        "NGH26", "BZF27", "RBZ5"), strips ("CL Cal-26", "NG Win-25 strip",
+        "BZ Q1-26", "NG Sum-26", or "Cal-26 strip" for default_contract), ranges ("CLZ25-CLH26") and quantities
+        ("long 10 CLZ25", "-5 NG Cal-26"). Each contract month is mapped to
+        its benchmark, delivery month, approximate last trading day and the
+        EIA spot series used to price it.
+
+        Month codes: F Jan, G Feb, H Mar, J Apr, K May, M Jun, N Jul, Q Aug,
+        U Sep, V Oct, X Nov, Z Dec.
+
+        Args:
+            contracts: One or more items separated by commas, semicolons or
+                new lines (e.g., "long 10 CLZ25, short 5 NG Win-25 strip")
+            default_contract: Root or alias for strips that do not name one,
+                e.g. "Cal-26 strip" (default: "CL")
+
+        Returns:
+            Table of contract months with net lots and exposure per benchmark
+
+        Example:
+            contracts="CL Cal-26 strip" -> CLF26 through CLZ26 with last trade dates
+        """
+        logger.info("Decoding contracts: %s", contracts)
+
+        try:
+            default_root = resolve_contract(default_contract)
+        except ValueError as e:
+            return f"❌ **Error**: {str(e)}"
+
+        items = [item.strip() for item in _ITEM_SEPARATORS.split(contracts) if item.strip()]
+        if not items:
+            return "❌ **Error**: No contracts given. Example: `long 10 CLZ25, NG Cal-26`"
+
+        rows = []
+        errors = []
+        for item in items:
+            try:
+                lots, months = parse_contract_position(item, default_root=default_root)
+            except ValueError as e:
+                errors.append(f"`{item}`: {str(e)}")
+                continue
+            rows.extend((item, lots, contract) for contract in months)
+
+        if not rows:
+            response = f"❌ **Error**: Could not decode any contracts\n\n"
+            for error in errors:
+                response += f"- {error}\n"
+            return response
+
+        today = datetime.date.today()
+        response = f"## Contracts Decoded ({len(rows)} contract months)\n\n"
+        response += f"| Code | Contract | Delivery | Last Trade | Benchmark | EIA Series | Lots |\n"
+        response += f"|------|----------|----------|------------|-----------|------------|------|\n"
+
+        for item, lots, contract in rows[:MAX_CONTRACT_ROWS]:
+            spec = contract.spec
+            last_trade = contract.last_trade
+            status = " (expired)" if last_trade < today else ""
+            response += (
+                f"| {contract.symbol} | {spec['name']} | {contract.contract_month} | "
+                f"{last_trade.isoformat()}{status} | {spec['benchmark']} | {spec['series_id']} | "
+                f"{'' if lots is None else f'{lots:+,g}'} |\n"
+            )
+        totals = {}
+        for item, lots, contract in rows:
+            if lots is not None:
+                totals[contract.root] = totals.get(contract.root, 0.0) + lots
+
+        if len(rows) > MAX_CONTRACT_ROWS:
+            response += f"\n*Showing the first {MAX_CONTRACT_ROWS} of {len(rows)} contract months.*\n"
+
+        if totals:
+            response += f"\n### Net Position by Contract\n"
+            for root, lots in totals.items():
+                spec = CONTRACT_SPECS[root]
+                exposure = lots * spec["multiplier"]
+                response += (
+                    f"- **{root}** ({spec['benchmark']}): {lots:+,g} lots = "
+                    f"{exposure:+,.0f} {spec['unit']}\n"
+                )
+
+        if errors:
+            response += f"\n### Not Decoded\n"
+            for error in errors:
+                response += f"- {error}\n"
+
+        response += (
+            f"\n*Last trade dates follow exchange rules but skip only weekends, "
+            f"not exchange holidays.*"
+        )
+        return response
+
+    logger.debug("Contract code tools registered")
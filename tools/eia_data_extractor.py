@@ -10,12 +10,20 @@ from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from north_mcp_python_sdk import NorthMCPServer
 
-import pandas as pd
-
+from tools.registry import ToolSpec
 from utils.auth import get_authenticated_user
 from utils.eia_client import EIAClient
+from utils.lazy import lazy_import
+from utils.tracing import get_tracer
+
+pd = lazy_import("pandas")
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer(__name__)
+
+TOOL_SPECS = [
+    ToolSpec("eia_data_extractor", cost_class="io", cacheable=True, timeout=30.0, max_concurrency=4),
+]
 
 
 def register_eia_data_extractor(mcp: "NorthMCPServer") -> None:
@@ -112,12 +120,12 @@ def register_eia_data_extractor(mcp: "NorthMCPServer") -> None:
         
         Browse all series: https://www.eia.gov/opendata/browser/
         """
-        logger.info(f"EIA data extractor called with path='{path}', frequency='{frequency}'")
+        logger.info("EIA data extractor called with path='%s', frequency='%s'", path, frequency)
         
         # Log authenticated user if present
         user = get_authenticated_user()
         if user:
-            logger.info(f"EIA query by authenticated user: {user.email}")
+            logger.info("EIA query by authenticated user: %s", user.email)
         
         # Check for API key
         if not api_key:
@@ -180,10 +188,12 @@ def register_eia_data_extractor(mcp: "NorthMCPServer") -> None:
                 )
             
             # Convert to DataFrame for formatting
-            df = pd.DataFrame(records)
+            with tracer.start_as_current_span("dataframe.build", {"dataframe.rows": len(records)}):
+                df = pd.DataFrame(records)
             
             # Format the response
-            return _format_response(df, path, frequency, facets, len(records))
+            with tracer.start_as_current_span("format_response"):
+                return _format_response(df, path, frequency, facets, len(records))
             
         except ValueError as e:
             # Parameter validation errors
@@ -191,7 +201,7 @@ def register_eia_data_extractor(mcp: "NorthMCPServer") -> None:
         
         except Exception as e:
             # API or other errors
-            logger.error(f"EIA data extractor error: {e}", exc_info=True)
+            logger.error("EIA data extractor error: %s", e, exc_info=True)
             return (
                 f"❌ **Error Querying EIA API**\n\n"
                 f"{str(e)}\n\n"
@@ -206,7 +216,7 @@ def register_eia_data_extractor(mcp: "NorthMCPServer") -> None:
 
 
 def _format_response(
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     path: str,
     frequency: str,
     facets: str,
@@ -8,10 +8,15 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from north_mcp_python_sdk import NorthMCPServer
 
+from tools.registry import ToolSpec
 from utils.auth import get_authenticated_user
 
 logger = logging.getLogger(__name__)
 
+TOOL_SPECS = [
+    ToolSpec("hello_world"),
+]
+
 
 def register_hello_world(mcp: "NorthMCPServer") -> None:
     """
@@ -40,7 +45,7 @@ def register_hello_world(mcp: "NorthMCPServer") -> None:
             >>> hello_world("Trader")
             "Hello, Trader! Welcome to the Market Analysis Bot."
         """
-        logger.info(f"hello_world tool called with name='{name}'")
+        logger.info("hello_world tool called with name='%s'", name)
         
         # Try to get authenticated user
         user = get_authenticated_user()
@@ -51,7 +56,7 @@ def register_hello_world(mcp: "NorthMCPServer") -> None:
         # Add user context if available
         if user:
             greeting += f"\n\nAuthenticated as: {user.email}"
-            logger.info(f"Tool called by authenticated user: {user.email}")
+            logger.info("Tool called by authenticated user: %s", user.email)
             
             # Show available connectors
             if user.connector_access_tokens:
@@ -0,0 +1,267 @@
+"""
+Market Structure Tools - Market snapshot, forward curves, term structure and
+spreads for energy trading.
+"""
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from north_mcp_python_sdk import NorthMCPServer
+
+from tools.registry import ToolSpec
+from utils.lazy import lazy_import
+from utils.rolling import RollingEngine, parse_windows, validate_window, window_label
+from utils.series_cache import SERIES_CATALOG, get_series_cache
+from utils.snapshot import snapshot_store
+from utils.spreads import align_series, compute_spread, describe_legs, parse_legs, resolve_spread
+from utils.term_structure import DEFAULT_FLAT_TOLERANCE, forward_curve_cache
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+# market_snapshot only returns the prebuilt string; building or rebuilding
+# it runs on a background thread, never on the caller's event loop
+TOOL_SPECS = [
+    ToolSpec("market_snapshot", cost_class="light"),
+    ToolSpec("forward_curve", cost_class="io", cacheable=True),
+    ToolSpec("spread_analysis", cost_class="io", cacheable=True),
+]
+
+STRUCTURE_NOTES = {
+    "contango": "Deferred months price above the front. Signals ample supply; storage plays (buy prompt, sell deferred) pay if the spread covers carrying costs.",
+    "backwardation": "Deferred months price below the front. Signals tight prompt supply; there is no incentive to store and inventories tend to draw.",
+    "flat": "Calendar spreads are within the flat tolerance; the market sees little difference between prompt and deferred supply.",
+    "mixed": "The curve changes direction. Look at where the spreads flip sign to see when the market expects the balance to turn.",
+}
+
+
+def register_market_structure_tools(mcp: "NorthMCPServer") -> None:
+    """
+    Register market structure tools with the MCP server.
+
+    Args:
+        mcp: The NorthMCPServer instance
+    """
+
+    @mcp.tool()
+    def market_snapshot() -> str:
+        """
+        Current WTI, Brent and Henry Hub prices at a glance.
+
+        Returns a pre-built snapshot with the latest EIA spot price, week-over-week
+        and month-over-month change, and 30-day volatility for each benchmark.
+        The snapshot is refreshed in the background after each EIA release, so
+        this is the fastest way to answer "where is the market now?". Right
+        after startup it may report that the snapshot is still warming up.
+
+        Returns:
+            Markdown table of benchmark prices with the snapshot timestamp
+        """
+        try:
+            snapshot = snapshot_store.current
+            if snapshot is None or snapshot_store.is_stale(snapshot):
+                # Serve what we have; the rebuild waits on EIA off the loop
+                snapshot_store.refresh_in_background()
+            if snapshot is not None:
+                return snapshot.rendered
+            if snapshot_store.last_error:
+                return f"❌ **Error**: Market snapshot unavailable: {snapshot_store.last_error}"
+            return (
+                "⏳ **Market snapshot warming up**: prices are being fetched from EIA. "
+                "Please retry in a few seconds."
+            )
+        except Exception as e:
+            logger.error("Market snapshot error: %s", e, exc_info=True)
+            return f"❌ **Snapshot Error**: {str(e)}"
+
+    @mcp.tool()
+    def forward_curve(
+        series_id: str = "WTIPUUS",
+        months: int = 12,
+        start: str = "",
+        flat_tolerance: float = DEFAULT_FLAT_TOLERANCE
+    ) -> str:
+        """
+        Build a monthly forward curve from the EIA STEO forecast and classify it.
+
+        Uses the Short-Term Energy Outlook price forecast as a monthly curve,
+        computes calendar spreads (each month minus the prior month) and
+        reports whether the curve is in contango, backwardation, flat or
+        mixed. Curves are cached until the next STEO release.
+
+        Args:
+            series_id: Monthly STEO price series (default: "WTIPUUS", WTI)
+            months: Number of monthly points on the curve (default: 12)
+            start: First month as "YYYY-MM" (default: the current STEO release month)
+            flat_tolerance: Calendar spread treated as flat, in price units
+                (default: 0.05)
+
+        Returns:
+            Curve table with calendar spreads and a structure summary
+
+        Example:
+            series_id="WTIPUUS", months=12
+            12-month WTI curve from the latest STEO with contango/backwardation call
+        """
+        logger.info("Forward curve: series=%s, months=%s, start='%s'", series_id, months, start)
+
+        try:
+            series_id = series_id.strip().upper()
+            curve = forward_curve_cache.get(
+                series_id,
+                lambda sid: get_series_cache().get(sid, frequency="monthly"),
+                start=start.strip() or None,
+                months=months,
+            )
+            structure = curve.structure(flat_tolerance)
+            units = SERIES_CATALOG.get(series_id, {}).get("units", "")
+            front_back = curve.back - curve.front
+
+            response = f"## Forward Curve: {series_id}\n\n"
+            response += f"**Source**: EIA STEO release {curve.release}\n"
+            response += f"**Months**: {curve.curve.index[0]} to {curve.curve.index[-1]}"
+            response += f" ({len(curve)} points{', ' + units if units else ''})\n"
+            response += f"**Structure**: {structure.capitalize()}\n\n"
+
+            response += f"| Month | Price | Calendar Spread |\n"
+            response += f"|-------|-------|-----------------|\n"
+            rows = [
+                f"| {month} | ${price:.2f} | {spread} |"
+                for month, price, spread in zip(
+                    curve.curve.index.astype(str),
+                    curve.curve.to_numpy(),
+                    ["—"] + [f"{s:+.2f}" for s in curve.spreads],
+                )
+            ]
+            response += "\n".join(rows) + "\n\n"
+
+            response += f"### Summary\n\n"
+            response += f"- **Front-to-back spread**: {front_back:+.2f} ({curve.front:.2f} → {curve.back:.2f})\n"
+            response += f"- **Average calendar spread**: {curve.spreads.mean():+.3f} per month\n"
+            response += f"- **Annualized carry**: {curve.annualized_carry()*100:+.1f}%\n"
+            response += f"- **Months rising / falling**: {(curve.spreads > flat_tolerance).sum()} / "
+            response += f"{(curve.spreads < -flat_tolerance).sum()}\n\n"
+            response += f"*{STRUCTURE_NOTES[structure]}*"
+
+            return response
+
+        except ValueError as e:
+            return f"❌ **Error**: {str(e)}"
+        except Exception as e:
+            logger.error("Forward curve error: %s", e, exc_info=True)
+            return f"❌ **Forward Curve Error**: {str(e)}"
+
+    @mcp.tool()
+    def spread_analysis(
+        spread: str = "brent-wti",
+        legs: str = "",
+        windows: str = "20,60",
+        history: int = 5
+    ) -> str:
+        """
+        Calculate an inter-market or crack spread with rolling statistics.
+
+        Fetches every leg from EIA (concurrently, reusing cached series),
+        aligns them on date, and computes the weighted spread with its
+        rolling mean, standard deviation and z-score.
+
+        Args:
+            spread: Named spread - "brent-wti", "3-2-1", "2-1-1",
+                "gasoline crack" or "diesel crack" (default: "brent-wti")
+            legs: Optional custom legs as SERIES:WEIGHT pairs, e.g.
+                "RBRTE:1,RWTC:-1" (overrides spread)
+            windows: Comma-separated rolling windows in observations (default: "20,60")
+            history: Number of recent observations to list (default: 5)
+
+        Returns:
+            Latest spread, leg prices, rolling statistics and recent history
+
+        Example:
+            spread="3-2-1"
+            NY Harbor 3-2-1 crack: (2 x gasoline + 1 x ULSD - 3 x WTI) / 3 in $/barrel
+        """
+        logger.info("Spread analysis: spread='%s', legs='%s', windows='%s'", spread, legs, windows)
+
+        try:
+            if legs.strip():
+                definition = {
+                    "name": "Custom Spread",
+                    "legs": parse_legs(legs),
+                    "divisor": 1.0,
+                    "units": "",
+                }
+            else:
+                definition = resolve_spread(spread)
+            leg_weights = definition["legs"]
+            divisor = definition["divisor"]
+            window_list = parse_windows(windows)
+            for window in window_list:
+                validate_window(window)
+
+            series = get_series_cache().get_many(series_id for series_id, _ in leg_weights)
+            frequencies = {series_id: s.frequency for series_id, s in series.items()}
+            if len(set(frequencies.values())) > 1:
+                mixed = ", ".join(f"{series_id} ({freq})" for series_id, freq in frequencies.items())
+                return (
+                    f"❌ **Error**: Spread legs must share one frequency; got {mixed}. "
+                    f"Use series with the same frequency for every leg"
+                )
+            frequency = next(iter(frequencies.values()))
+            frame = align_series(list(series.values()))
+            if len(frame) < 2:
+                return "❌ **Error**: The legs share fewer than 2 dates; check the series IDs"
+
+            values = compute_spread(frame, leg_weights, divisor)
+            engine = RollingEngine(values.to_numpy(), frequency=frequency)
+            latest = float(values.iloc[-1])
+            units = definition["units"] or SERIES_CATALOG.get(leg_weights[0][0], {}).get("units", "")
+
+            response = f"## {definition['name']}\n\n"
+            response += f"**Formula**: {describe_legs(leg_weights, divisor)}\n"
+            response += f"**Latest**: {latest:+.2f} {units} ({values.index[-1]})\n"
+            response += f"**Aligned Observations**: {len(values):,} ({values.index[0]} to {values.index[-1]})\n\n"
+
+            response += f"### Legs\n\n"
+            response += f"| Series | Name | Weight | Latest |\n"
+            response += f"|--------|------|--------|--------|\n"
+            for series_id, weight in leg_weights:
+                name = SERIES_CATALOG.get(series_id, {}).get("name", series_id)
+                response += f"| {series_id} | {name} | {weight:+g} | {frame[series_id].iloc[-1]:.3f} |\n"
+            response += "\n"
+
+            response += f"### Rolling Statistics\n\n"
+            response += f"| Window | Mean | Std Dev | Z-Score (latest) |\n"
+            response += f"|--------|------|---------|------------------|\n"
+            zscores = {}
+            for window in window_list:
+                mean, std = engine.mean(window), engine.std(window)
+                zscores[window] = engine.zscore(window)
+                response += (
+                    f"| {window_label(window, frequency)} | {mean[-1]:+.2f} | {std[-1]:.2f} | "
+                    f"{zscores[window][-1]:+.2f} |\n"
+                )
+            rank = float((values.to_numpy() <= latest).mean()) * 100
+            response += f"\n- **Full-sample range**: {values.min():+.2f} to {values.max():+.2f}"
+            response += f" (mean {values.mean():+.2f})\n"
+            response += f"- **Latest percentile rank**: {rank:.0f}%\n\n"
+
+            first = window_list[0]
+            recent = slice(max(len(values) - history, 0), len(values))
+            response += f"### Recent Values\n\n"
+            response += f"| Period | Spread | Z-Score ({window_label(first, frequency)}) |\n"
+            response += f"|--------|--------|---------|\n"
+            for period, value, z in zip(
+                values.index[recent], values.to_numpy()[recent], zscores[first][recent]
+            ):
+                z_text = f"{z:+.2f}" if np.isfinite(z) else "—"
+                response += f"| {period} | {value:+.2f} | {z_text} |\n"
+
+            return response
+
+        except ValueError as e:
+            return f"❌ **Error**: {str(e)}"
+        except Exception as e:
+            logger.error("Spread analysis error: %s", e, exc_info=True)
+            return f"❌ **Spread Analysis Error**: {str(e)}"
@@ -0,0 +1,322 @@
+"""
+Tool registry for Market Analysis Bot.
+Each tool module declares its tools as ToolSpec descriptors in TOOL_SPECS.
+register_all_tools hands every module a ToolRegistrar in place of the
+server, which wraps each tool in an async wrapper according to its spec:
+a concurrency limit that queues excess calls, io and compute calls awaited
+on their cost class's worker pool with a timeout, and a short-lived response cache for
+cacheable tools. Every call's latency, outcome and cache hits are recorded
+in utils.metrics, and every call runs in a root trace span; when spans are
+exported, its trace ID is appended to the response.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from north_mcp_python_sdk import NorthMCPServer
+
+from utils.metrics import metrics
+from utils import tracing
+from utils.tracing import Span, get_tracer
+
+logger = logging.getLogger(__name__)
+tracer = get_tracer(__name__)
+
+# Cost classes and the worker threads each runs its calls on. "light" tools
+# (lookups over in-memory data) run inline on the caller's thread
+COST_CLASSES = {
+    "light": 0,
+    "io": 8,
+    "compute": 2,
+}
+
+# Appended to tool responses while spans are being exported, so a slow or
+# failed call can be found in them; an HTML comment, so rendered markdown
+# is unchanged. Without an exporter responses are left as the tool wrote them
+TRACE_FOOTER = "\n\n<!-- trace_id: {trace_id} -->"
+
+# Responses of cacheable tools are reused for identical arguments this long
+RESPONSE_CACHE_SECONDS = 60.0
+RESPONSE_CACHE_SIZE = 256
+
+
+class ToolSpec:
+    """
+    Declarative metadata for one MCP tool.
+
+    Attributes:
+        name: Tool (function) name
+        cost_class: "light", "io" (waits on EIA) or "compute" (CPU-bound)
+        cacheable: Whether identical arguments may reuse a recent response;
+            only for tools whose output does not depend on the caller or on
+            randomness
+        timeout: Seconds a running io/compute call may take before the
+            caller gets a timeout error (the work itself is not interrupted
+            and keeps its slot until it finishes), and the longest a call
+            waits for a slot
+        max_concurrency: Calls allowed to run at once (at most the cost
+            class's pool size); further calls queue for a slot
+    """
+
+    def __init__(
+        self,
+        name: str,
+        cost_class: str = "light",
+        cacheable: bool = False,
+        timeout: float = 30.0,
+        max_concurrency: int = 8
+    ):
+        if cost_class not in COST_CLASSES:
+            raise ValueError(f"Unknown cost class '{cost_class}'. Use one of: {', '.join(COST_CLASSES)}")
+        if timeout <= 0 or max_concurrency < 1:
+            raise ValueError(f"Tool '{name}' needs a positive timeout and max_concurrency")
+        self.name = name
+        self.cost_class = cost_class
+        self.cacheable = cacheable
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+
+    def __repr__(self) -> str:
+        return (
+            f"ToolSpec(name='{self.name}', cost_class='{self.cost_class}', "
+            f"cacheable={self.cacheable}, timeout={self.timeout}, "
+            f"max_concurrency={self.max_concurrency})"
+        )
+
+
+# Every tool registered with the server, by name
+TOOL_REGISTRY: Dict[str, ToolSpec] = {}
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executor_lock = threading.Lock()
+
+
+def _executor(cost_class: str) -> ThreadPoolExecutor:
+    executor = _executors.get(cost_class)
+    if executor is None:
+        with _executor_lock:
+            executor = _executors.get(cost_class)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=COST_CLASSES[cost_class],
+                    thread_name_prefix=f"tool-{cost_class}",
+                )
+                _executors[cost_class] = executor
+    return executor
+
+
+class ResponseCache:
+    """
+    Bounded LRU of tool responses with a time-to-live.
+
+    Attributes:
+        ttl: Seconds a response stays valid
+        maxsize: Most responses kept
+    """
+
+    def __init__(self, ttl: float = RESPONSE_CACHE_SECONDS, maxsize: int = RESPONSE_CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def wrap_tool(func: Callable[..., str], spec: ToolSpec) -> Callable[..., Awaitable[str]]:
+    """
+    Apply a spec's concurrency limit, timeout and response cache to a tool.
+
+    The wrapper is a coroutine function: the server awaits it on its event
+    loop, so io and compute tools run on their worker pool while the loop
+    keeps serving other requests. Calls beyond the concurrency limit queue
+    for a slot (for up to `timeout`); the timeout on the work itself starts
+    once the call is running on a worker, and only stops the waiting.
+    It keeps the tool's name, docstring and signature, so the server
+    generates the same schema. Limits that are hit come back as the usual
+    "❌ **Error**" markdown rather than exceptions.
+    """
+    workers = COST_CLASSES[spec.cost_class]
+    # Never admit more calls than the class's pool can run at once, so an
+    # admitted call does not sit in the pool queue behind its own tool
+    limit = min(spec.max_concurrency, workers) if workers else spec.max_concurrency
+    slots = asyncio.Semaphore(limit)
+    cache = ResponseCache() if spec.cacheable else None
+
+    async def call(args: tuple, kwargs: dict) -> str:
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=spec.timeout)
+        except asyncio.TimeoutError:
+            logger.warning("%s: no free slot within %.0fs", spec.name, spec.timeout)
+            return (
+                f"❌ **Error**: `{spec.name}` is busy ({limit} calls already running "
+                f"for {spec.timeout:.0f} seconds). Please retry shortly."
+            )
+
+        if not workers:
+            try:
+                return func(*args, **kwargs)
+            finally:
+                slots.release()
+
+        loop = asyncio.get_running_loop()
+        started = loop.create_future()
+
+        def run() -> str:
+            loop.call_soon_threadsafe(lambda: started.done() or started.set_result(None))
+            return func(*args, **kwargs)
+
+        # Copy the context so the authenticated user and trace span are
+        # visible on the worker
+        context = contextvars.copy_context()
+        try:
+            future = asyncio.wrap_future(_executor(spec.cost_class).submit(context.run, run))
+        except RuntimeError:
+            # Pool shut down (interpreter exit): release the slot and give up
+            slots.release()
+            raise
+        # The slot is held until the work finishes (or is cancelled before
+        # starting), even if the caller has stopped waiting
+        future.add_done_callback(lambda _: slots.release())
+
+        # Time spent queued behind other tools of the same class does not
+        # count toward the timeout
+        await asyncio.wait([started, future], return_when=asyncio.FIRST_COMPLETED)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=spec.timeout)
+        except asyncio.TimeoutError:
+            logger.warning("%s: timed out after %.0fs", spec.name, spec.timeout)
+            return (
+                f"❌ **Error**: `{spec.name}` did not finish within {spec.timeout:.0f} seconds. "
+                f"Try a smaller request."
+            )
+
+    async def respond(args: tuple, kwargs: dict, span: Span) -> str:
+        key = None
+        if cache is not None:
+            key = (args, tuple(sorted(kwargs.items())))
+            try:
+                cached = cache.get(key)
+            except TypeError:
+                # Unhashable arguments are never cached
+                key = cached = None
+            if cached is not None:
+                logger.debug("%s: response cache hit", spec.name)
+                metrics.record_tool_cache_hit(spec.name)
+                span.set_attribute("tool.cache_hit", True)
+                return cached
+
+        start = time.perf_counter()
+        try:
+            result = await call(args, kwargs)
+        except Exception:
+            metrics.record_tool_call(spec.name, time.perf_counter() - start, error=True)
+            raise
+        elapsed = time.perf_counter() - start
+        # Tools report failures as "❌ **Error**" markdown rather than raising
+        failed = isinstance(result, str) and result.startswith("❌")
+        metrics.record_tool_call(spec.name, elapsed, error=failed)
+        logger.debug("%s (%s) took %.1f ms", spec.name, spec.cost_class, elapsed * 1000)
+        if failed:
+            span.set_status("ERROR", result.split("\n", 1)[0])
+
+        if key is not None and not failed:
+            cache.put(key, result)
+        return result
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs) -> str:
+        attributes = {"tool.name": spec.name, "tool.cost_class": spec.cost_class, "tool.cache_hit": False}
+        with tracer.start_as_current_span(f"tool.{spec.name}", attributes) as span:
+            result = await respond(args, kwargs, span)
+        if isinstance(result, str) and tracing.exporting():
+            result += TRACE_FOOTER.format(trace_id=span.trace_id)
+        return result
+
+    wrapper.tool_spec = spec
+    return wrapper
+
+
+class ToolRegistrar:
+    """
+    Stand-in for the MCP server passed to a module's register function.
+
+    `registrar.tool()` wraps each tool with its ToolSpec before handing it
+    to the real `mcp.tool()`. Tools without a spec are registered with
+    the defaults (light, not cacheable) and logged.
+
+    Attributes:
+        mcp: The NorthMCPServer instance
+        specs: The module's ToolSpecs by name
+        registered: Specs of the tools registered through this registrar
+    """
+
+    def __init__(self, mcp: "NorthMCPServer", specs: Iterable[ToolSpec] = ()):
+        self.mcp = mcp
+        self.specs = {spec.name: spec for spec in specs}
+        self.registered: Dict[str, ToolSpec] = {}
+
+    def tool(self, *args, **kwargs) -> Callable[[Callable[..., str]], Callable[..., str]]:
+        register = self.mcp.tool(*args, **kwargs)
+
+        def decorator(func: Callable[..., str]) -> Callable[..., str]:
+            spec = self.specs.get(func.__name__)
+            if spec is None:
+                logger.warning("Tool '%s' has no ToolSpec; using defaults", func.__name__)
+                spec = ToolSpec(func.__name__)
+            self.registered[spec.name] = spec
+            return register(wrap_tool(func, spec))
+
+        return decorator
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything other than tool() goes straight to the server
+        return getattr(self.mcp, name)
+
+
+def register_module(mcp: "NorthMCPServer", register: Callable, specs: Iterable[ToolSpec]) -> Dict[str, ToolSpec]:
+    """
+    Run one module's register function through a ToolRegistrar.
+
+    Returns:
+        Specs of the tools the module registered, also added to TOOL_REGISTRY
+
+    Raises:
+        Whatever the module's register function raises; nothing is added
+        to TOOL_REGISTRY in that case
+    """
+    registrar = ToolRegistrar(mcp, specs)
+    register(registrar)
+    for name in registrar.specs.keys() - registrar.registered.keys():
+        logger.warning("ToolSpec '%s' declared but no such tool was registered", name)
+    TOOL_REGISTRY.update(registrar.registered)
+    return registrar.registered
@@ -0,0 +1,45 @@
+"""
+Server Stats Tool - Per-tool latency, throughput and error metrics.
+"""
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from north_mcp_python_sdk import NorthMCPServer
+
+from tools.registry import ToolSpec
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+TOOL_SPECS = [
+    ToolSpec("server_stats"),
+]
+
+
+def register_server_stats_tool(mcp: "NorthMCPServer") -> None:
+    """
+    Register the server_stats tool with the MCP server.
+
+    Args:
+        mcp: The NorthMCPServer instance
+    """
+
+    @mcp.tool()
+    def server_stats() -> str:
+        """
+        Show which tools are slow, busy or failing.
+
+        Reports per-tool call counts, errors, response cache hits and
+        p50/p95/p99 latency, EIA API latency per path, and the series cache
+        hit rate since the server started. Over HTTP the same metrics are
+        served in Prometheus format at /metrics.
+
+        Returns:
+            Markdown tables of tool and EIA API metrics
+        """
+        logger.info("Server stats requested")
+        return metrics.render_markdown()
+
+    logger.debug("Server stats tool registered")
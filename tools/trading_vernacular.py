@@ -3,106 +3,70 @@ Trading Vernacular - Explanations of energy trading terminology.
 """
 
 import logging
-from typing import TYPE_CHECKING
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from north_mcp_python_sdk import NorthMCPServer
 
+from tools.registry import ToolSpec
+from utils.glossary import CATEGORY_SECTIONS, CompiledGlossary, GlossaryStore
+from utils.term_search import TermMatch
+
 logger = logging.getLogger(__name__)
 
-# Energy trading glossary
-GLOSSARY = {
-    "wti": {
-        "full_name": "West Texas Intermediate",
-        "definition": "Light, sweet crude oil benchmark priced at Cushing, Oklahoma. Primary US oil price reference.",
-        "context": "Trading: 'WTI futures' refers to NYMEX contracts. 'WTI spot' is physical oil at Cushing."
-    },
-    "brent": {
-        "full_name": "Brent Crude",
-        "definition": "Global oil price benchmark from North Sea production. Priced at ICE exchange.",
-        "context": "Trading: Brent is the international standard. Typically trades at premium to WTI."
-    },
-    "crack spread": {
-        "full_name": "Crack Spread",
-        "definition": "Difference between crude oil price and refined product prices (gasoline, diesel).",
-        "context": "Trading: Refiners monitor crack spreads to assess profitability. '3-2-1 crack' = 3 barrels crude to 2 gasoline, 1 diesel."
-    },
-    "contango": {
-        "full_name": "Contango",
-        "definition": "Market condition where future prices are higher than spot prices.",
-        "context": "Trading: Indicates excess supply or storage costs. Traders can profit by buying spot, selling futures, and storing."
-    },
-    "backwardation": {
-        "full_name": "Backwardation",
-        "definition": "Market condition where future prices are lower than spot prices.",
-        "context": "Trading: Indicates tight supply. No incentive to store. Immediate demand exceeds future expectations."
-    },
-    "eia": {
-        "full_name": "U.S. Energy Information Administration",
-        "definition": "Federal agency providing energy data, forecasts, and analysis.",
-        "context": "Trading: EIA weekly petroleum reports (Wed 10:30 AM ET) are market-moving events. Track inventory levels closely."
-    },
-    "opec": {
-        "full_name": "Organization of Petroleum Exporting Countries",
-        "definition": "Cartel of oil-producing nations coordinating production policy.",
-        "context": "Trading: OPEC+ meetings drive market volatility. Production cuts/increases directly impact prices."
-    },
-    "cushing": {
-        "full_name": "Cushing, Oklahoma",
-        "definition": "Major oil storage hub and delivery point for NYMEX WTI futures contracts.",
-        "context": "Trading: Cushing inventory levels signal US supply tightness. Low storage = bullish. High storage = bearish."
-    },
-    "nymex": {
-        "full_name": "New York Mercantile Exchange",
-        "definition": "Primary commodity futures exchange for WTI crude and natural gas.",
-        "context": "Trading: WTI futures (CL contract) trade on NYMEX. Contract size: 1,000 barrels. Tick: $0.01/barrel = $10."
-    },
-    "henry hub": {
-        "full_name": "Henry Hub",
-        "definition": "Natural gas pipeline hub in Louisiana. Pricing point for NYMEX gas futures.",
-        "context": "Trading: NG contract settled at Henry Hub. Regional basis differentials affect local gas pricing."
-    },
-    "mcf": {
-        "full_name": "Thousand Cubic Feet",
-        "definition": "Unit of natural gas volume measurement. 1 MCF ≈ 1 MMBtu.",
-        "context": "Trading: Natural gas priced in $/MMBtu. Production reported in MCF or BCF (billion cubic feet)."
-    },
-    "mmbtu": {
-        "full_name": "Million British Thermal Units",
-        "definition": "Energy content measurement for natural gas. Standard trading unit.",
-        "context": "Trading: Henry Hub futures quoted in $/MMBtu. 1 MMBtu ≈ 1 MCF for pipeline-quality gas."
-    },
-    "strip": {
-        "full_name": "Calendar Strip",
-        "definition": "Series of futures contracts spanning a time period (month, quarter, year).",
-        "context": "Trading: 'Buying the 2026 strip' = buying all 12 monthly contracts for 2026. Provides price certainty."
-    },
-    "basis": {
-        "full_name": "Basis Differential",
-        "definition": "Price difference between local market and benchmark (e.g., WTI minus Houston crude).",
-        "context": "Trading: Basis risk affects hedging. Narrow basis = strong local market. Wide basis = weak local demand."
-    },
-    "arb": {
-        "full_name": "Arbitrage",
-        "definition": "Exploiting price differences between related markets or contracts.",
-        "context": "Trading: 'Brent-WTI arb' = spread between benchmarks. 'Time arb' = contango/backwardation play."
-    },
-    "prompt": {
-        "full_name": "Prompt Month",
-        "definition": "Nearest futures contract month. Most liquid and actively traded.",
-        "context": "Trading: Prompt WTI = front-month contract. Price most sensitive to immediate supply/demand."
-    },
-    "long": {
-        "full_name": "Long Position",
-        "definition": "Owning an asset or futures contract. Profits when price rises.",
-        "context": "Trading: 'Long 100 WTI' = own 100 contracts (100,000 barrels). Bullish position."
-    },
-    "short": {
-        "full_name": "Short Position",
-        "definition": "Selling an asset you don't own or selling futures. Profits when price falls.",
-        "context": "Trading: 'Short 50 NG' = sold 50 contracts without owning. Bearish position. Must buy back to close."
-    }
-}
+TOOL_SPECS = [
+    ToolSpec("explain_trading_term"),
+    ToolSpec("explain_trading_terms"),
+    ToolSpec("list_trading_terms"),
+]
+
+# A fuzzy match is shown directly when it scores at least this and leads the
+# runner-up by the margin; otherwise the ranked suggestions are returned
+AUTO_RESOLVE_SCORE = 0.6
+AUTO_RESOLVE_MARGIN = 0.15
+SUGGESTION_LIMIT = 5
+SUGGESTION_MIN_SCORE = 0.5
+
+# Batch explanations: most terms returned, and the longest list item (in
+# words) that is fuzzy-matched when the automaton finds nothing in it
+MAX_BATCH_TERMS = 20
+MAX_LIST_ITEM_WORDS = 3
+_LIST_SEPARATORS = re.compile(r"[,;\n]")
+
+# Energy trading glossary data; set GLOSSARY_PATH to serve another file.
+# Edits to the file are picked up without a restart.
+GLOSSARY_FILE = Path(__file__).parent / "data" / "glossary.json"
+
+glossary_store = GlossaryStore(os.getenv("GLOSSARY_PATH") or GLOSSARY_FILE)
+
+
+def __getattr__(name: str):
+    # GLOSSARY stays importable as a read-only {term: entry} mapping of the
+    # currently loaded data file
+    if name == "GLOSSARY":
+        return glossary_store.get().entries
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _closest_term(compiled: CompiledGlossary, term: str) -> Tuple[Optional[str], List[TermMatch]]:
+    """
+    Resolve a term by exact lookup, then by an unambiguous fuzzy match.
+
+    Returns:
+        (glossary key or None, ranked fuzzy matches; empty on an exact hit)
+    """
+    term_key = compiled.lookup(term)
+    if term_key is not None:
+        return term_key, []
+    matches = compiled.search_index.search(term, limit=SUGGESTION_LIMIT, min_score=SUGGESTION_MIN_SCORE)
+    if matches and matches[0].score >= AUTO_RESOLVE_SCORE and (
+        len(matches) == 1 or matches[0].score - matches[1].score >= AUTO_RESOLVE_MARGIN
+    ):
+        return matches[0].key, matches
+    return None, matches
 
 
 def register_vernacular_tool(mcp: "NorthMCPServer") -> None:
@@ -112,6 +76,9 @@ def register_vernacular_tool(mcp: "NorthMCPServer") -> None:
     Args:
         mcp: The NorthMCPServer instance
     """
+    # Load (and compile) the glossary at registration; the tools then only
+    # look up pre-built markdown from the current version
+    glossary_store.get()
     
     @mcp.tool()
     def explain_trading_term(term: str) -> str:
@@ -119,7 +86,9 @@ def register_vernacular_tool(mcp: "NorthMCPServer") -> None:
         Explain energy trading terminology and jargon.
         
         Provides definitions, full names, and context for common terms
-        used in oil and natural gas trading.
+        used in oil and natural gas trading. Accepts aliases (e.g., "CL",
+        "NG", "HH", "3-2-1") and tolerates typos: a clear closest match is
+        explained directly, otherwise ranked suggestions are returned.
         
         Args:
             term: Trading term to explain (e.g., "wti", "contango", "crack spread")
@@ -130,32 +99,92 @@ def register_vernacular_tool(mcp: "NorthMCPServer") -> None:
         Example:
             term="contango" -> Explains market structure and trading implications
         """
-        logger.info(f"Vernacular lookup: {term}")
-        
-        # Normalize term
-        term_key = term.lower().strip()
-        
-        if term_key in GLOSSARY:
-            entry = GLOSSARY[term_key]
-            
-            response = f"## {entry['full_name']}\n\n"
-            response += f"**Term**: `{term}`\n\n"
-            response += f"### Definition\n{entry['definition']}\n\n"
-            response += f"### Trading Context\n{entry['context']}\n"
-            
-            return response
-        else:
-            # Provide helpful response with available terms
-            available = list(GLOSSARY.keys())[:10]  # First 10 terms
-            
-            response = f"❓ **Term not found**: `{term}`\n\n"
-            response += f"### Available Terms\n"
-            response += f"Try these common trading terms:\n"
-            for t in available:
-                response += f"- `{t}`\n"
-            response += f"\n*Total terms in glossary: {len(GLOSSARY)}*"
-            
+        logger.info("Vernacular lookup: %s", term)
+        compiled = glossary_store.get()
+        
+        # Exact key, full name or alias first; then the best fuzzy match if it is unambiguous
+        term_key, matches = _closest_term(compiled, term)
+        if term_key is not None and not matches:
+            return compiled.rendered[term_key]
+        
+        if term_key is not None:
+            response = f"*Closest match for `{term}`: `{term_key}`*\n\n{compiled.rendered[term_key]}"
+            others = matches[1:]
+            if others:
+                response += f"\n*Also similar: {', '.join(f'`{m.key}`' for m in others)}*\n"
             return response
+        
+        response = f"❓ **Term not found**: `{term}`\n\n"
+        if not matches:
+            return response + compiled.fallback
+        
+        response += f"### Did You Mean?\n"
+        for match in matches:
+            response += f"- `{match.key}` - {compiled.entries[match.key]['full_name']}"
+            response += f" (matched \"{match.matched}\", {match.score:.0%})\n"
+        response += f"\n*Total terms in glossary: {len(compiled)}*"
+        
+        return response
+    
+    @mcp.tool()
+    def explain_trading_terms(text: str) -> str:
+        """
+        Explain every trading term in a sentence or list in one call.
+        
+        Scans the text once for all glossary terms, full names and aliases
+        (e.g., "Brent-WTI", "CL", "HH", "3-2-1") and returns all their
+        explanations together. Short comma-separated items that match
+        nothing are resolved like explain_trading_term, so typos in a term
+        list still work.
+        
+        Args:
+            text: Free text (e.g., "the Brent-WTI arb widened as Cushing drew")
+                or a comma-separated list of terms (e.g., "CL, contango, HH")
+        
+        Returns:
+            Explanations of every term found, in order of first mention
+            (fuzzy-matched list items last)
+        
+        Example:
+            text="the Brent-WTI arb widened as Cushing drew and the prompt went into backwardation"
+            -> Explains arb, cushing, prompt and backwardation
+        """
+        logger.info("Batch vernacular lookup: %s chars", len(text))
+        compiled = glossary_store.get()
+        
+        mentions = {}
+        for surface, key in compiled.find_terms(text):
+            mentions.setdefault(key, []).append(surface)
+        
+        not_found = []
+        if _LIST_SEPARATORS.search(text):
+            for item in (i.strip() for i in _LIST_SEPARATORS.split(text)):
+                if not item or len(item.split()) > MAX_LIST_ITEM_WORDS or compiled.find_terms(item):
+                    continue
+                term_key, _ = _closest_term(compiled, item)
+                if term_key is None:
+                    not_found.append(item)
+                else:
+                    mentions.setdefault(term_key, []).append(f"{item} (closest match)")
+        
+        if not mentions:
+            response = f"❓ **No trading terms found** in the text\n\n"
+            if not_found:
+                response += f"**Not recognized**: {', '.join(f'`{item}`' for item in not_found)}\n\n"
+            return response + compiled.fallback
+        
+        keys = list(mentions)[:MAX_BATCH_TERMS]
+        response = f"## Trading Terms Explained ({len(keys)})\n\n"
+        response += "\n".join(
+            f"- `{key}`: {', '.join(dict.fromkeys(mentions[key]))}" for key in keys
+        ) + "\n"
+        if len(mentions) > MAX_BATCH_TERMS:
+            response += f"\n*Showing the first {MAX_BATCH_TERMS} of {len(mentions)} terms.*\n"
+        if not_found:
+            response += f"\n**Not recognized**: {', '.join(f'`{item}`' for item in not_found)}\n"
+        response += "\n---\n\n" + "\n---\n\n".join(compiled.rendered[key] for key in keys)
+        
+        return response
     
     @mcp.tool()
     def list_trading_terms(category: str = "all") -> str:
@@ -163,7 +192,8 @@ def register_vernacular_tool(mcp: "NorthMCPServer") -> None:
         List available trading terms in the glossary.
         
         Args:
-            category: Filter by category - "all", "benchmarks", "concepts", or "measurements"
+            category: Filter by category - "all", "benchmarks", "concepts",
+                "measurements", "organizations" or "positions"
         
         Returns:
             Organized list of available terms
@@ -171,54 +201,16 @@ def register_vernacular_tool(mcp: "NorthMCPServer") -> None:
         Example:
             category="benchmarks" -> Lists WTI, Brent, Henry Hub, etc.
         """
-        logger.info(f"Listing terms: category={category}")
-        
-        # Categorize terms
-        benchmarks = ["wti", "brent", "henry hub", "cushing", "nymex"]
-        concepts = ["contango", "backwardation", "crack spread", "basis", "arb", "strip", "prompt"]
-        measurements = ["mcf", "mmbtu"]
-        organizations = ["eia", "opec"]
-        positions = ["long", "short"]
-        
-        response = "## Energy Trading Glossary\n\n"
-        
-        if category == "all" or category == "benchmarks":
-            response += "### 📊 Benchmarks & Markets\n"
-            for term in benchmarks:
-                if term in GLOSSARY:
-                    response += f"- **{term}**: {GLOSSARY[term]['full_name']}\n"
-            response += "\n"
-        
-        if category == "all" or category == "concepts":
-            response += "### 💡 Trading Concepts\n"
-            for term in concepts:
-                if term in GLOSSARY:
-                    response += f"- **{term}**: {GLOSSARY[term]['definition'][:60]}...\n"
-            response += "\n"
-        
-        if category == "all" or category == "measurements":
-            response += "### 📏 Measurements\n"
-            for term in measurements:
-                if term in GLOSSARY:
-                    response += f"- **{term}**: {GLOSSARY[term]['full_name']}\n"
-            response += "\n"
-        
-        if category == "all":
-            response += "### 🏢 Organizations\n"
-            for term in organizations:
-                if term in GLOSSARY:
-                    response += f"- **{term}**: {GLOSSARY[term]['full_name']}\n"
-            response += "\n"
-            
-            response += "### 📈 Positions\n"
-            for term in positions:
-                if term in GLOSSARY:
-                    response += f"- **{term}**: {GLOSSARY[term]['full_name']}\n"
-            response += "\n"
-        
-        response += f"*Use `explain_trading_term` to get detailed explanations.*"
-        
-        return response
+        logger.info("Listing terms: category=%s", category)
+        compiled = glossary_store.get()
+        
+        listing = compiled.listing(category)
+        if listing is None:
+            return (
+                f"❌ **Error**: Unknown category '{category}'. "
+                f"Use one of: all, {', '.join(CATEGORY_SECTIONS)}"
+            )
+        return listing
     
     logger.debug("Trading vernacular tool registered")
 
@@ -0,0 +1,303 @@
+"""
+Mergeable streaming statistics for Market Analysis Bot.
+Single-pass moments (Welford/Chan) and a t-digest quantile sketch that can be
+updated chunk by chunk and merged across chunks, threads or worker processes.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Iterable, Optional, Sequence
+
+from utils.lazy import lazy_import
+from utils.quantiles import batch_quantiles
+
+np = lazy_import("numpy")
+
+
+logger = logging.getLogger(__name__)
+
+
+# Values processed per step when consuming large arrays, sized so each chunk
+# stays cache-resident while every statistic is updated from it
+CHUNK_SIZE = 65536
+
+
+class MomentAccumulator:
+    """
+    Running count, mean, variance, min and max.
+
+    Chunks are reduced with NumPy and combined with Chan's parallel update
+    of Welford's algorithm, so merging two accumulators is exact and
+    order-independent up to floating point rounding.
+
+    Attributes:
+        count: Number of observations
+        mean: Running mean
+        m2: Sum of squared deviations from the mean
+        min: Smallest observation
+        max: Largest observation
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values: np.ndarray) -> "MomentAccumulator":
+        """Add a chunk of observations."""
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return self
+        chunk_mean = float(values.mean())
+        deltas = values - chunk_mean
+        self._combine(
+            values.size,
+            chunk_mean,
+            float(np.dot(deltas, deltas)),
+            float(values.min()),
+            float(values.max()),
+        )
+        return self
+
+    def merge(self, other: "MomentAccumulator") -> "MomentAccumulator":
+        """Fold another accumulator into this one."""
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+
+    def _combine(self, count: int, mean: float, m2: float, low: float, high: float) -> None:
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+
+    def variance(self, ddof: int = 0) -> float:
+        """Variance (population by default, matching np.var)."""
+        if self.count - ddof <= 0:
+            return float("nan")
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> float:
+        """Standard deviation (population by default, matching np.std)."""
+        return float(np.sqrt(self.variance(ddof)))
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch (merging t-digest).
+
+    Observations are kept verbatim until exact_limit is exceeded, so small
+    and medium datasets get exact quantiles. Beyond that they are compressed
+    into at most ~compression/2 weighted centroids using the arcsine scale
+    function, which keeps tail quantiles accurate.
+
+    Attributes:
+        compression: t-digest compression parameter (delta)
+        exact_limit: Maximum observations kept verbatim before compressing
+    """
+
+    def __init__(self, compression: int = 200, exact_limit: int = 100_000):
+        self.compression = compression
+        self.exact_limit = exact_limit
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._pending: list = []
+        self._pending_count = 0
+        self._compressed = False
+
+    @property
+    def count(self) -> float:
+        """Total weight (number of observations) in the sketch."""
+        return float(self._weights.sum()) + self._pending_count
+
+    @property
+    def is_exact(self) -> bool:
+        """True while quantiles are computed from the raw observations."""
+        return not self._compressed
+
+    def update(self, values: np.ndarray) -> "QuantileSketch":
+        """Add a chunk of observations."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size:
+            self._pending.append(values)
+            self._pending_count += values.size
+            if self._pending_count > self._buffer_limit():
+                self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Fold another sketch into this one."""
+        if other._weights.size:
+            self._compressed = True
+            self._means = np.concatenate((self._means, other._means))
+            self._weights = np.concatenate((self._weights, other._weights))
+        self._pending.extend(other._pending)
+        self._pending_count += other._pending_count
+        if self._compressed or self._pending_count > self._buffer_limit():
+            self._compress()
+        return self
+
+    def _buffer_limit(self) -> int:
+        """Pending observations allowed before compressing."""
+        return self.exact_limit if not self._compressed else 20 * self.compression
+
+    def _compress(self) -> None:
+        """Merge pending observations and centroids into a compact digest."""
+        means = np.concatenate([self._means] + self._pending)
+        weights = np.concatenate(
+            [self._weights] + [np.ones(chunk.size) for chunk in self._pending]
+        )
+        self._pending = []
+        self._pending_count = 0
+        self._compressed = True
+        if means.size == 0:
+            return
+
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        cumulative = np.cumsum(weights)
+        q_mid = (cumulative - weights / 2.0) / total
+
+        # Arcsine scale: each centroid spans at most one unit of k
+        k = self.compression / (2.0 * np.pi) * np.arcsin(2.0 * q_mid - 1.0)
+        cluster = np.floor(k + self.compression / 4.0).astype(np.int64)
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(cluster)) + 1))
+
+        self._weights = np.add.reduceat(weights, starts)
+        self._means = np.add.reduceat(means * weights, starts) / self._weights
+
+    def quantiles(
+        self,
+        probs: Sequence[float],
+        low: Optional[float] = None,
+        high: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Estimate quantiles (linear interpolation, matching np.quantile when exact).
+
+        Args:
+            probs: Probabilities in [0, 1]
+            low: Known minimum used to anchor the lower tail
+            high: Known maximum used to anchor the upper tail
+
+        Returns:
+            Array of quantile estimates, one per probability
+        """
+        probs = np.asarray(probs, dtype=np.float64)
+        if self.count == 0:
+            return np.full(probs.shape, np.nan)
+
+        if not self._compressed:
+            data = self._pending[0] if len(self._pending) == 1 else np.concatenate(self._pending)
+            return batch_quantiles(data, probs)
+
+        if self._pending:
+            self._compress()
+
+        weights = self._weights
+        n = weights.sum()
+        # Position of each centroid's center on the 0..n-1 rank scale
+        centers = np.cumsum(weights) - weights + (weights - 1.0) / 2.0
+        positions, values = centers, self._means
+        if low is not None and centers[0] > 0:
+            positions = np.concatenate(([0.0], positions))
+            values = np.concatenate(([low], values))
+        if high is not None and positions[-1] < n - 1:
+            positions = np.concatenate((positions, [n - 1.0]))
+            values = np.concatenate((values, [high]))
+
+        return np.interp(probs * (n - 1), positions, values)
+
+
+class StreamingStats:
+    """
+    One-pass summary statistics that can be merged across chunks and workers.
+
+    Combines a MomentAccumulator and a QuantileSketch. Large arrays are
+    consumed in cache-sized chunks so each chunk is read from memory once
+    for all statistics.
+
+    Example:
+        >>> stats = StreamingStats()
+        >>> for chunk in chunks:
+        ...     stats.update(chunk)
+        >>> stats.summary()["median"]
+    """
+
+    def __init__(self, compression: int = 200, exact_limit: int = 100_000):
+        self.moments = MomentAccumulator()
+        self.sketch = QuantileSketch(compression, exact_limit)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray, **kwargs) -> "StreamingStats":
+        """Build statistics for a single array."""
+        return cls(**kwargs).update(values)
+
+    @classmethod
+    def combine(cls, parts: Iterable["StreamingStats"]) -> "StreamingStats":
+        """Merge partial statistics (e.g., one per chunk or worker)."""
+        combined = cls()
+        for part in parts:
+            combined.merge(part)
+        return combined
+
+    @property
+    def count(self) -> int:
+        return self.moments.count
+
+    @property
+    def is_exact(self) -> bool:
+        """True when quantiles are exact rather than sketched."""
+        return self.sketch.is_exact
+
+    def update(self, values: np.ndarray) -> "StreamingStats":
+        """Add observations, processing large arrays chunk by chunk."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        for start in range(0, values.size, CHUNK_SIZE):
+            chunk = values[start:start + CHUNK_SIZE]
+            self.moments.update(chunk)
+            self.sketch.update(chunk)
+        return self
+
+    def merge(self, other: "StreamingStats") -> "StreamingStats":
+        """Fold another StreamingStats into this one."""
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def quantiles(self, probs: Sequence[float]) -> np.ndarray:
+        """Quantiles for the given probabilities, anchored at the observed min/max."""
+        return self.sketch.quantiles(probs, self.moments.min, self.moments.max)
+
+    def summary(self, probs: Sequence[float] = ()) -> Dict[str, float]:
+        """
+        Summary statistics.
+
+        Args:
+            probs: Extra probabilities to report as "q<prob>" keys
+
+        Returns:
+            Dict with count, mean, median, std, min, max, range and any
+            requested quantiles
+        """
+        probs = list(probs)
+        estimates = self.quantiles([0.5] + probs)
+        result = {
+            "count": self.moments.count,
+            "mean": self.moments.mean,
+            "median": float(estimates[0]),
+            "std": self.moments.std(),
+            "min": self.moments.min,
+            "max": self.moments.max,
+            "range": self.moments.max - self.moments.min,
+        }
+        for prob, estimate in zip(probs, estimates[1:]):
+            result[f"q{prob:g}"] = float(estimate)
+        return result
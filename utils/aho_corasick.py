@@ -0,0 +1,94 @@
+"""
+Aho-Corasick multi-pattern matcher for Market Analysis Bot.
+Finds every occurrence of a fixed set of phrases in a text in one pass,
+independent of how many phrases there are. Used to pick glossary terms out
+of free text.
+"""
+
+import logging
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class AhoCorasick:
+    """
+    Automaton over a set of (pattern, value) pairs.
+
+    Built once as a character trie with failure links; each state's output
+    list holds every pattern ending there, including those reached through
+    failure links. Plain lists and dicts, so it pickles with the compiled
+    glossary.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]
+
+        for pattern, value in patterns:
+            if pattern:
+                self._insert(pattern, value)
+        self._build_failure_links()
+
+    def _insert(self, pattern: str, value: Any) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append((len(pattern), value))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Yield every pattern occurrence as (start, end, value), overlaps included.
+
+        Matches are yielded in order of their end position.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in out[state]:
+                yield index + 1 - length, index + 1, value
+
+    def __len__(self) -> int:
+        """Number of automaton states."""
+        return len(self._goto)
+
+
+def select_longest(matches: Iterable[Tuple[int, int, Any]]) -> List[Tuple[int, int, Any]]:
+    """
+    Leftmost-longest non-overlapping subset of matches, in text order.
+
+    "crack spread" wins over "crack" at the same position; a match that
+    overlaps an earlier selected one is dropped.
+    """
+    selected = []
+    last_end = 0
+    for start, end, value in sorted(matches, key=lambda m: (m[0], m[0] - m[1])):
+        if start >= last_end:
+            selected.append((start, end, value))
+            last_end = end
+    return selected
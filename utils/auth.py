@@ -6,6 +6,8 @@ Provides helpers for accessing authenticated user information.
 import logging
 from typing import Optional, Dict, Any
 
+from utils.tracing import get_tracer
+
 # Import from North MCP SDK
 try:
     from north_mcp_python_sdk import get_authenticated_user as _get_authenticated_user
@@ -15,6 +17,7 @@ except ImportError:
 
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer(__name__)
 
 
 class AuthenticatedUser:
@@ -62,13 +65,21 @@ def get_authenticated_user() -> Optional[AuthenticatedUser]:
         def my_tool(param: str) -> str:
             user = get_authenticated_user()
             if user:
-                logger.info(f"Tool called by: {user.email}")
+                logger.info("Tool called by: %s", user.email)
                 # Access OAuth tokens if needed
                 if user.has_connector("google"):
                     google_token = user.get_connector_token("google")
             return "Result"
         ```
     """
+    with tracer.start_as_current_span("auth.get_user") as span:
+        user = _lookup_authenticated_user()
+        span.set_attribute("auth.authenticated", user is not None)
+        return user
+
+
+def _lookup_authenticated_user() -> Optional[AuthenticatedUser]:
+    """Convert the North SDK's request user, if any, to an AuthenticatedUser."""
     if _get_authenticated_user is None:
         logger.warning("North MCP SDK not available - cannot retrieve authenticated user")
         return None
@@ -92,11 +103,11 @@ def get_authenticated_user() -> Optional[AuthenticatedUser]:
             raw_data=sdk_user
         )
         
-        logger.debug(f"Retrieved authenticated user: {user}")
+        logger.debug("Retrieved authenticated user: %s", user)
         return user
         
     except Exception as e:
-        logger.error(f"Error retrieving authenticated user: {e}", exc_info=True)
+        logger.error("Error retrieving authenticated user: %s", e, exc_info=True)
         return None
 
 
@@ -120,7 +131,7 @@ def require_authentication(func):
         user = get_authenticated_user()
         if user is None:
             error_msg = "Authentication required. Please provide valid credentials."
-            logger.warning(f"Unauthenticated access attempt to {func.__name__}")
+            logger.warning("Unauthenticated access attempt to %s", func.__name__)
             return error_msg
         return func(*args, **kwargs)
     
@@ -0,0 +1,399 @@
+"""
+Futures contract specifications for Market Analysis Bot.
+Contract multipliers and benchmark mappings used to turn positions such as
+"long 100 WTI" into dollar exposure, and a parser for exchange contract
+codes (CLZ25, NGH26) and strips (CL Cal-26, NG Win-25).
+"""
+
+import datetime
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Exchange contract specifications keyed by root symbol
+CONTRACT_SPECS: Dict[str, Dict[str, Union[str, int]]] = {
+    "CL": {
+        "name": "NYMEX WTI Crude Oil",
+        "exchange": "NYMEX",
+        "benchmark": "WTI",
+        "multiplier": 1000,
+        "unit": "barrels",
+        "series_id": "RWTC",
+        "expiry": "cl",
+    },
+    "BZ": {
+        "name": "Brent Crude Oil",
+        "exchange": "ICE",
+        "benchmark": "Brent",
+        "multiplier": 1000,
+        "unit": "barrels",
+        "series_id": "RBRTE",
+        "expiry": "brent",
+    },
+    "NG": {
+        "name": "NYMEX Henry Hub Natural Gas",
+        "exchange": "NYMEX",
+        "benchmark": "Henry Hub",
+        "multiplier": 10000,
+        "unit": "MMBtu",
+        "series_id": "RNGWHHD",
+        "expiry": "ng",
+    },
+    "RB": {
+        "name": "NYMEX RBOB Gasoline",
+        "exchange": "NYMEX",
+        "benchmark": "NY Harbor Gasoline",
+        "multiplier": 42000,
+        "unit": "gallons",
+        "series_id": "EER_EPMRU_PF4_Y35NY_DPG",
+        "expiry": "products",
+    },
+    "HO": {
+        "name": "NYMEX NY Harbor ULSD",
+        "exchange": "NYMEX",
+        "benchmark": "NY Harbor ULSD",
+        "multiplier": 42000,
+        "unit": "gallons",
+        "series_id": "EER_EPD2DXL0_PF4_Y35NY_DPG",
+        "expiry": "products",
+    },
+}
+
+# Common desk names for contract roots
+CONTRACT_ALIASES = {
+    "WTI": "CL",
+    "CRUDE": "CL",
+    "BRENT": "BZ",
+    "B": "BZ",
+    "HENRY HUB": "NG",
+    "HH": "NG",
+    "GAS": "NG",
+    "NATGAS": "NG",
+    "RBOB": "RB",
+    "GASOLINE": "RB",
+    "ULSD": "HO",
+    "HEATING OIL": "HO",
+    "DIESEL": "HO",
+}
+
+# Exchange month codes
+MONTH_CODES = {
+    "F": 1, "G": 2, "H": 3, "J": 4, "K": 5, "M": 6,
+    "N": 7, "Q": 8, "U": 9, "V": 10, "X": 11, "Z": 12,
+}
+MONTH_LETTERS = {month: code for code, month in MONTH_CODES.items()}
+
+# Named strips: contract months as (month, years after the strip year)
+STRIP_MONTHS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    "CAL": tuple((m, 0) for m in range(1, 13)),
+    "Q1": ((1, 0), (2, 0), (3, 0)),
+    "Q2": ((4, 0), (5, 0), (6, 0)),
+    "Q3": ((7, 0), (8, 0), (9, 0)),
+    "Q4": ((10, 0), (11, 0), (12, 0)),
+    # Natural gas seasons: summer injection April-October, winter
+    # withdrawal November through the following March
+    "SUM": tuple((m, 0) for m in range(4, 11)),
+    "WIN": ((11, 0), (12, 0), (1, 1), (2, 1), (3, 1)),
+}
+
+# Root for strips that do not name one ("Cal-26 strip")
+DEFAULT_STRIP_ROOT = "CL"
+
+# Known root + month code + 1, 2 or 4 digit year. Roots are matched
+# literally, longest first, so "BZ25" is rejected rather than read as a
+# one-letter root B with month Z
+_CODE_PATTERN = re.compile(
+    r"^(?P<root>" + "|".join(sorted(CONTRACT_SPECS, key=len, reverse=True)) + r")"
+    r"(?P<month>[FGHJKMNQUVXZ])(?P<year>\d{4}|\d{1,2})$"
+)
+_STRIP_PATTERN = re.compile(
+    r"^(?:(?P<root>[A-Z][A-Z ]*?)\s+)?(?P<kind>CAL|Q[1-4]|SUM|WIN)[\s-]*(?P<year>\d{4}|\d{2})"
+    r"(?:\s+STRIP)?$"
+)
+_RANGE_PATTERN = re.compile(r"^(?P<first>[A-Z]{2,5}\d{1,4})\s*(?:-|TO)\s*(?P<last>[A-Z]{2,5}\d{1,4})$")
+_QUANTITY_PATTERN = re.compile(
+    r"^\s*(?P<side>long|short|buy|sell)?\s*(?P<qty>[+-]?\d+(?:\.\d+)?)?\s*(?:x\s+)?(?P<rest>.+?)\s*$",
+    re.IGNORECASE,
+)
+
+_POSITION_PATTERN = re.compile(
+    r"^\s*(?P<side>long|short|buy|sell)?\s*(?P<qty>[+-]?\d+(?:\.\d+)?)\s*(?:x\s*)?"
+    r"(?P<contract>[a-z][a-z ]*?)\s*(?:contracts?|lots?)?\s*$",
+    re.IGNORECASE,
+)
+
+
+def resolve_contract(name: str) -> str:
+    """
+    Resolve a contract root or desk alias to a root symbol.
+
+    Args:
+        name: Root or alias (e.g., "CL", "wti", "Henry Hub")
+
+    Returns:
+        Root symbol present in CONTRACT_SPECS
+
+    Raises:
+        ValueError: If the contract is unknown
+    """
+    key = " ".join(name.upper().split())
+    root = CONTRACT_ALIASES.get(key, key)
+    if root not in CONTRACT_SPECS:
+        raise ValueError(
+            f"Unknown contract '{name}'. Known contracts: "
+            f"{', '.join(CONTRACT_SPECS)} (aliases: {', '.join(CONTRACT_ALIASES)})"
+        )
+    return root
+
+
+def parse_position(position: str) -> Tuple[float, str]:
+    """
+    Parse a position description into signed contracts and a root symbol.
+
+    Args:
+        position: e.g. "long 100 WTI", "short 50 NG", "-20 CL", "buy 10 Brent"
+
+    Returns:
+        Tuple of (signed contract count, root symbol)
+
+    Raises:
+        ValueError: If the description cannot be parsed
+    """
+    match = _POSITION_PATTERN.match(position)
+    if not match:
+        raise ValueError(
+            f"Could not parse position '{position}'. "
+            f"Use a form like 'long 100 WTI' or 'short 50 NG'"
+        )
+
+    contracts = float(match.group("qty"))
+    side = (match.group("side") or "").lower()
+    if side in ("short", "sell"):
+        contracts = -abs(contracts)
+    elif side in ("long", "buy"):
+        contracts = abs(contracts)
+
+    return contracts, resolve_contract(match.group("contract"))
+
+
+class ContractCode:
+    """
+    One futures contract month.
+
+    Attributes:
+        root: Root symbol in CONTRACT_SPECS (e.g., "CL")
+        year: Contract year
+        month: Contract (delivery) month, 1-12
+    """
+
+    def __init__(self, root: str, year: int, month: int):
+        self.root = root
+        self.year = year
+        self.month = month
+
+    @property
+    def symbol(self) -> str:
+        """Canonical code with a two-digit year, e.g. "CLZ25"."""
+        return f"{self.root}{MONTH_LETTERS[self.month]}{self.year % 100:02d}"
+
+    @property
+    def spec(self) -> Dict[str, Union[str, int]]:
+        return CONTRACT_SPECS[self.root]
+
+    @property
+    def contract_month(self) -> str:
+        """Delivery month as "YYYY-MM"."""
+        return f"{self.year}-{self.month:02d}"
+
+    @property
+    def last_trade(self) -> datetime.date:
+        """Approximate last trading day (see last_trade_date)."""
+        return last_trade_date(self.root, self.year, self.month)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ContractCode) and (self.root, self.year, self.month) == (
+            other.root, other.year, other.month
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.root, self.year, self.month))
+
+    def __repr__(self) -> str:
+        return f"ContractCode('{self.symbol}')"
+
+
+def _expand_year(digits: str, today: Optional[datetime.date] = None) -> int:
+    """
+    Full year from a 1, 2 or 4 digit contract year.
+
+    Two digits are 20YY; a single digit is the first year ending in that
+    digit from last year onwards (so "Z5" read in 2026 is 2035).
+    """
+    if len(digits) == 4:
+        return int(digits)
+    if len(digits) == 2:
+        return 2000 + int(digits)
+    start = (today or datetime.date.today()).year - 1
+    return start + (int(digits) - start) % 10
+
+
+def _business_days_before(day: datetime.date, count: int) -> datetime.date:
+    """The business day `count` weekdays before `day` (exchange holidays ignored)."""
+    while count:
+        day -= datetime.timedelta(days=1)
+        if day.weekday() < 5:
+            count -= 1
+    return day
+
+
+def _last_business_day(year: int, month: int) -> datetime.date:
+    next_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+    return _business_days_before(next_month, 1)
+
+
+def _shift_month(year: int, month: int, delta: int) -> Tuple[int, int]:
+    index = year * 12 + month - 1 + delta
+    return index // 12, index % 12 + 1
+
+
+@lru_cache(maxsize=1024)
+def last_trade_date(root: str, year: int, month: int) -> datetime.date:
+    """
+    Approximate last trading day of a contract month from exchange rules.
+
+    Weekends are skipped but exchange holidays are not, so a date next to a
+    holiday can be a day late.
+
+    - CL: 3 business days before the 25th of the prior month (4 if the
+      25th is not a business day)
+    - NG: 3 business days before the first day of the contract month
+    - Brent: last business day of the second month before the contract month
+    - RB/HO: last business day of the month before the contract month
+    """
+    rule = CONTRACT_SPECS[root]["expiry"]
+    if rule == "cl":
+        prior_year, prior_month = _shift_month(year, month, -1)
+        day = datetime.date(prior_year, prior_month, 25)
+        if day.weekday() >= 5:
+            day = _business_days_before(day, 1)
+        return _business_days_before(day, 3)
+    if rule == "ng":
+        return _business_days_before(datetime.date(year, month, 1), 3)
+    if rule == "brent":
+        return _last_business_day(*_shift_month(year, month, -2))
+    return _last_business_day(*_shift_month(year, month, -1))
+
+
+@lru_cache(maxsize=256)
+def strip_months(kind: str, year: int) -> Tuple[Tuple[int, int], ...]:
+    """(year, month) pairs of a named strip, e.g. ("WIN", 2025) -> Nov 2025 to Mar 2026."""
+    return tuple((year + offset, month) for month, offset in STRIP_MONTHS[kind])
+
+
+def _resolve_root(root: str, text: str) -> str:
+    try:
+        return resolve_contract(root)
+    except ValueError:
+        raise ValueError(
+            f"Unknown contract root '{root}' in '{text}'. Known roots: {', '.join(CONTRACT_SPECS)}"
+        )
+
+
+def parse_contract_code(code: str, today: Optional[datetime.date] = None) -> ContractCode:
+    """
+    Parse an exchange contract code such as "CLZ25", "NGH2026" or "RBZ5".
+
+    Raises:
+        ValueError: If the code is malformed or the root is unknown
+    """
+    text = code.strip().upper().replace(" ", "")
+    match = _CODE_PATTERN.match(text)
+    if not match:
+        raise ValueError(
+            f"Could not parse contract code '{code}'. Use root ({', '.join(CONTRACT_SPECS)}) "
+            f"+ month code + year, e.g. CLZ25 (month codes: {''.join(MONTH_CODES)})"
+        )
+    return ContractCode(
+        _resolve_root(match.group("root"), code),
+        _expand_year(match.group("year"), today),
+        MONTH_CODES[match.group("month")],
+    )
+
+
+def expand_contracts(
+    text: str,
+    default_root: str = DEFAULT_STRIP_ROOT,
+    today: Optional[datetime.date] = None
+) -> List[ContractCode]:
+    """
+    Expand a contract code, strip or code range into contract months.
+
+    Args:
+        text: "CLZ25", "CL Cal-26", "NG Win-25 strip", "Q1 2026" or
+            "CLZ25-CLH26"
+        default_root: Root for strips that do not name one (default: CL)
+        today: Reference date for single-digit years
+
+    Returns:
+        Contract months in delivery order
+
+    Raises:
+        ValueError: If the text is not a code, strip or range, or a root
+            is unknown
+    """
+    normalized = " ".join(text.upper().split())
+
+    strip = _STRIP_PATTERN.match(normalized)
+    if strip:
+        root = _resolve_root(strip.group("root") or default_root, text)
+        year = _expand_year(strip.group("year"), today)
+        return [ContractCode(root, y, m) for y, m in strip_months(strip.group("kind"), year)]
+
+    code_range = _RANGE_PATTERN.match(normalized)
+    if code_range:
+        first = parse_contract_code(code_range.group("first"), today)
+        last = parse_contract_code(code_range.group("last"), today)
+        if first.root != last.root:
+            raise ValueError(f"Range '{text}' mixes contracts {first.root} and {last.root}")
+        start = first.year * 12 + first.month - 1
+        end = last.year * 12 + last.month - 1
+        if end < start:
+            raise ValueError(f"Range '{text}' ends before it starts")
+        return [ContractCode(first.root, index // 12, index % 12 + 1) for index in range(start, end + 1)]
+
+    return [parse_contract_code(normalized, today)]
+
+
+def parse_contract_position(
+    item: str,
+    today: Optional[datetime.date] = None,
+    default_root: str = DEFAULT_STRIP_ROOT
+) -> Tuple[Optional[float], List[ContractCode]]:
+    """
+    Parse one position-list item such as "long 10 CLZ25" or "-5 NG Cal-26".
+
+    Strips without a root ("Cal-26 strip") use default_root.
+
+    Returns:
+        (signed lots per contract month or None if no quantity, contract months)
+
+    Raises:
+        ValueError: If the contract part cannot be expanded
+    """
+    match = _QUANTITY_PATTERN.match(item)
+    if not match:
+        raise ValueError("Empty position item")
+    quantity = match.group("qty")
+    lots = float(quantity) if quantity is not None else None
+    side = (match.group("side") or "").lower()
+    if lots is not None and side in ("short", "sell"):
+        lots = -abs(lots)
+    elif lots is not None and side in ("long", "buy"):
+        lots = abs(lots)
+    elif lots is None and side:
+        lots = -1.0 if side in ("short", "sell") else 1.0
+    return lots, expand_contracts(match.group("rest"), default_root, today)
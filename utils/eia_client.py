@@ -3,15 +3,56 @@ EIA API Client for Market Analysis Bot.
 Provides HTTP client for querying U.S. Energy Information Administration Open Data API v2.
 """
 
+from __future__ import annotations
+
 import json
 import logging
+import threading
+import time
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
-import requests
+from utils.lazy import lazy_import
+from utils.metrics import metrics
+from utils.tracing import Span, get_tracer
+
+requests = lazy_import("requests")
 
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer(__name__)
+
+
+# Keep-alive connections per host in the shared session; sized for
+# concurrent tool calls plus background prefetch
+POOL_SIZE = 16
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session, creating it on first use.
+    
+    All EIAClient instances share this session, so TCP/TLS connections to
+    api.eia.gov are pooled and reused instead of reopened per request.
+    
+    Returns:
+        Shared requests.Session with a POOL_SIZE connection pool
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
 
 
 class EIAClient:
@@ -33,12 +74,13 @@ class EIAClient:
     RATE_LIMIT = 5000  # requests per hour
     RATE_LIMIT_WARNING = 4000  # warn at 80%
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
         """
         Initialize EIA API client.
         
         Args:
             api_key: EIA API key (register at https://signups.eia.gov/api/signup/)
+            session: HTTP session to use (default: the shared pooled session)
         
         Raises:
             ValueError: If API key is missing or empty
@@ -50,6 +92,7 @@ class EIAClient:
             )
         
         self.api_key = api_key
+        self.session = session or get_session()
         self.request_count = 0
         self.last_reset = datetime.now()
         
@@ -96,6 +139,23 @@ class EIAClient:
             ...     start="2025-01-01"
             ... )
         """
+        attributes = {"eia.path": path, "eia.frequency": frequency, "eia.limit": limit}
+        with tracer.start_as_current_span("eia.query", attributes) as span:
+            return self._query(path, facets, start, end, frequency, data_fields, sort, limit, span)
+    
+    def _query(
+        self,
+        path: str,
+        facets: Optional[Dict[str, Any]],
+        start: Optional[str],
+        end: Optional[str],
+        frequency: str,
+        data_fields: Optional[List[str]],
+        sort: Optional[List[Dict[str, str]]],
+        limit: int,
+        span: Span
+    ) -> Dict[str, Any]:
+        """Body of query(), run inside its trace span."""
         # Check rate limit
         self._check_rate_limit()
         
@@ -117,31 +177,42 @@ class EIAClient:
         url = f"{self.BASE_URL}/{path}/data/"
         
         try:
-            logger.debug(f"EIA API request: {path} with params: {params}")
+            logger.debug("EIA API request: %s with params: %s", path, params)
             
-            response = requests.get(
-                url,
-                params=params,
-                timeout=30
-            )
+            started = time.perf_counter()
+            with tracer.start_as_current_span("eia.http", {"http.method": "GET", "http.url": url}) as http_span:
+                try:
+                    response = self.session.get(
+                        url,
+                        params=params,
+                        timeout=30
+                    )
+                except requests.RequestException:
+                    metrics.record_eia_request(path, time.perf_counter() - started, error=True)
+                    raise
+                metrics.record_eia_request(path, time.perf_counter() - started, error=not response.ok)
+                http_span.set_attribute("http.status_code", response.status_code)
             
             self.request_count += 1
             
             response.raise_for_status()
             
-            data = response.json()
-            logger.debug(f"EIA API response: {len(data.get('response', {}).get('data', []))} records")
+            with tracer.start_as_current_span("eia.json_decode"):
+                data = response.json()
+            records = len(data.get('response', {}).get('data', []))
+            span.set_attribute("eia.records", records)
+            logger.debug("EIA API response: %s records", records)
             
             return data
             
         except requests.Timeout:
-            logger.error(f"EIA API timeout for path: {path}")
+            logger.error("EIA API timeout for path: %s", path)
             raise requests.Timeout(
                 "EIA API request timed out. Please try again or check your network connection."
             )
         
         except requests.HTTPError as e:
-            logger.error(f"EIA API error: {e.response.status_code} - {e.response.text}")
+            logger.error("EIA API error: %s - %s", e.response.status_code, e.response.text)
             
             if e.response.status_code == 401:
                 raise requests.HTTPError(
@@ -180,7 +251,7 @@ class EIAClient:
             )
         
         if limit > 5000:
-            logger.warning(f"Limit {limit} exceeds maximum 5000, capping at 5000")
+            logger.warning("Limit %s exceeds maximum 5000, capping at 5000", limit)
             limit = 5000
     
     def _build_params(
@@ -229,7 +300,7 @@ class EIAClient:
         hours_passed = (now - self.last_reset).total_seconds() / 3600
         
         if hours_passed >= 1.0:
-            logger.debug(f"Resetting rate limit counter (was {self.request_count})")
+            logger.debug("Resetting rate limit counter (was %s)", self.request_count)
             self.request_count = 0
             self.last_reset = now
         
@@ -237,7 +308,7 @@ class EIAClient:
         if self.request_count >= self.RATE_LIMIT_WARNING:
             remaining = self.RATE_LIMIT - self.request_count
             logger.warning(
-                f"Approaching EIA API rate limit: {self.request_count}/{self.RATE_LIMIT} requests used. "
-                f"{remaining} requests remaining this hour."
+                "Approaching EIA API rate limit: %d/%d requests used. %d requests remaining this hour.",
+                self.request_count, self.RATE_LIMIT, remaining
             )
 
@@ -0,0 +1,355 @@
+"""
+Compiled trading glossary for Market Analysis Bot.
+Turns the glossary into an immutable index built once: every term's
+explanation and every category listing is rendered to markdown up front,
+so the vernacular tools answer exact lookups with a dict hit and no string
+building, and an Aho-Corasick automaton finds every glossary term in free
+text in one pass. The glossary is loaded from a JSON data file; the compiled index
+is cached on disk as a pickle and reloaded when the data file changes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from utils.aho_corasick import AhoCorasick, select_longest
+from utils.term_search import TermIndex, normalize_term
+
+
+logger = logging.getLogger(__name__)
+
+
+# Listing sections in display order: category -> (heading, show definition
+# excerpt instead of full name)
+CATEGORY_SECTIONS: Dict[str, Tuple[str, bool]] = {
+    "benchmarks": ("### 📊 Benchmarks & Markets", False),
+    "concepts": ("### 💡 Trading Concepts", True),
+    "measurements": ("### 📏 Measurements", False),
+    "organizations": ("### 🏢 Organizations", False),
+    "positions": ("### 📈 Positions", False),
+}
+
+# Characters of the definition shown for categories listed by definition
+EXCERPT_LENGTH = 60
+
+# Terms shown when a lookup has no match at all
+FALLBACK_TERM_COUNT = 10
+
+# Fields every glossary entry must have
+REQUIRED_FIELDS = ("full_name", "definition", "context")
+
+# Bump when the compiled layout changes so stale pickles are ignored
+COMPILED_FORMAT = 2
+
+# Minimum seconds between checks of the data file's mtime
+RELOAD_CHECK_SECONDS = 2.0
+
+
+def render_term(key: str, entry: Mapping) -> str:
+    """Markdown explanation of one glossary entry."""
+    return (
+        f"## {entry['full_name']}\n\n"
+        f"**Term**: `{key}`\n\n"
+        f"### Definition\n{entry['definition']}\n\n"
+        f"### Trading Context\n{entry['context']}\n"
+    )
+
+
+def render_listing(
+    glossary: Mapping[str, Mapping],
+    categories: Mapping[str, Tuple[str, ...]],
+    sections: Tuple[str, ...]
+) -> str:
+    """Markdown term listing for the given category sections."""
+    lines = ["## Energy Trading Glossary", ""]
+    for category in sections:
+        heading, by_definition = CATEGORY_SECTIONS[category]
+        lines.append(heading)
+        for key in categories.get(category, ()):
+            entry = glossary[key]
+            summary = f"{entry['definition'][:EXCERPT_LENGTH]}..." if by_definition else entry["full_name"]
+            lines.append(f"- **{key}**: {summary}")
+        lines.append("")
+    lines.append("*Use `explain_trading_term` to get detailed explanations.*")
+    return "\n".join(lines)
+
+
+class CompiledGlossary:
+    """
+    Immutable, pre-rendered view of a glossary.
+
+    Attributes:
+        entries: Read-only mapping of term key -> glossary entry
+        rendered: Read-only mapping of term key -> explanation markdown
+        categories: Read-only mapping of category -> term keys (glossary order)
+        listings: Read-only mapping of "all" or a category -> listing markdown
+        fallback: Markdown list of terms shown when a lookup finds nothing
+        search_index: TermIndex over keys, full names, aliases and definitions
+        automaton: AhoCorasick over keys, full names and aliases, for free text
+    """
+
+    __slots__ = ("entries", "rendered", "categories", "listings", "fallback", "search_index", "automaton")
+
+    def __init__(self, glossary: Mapping[str, Mapping]):
+        entries = {key: dict(entry) for key, entry in glossary.items()}
+
+        categories: Dict[str, list] = {}
+        for key, entry in entries.items():
+            category = entry.get("category")
+            if category in CATEGORY_SECTIONS:
+                categories.setdefault(category, []).append(key)
+        frozen_categories = {category: tuple(keys) for category, keys in categories.items()}
+
+        listings = {"all": render_listing(entries, frozen_categories, tuple(CATEGORY_SECTIONS))}
+        for category in CATEGORY_SECTIONS:
+            listings[category] = render_listing(entries, frozen_categories, (category,))
+
+        fallback = "### Available Terms\nTry these common trading terms:\n"
+        fallback += "".join(f"- `{key}`\n" for key in list(entries)[:FALLBACK_TERM_COUNT])
+        fallback += f"\n*Total terms in glossary: {len(entries)}*"
+
+        self._set_state({
+            "entries": entries,
+            "rendered": {key: render_term(key, entry) for key, entry in entries.items()},
+            "categories": frozen_categories,
+            "listings": listings,
+            "fallback": fallback,
+            "search_index": TermIndex(entries),
+            "automaton": AhoCorasick(
+                (normalize_term(name), key)
+                for key, entry in entries.items()
+                for name in [key, entry["full_name"]] + list(entry.get("aliases", []))
+            ),
+        })
+        logger.debug("Glossary compiled: %d terms, %d categories", len(entries), len(frozen_categories))
+
+    def _set_state(self, state: Dict) -> None:
+        """Install plain compiled state behind read-only views."""
+        set_attr = super().__setattr__
+        set_attr("entries", MappingProxyType(
+            {key: MappingProxyType(entry) for key, entry in state["entries"].items()}
+        ))
+        set_attr("rendered", MappingProxyType(state["rendered"]))
+        set_attr("categories", MappingProxyType(state["categories"]))
+        set_attr("listings", MappingProxyType(state["listings"]))
+        set_attr("fallback", state["fallback"])
+        set_attr("search_index", state["search_index"])
+        set_attr("automaton", state["automaton"])
+
+    def __reduce__(self):
+        # Read-only views do not pickle; store the plain state and rebuild
+        # the views on load without re-rendering
+        state = {
+            "entries": {key: dict(entry) for key, entry in self.entries.items()},
+            "rendered": dict(self.rendered),
+            "categories": dict(self.categories),
+            "listings": dict(self.listings),
+            "fallback": self.fallback,
+            "search_index": self.search_index,
+            "automaton": self.automaton,
+        }
+        return (_restore_compiled, (state,))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledGlossary is immutable")
+
+    def lookup(self, term: str) -> Optional[str]:
+        """Key for an exact term, full name or alias, or None."""
+        return self.search_index.lookup(term)
+
+    def find_terms(self, text: str) -> List[Tuple[str, str]]:
+        """
+        Every glossary term mentioned in free text, in one automaton pass.
+
+        Matches must start and end on word boundaries ("arb" does not match
+        inside "carbon") and the longest match wins where they overlap.
+
+        Returns:
+            (text as written, glossary key) pairs in order of appearance
+        """
+        normalized = normalize_term(text)
+        matches = (
+            (start, end, key)
+            for start, end, key in self.automaton.iter_matches(normalized)
+            if (start == 0 or not normalized[start - 1].isalnum())
+            and (end == len(normalized) or not normalized[end].isalnum())
+        )
+        # Recover the original casing from the whitespace-collapsed input
+        original = " ".join(text.split())
+        if len(original) != len(normalized):
+            original = normalized
+        return [(original[start:end], key) for start, end, key in select_longest(matches)]
+
+    def listing(self, category: str) -> Optional[str]:
+        """Pre-rendered listing for "all" or a category, or None if unknown."""
+        return self.listings.get(category.lower().strip())
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+
+def _restore_compiled(state: Dict) -> CompiledGlossary:
+    """Rebuild a CompiledGlossary from pickled plain state."""
+    compiled = object.__new__(CompiledGlossary)
+    compiled._set_state(state)
+    return compiled
+
+
+def load_glossary_file(path: Union[str, Path]) -> Dict[str, Dict]:
+    """
+    Read and validate a glossary JSON file of the form {"terms": {key: entry}}.
+
+    Keys are normalized to lowercase.
+
+    Raises:
+        ValueError: If the file is not valid JSON or an entry lacks a required field
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid glossary file {path}: {e}")
+
+    terms = data.get("terms") if isinstance(data, dict) else None
+    if not isinstance(terms, dict):
+        raise ValueError(f"Invalid glossary file {path}: expected an object with a \"terms\" object")
+    glossary = {}
+    for key, entry in terms.items():
+        missing = [field for field in REQUIRED_FIELDS if not isinstance(entry, dict) or field not in entry]
+        if missing:
+            raise ValueError(f"Glossary term '{key}' is missing: {', '.join(missing)}")
+        glossary[key.lower().strip()] = entry
+    return glossary
+
+
+def default_cache_dir() -> Path:
+    """Directory for compiled glossary caches (GLOSSARY_CACHE_DIR or ~/.cache)."""
+    return Path(os.getenv("GLOSSARY_CACHE_DIR") or Path.home() / ".cache" / "market-analysis-bot")
+
+
+class GlossaryStore:
+    """
+    Serves the compiled glossary for a data file and hot-reloads it.
+
+    The first get() loads the compiled index from the pickle cache if one
+    matches the file's path, mtime and size, otherwise compiles the JSON
+    and writes the cache. Later calls check the file's mtime at most every
+    RELOAD_CHECK_SECONDS; on a change one caller recompiles while others
+    keep using the current index, then the reference is swapped. A file
+    that fails to load leaves the current index in place.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        cache_dir: Optional[Union[str, Path]] = None,
+        check_seconds: float = RELOAD_CHECK_SECONDS
+    ):
+        self.path = Path(path)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.check_seconds = check_seconds
+        self._compiled: Optional[CompiledGlossary] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self._reload_lock = threading.Lock()
+
+    def get(self) -> CompiledGlossary:
+        """
+        Current compiled glossary, reloading it if the data file changed.
+
+        Raises:
+            ValueError: If the first load finds an invalid data file
+            OSError: If the first load cannot read the data file
+        """
+        compiled = self._compiled
+        if compiled is not None and time.monotonic() - self._checked_at < self.check_seconds:
+            return compiled
+        if compiled is None:
+            with self._reload_lock:
+                if self._compiled is None:
+                    self._reload(self._stat())
+            return self._compiled
+
+        self._checked_at = time.monotonic()
+        # Readers never wait: if another caller is already reloading, serve
+        # the current index
+        if not self._reload_lock.acquire(blocking=False):
+            return compiled
+        try:
+            signature = self._stat()
+            if signature != self._signature:
+                try:
+                    self._reload(signature)
+                    logger.info("Glossary reloaded from %s (%d terms)", self.path, len(self._compiled))
+                except (OSError, ValueError) as e:
+                    logger.error("Glossary reload failed, keeping previous version: %s", e)
+                    self._signature = signature
+        except OSError as e:
+            logger.error("Glossary file unavailable, keeping previous version: %s", e)
+        finally:
+            self._reload_lock.release()
+        return self._compiled
+
+    def _stat(self) -> Tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _reload(self, signature: Tuple[int, int]) -> None:
+        """Load or compile the glossary for a file signature and swap it in."""
+        cache_file = self._cache_file(signature)
+        compiled = self._read_cache(cache_file)
+        if compiled is None:
+            compiled = CompiledGlossary(load_glossary_file(self.path))
+            self._write_cache(cache_file, compiled)
+        self._compiled = compiled
+        self._signature = signature
+        self._checked_at = time.monotonic()
+
+    def _cache_file(self, signature: Tuple[int, int]) -> Path:
+        key = f"{self.path.resolve()}:{signature[0]}:{signature[1]}:{COMPILED_FORMAT}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return (self.cache_dir or default_cache_dir()) / f"glossary-{digest}.pickle"
+
+    @staticmethod
+    def _read_cache(cache_file: Path) -> Optional[CompiledGlossary]:
+        try:
+            with open(cache_file, "rb") as f:
+                compiled = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable glossary cache %s: %s", cache_file, e)
+            return None
+        if not isinstance(compiled, CompiledGlossary):
+            return None
+        logger.debug("Glossary loaded from cache %s", cache_file)
+        return compiled
+
+    @staticmethod
+    def _write_cache(cache_file: Path, compiled: CompiledGlossary) -> None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_file, "wb") as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            logger.warning("Could not write glossary cache %s: %s", cache_file, e)
+            return
+        # Each edit of the data file writes a new cache; drop the older ones
+        for stale in cache_file.parent.glob("glossary-*.pickle"):
+            if stale != cache_file:
+                try:
+                    stale.unlink()
+                except OSError as e:
+                    logger.debug("Could not remove old glossary cache %s: %s", stale, e)
@@ -0,0 +1,56 @@
+"""
+Deferred imports for Market Analysis Bot.
+numpy, pandas and requests take several hundred milliseconds to import,
+which every cold start (including stdio launches) paid for before the first
+tool call. Modules bind them with lazy_import so the real import happens on
+first attribute access, i.e. the first tool call that needs them.
+"""
+
+import importlib
+import logging
+import sys
+import types
+
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a module that imports it on first attribute access.
+
+    After loading, the real module's namespace is copied in, so later
+    attribute lookups are plain dict hits with no proxy overhead.
+    importlib.util.LazyLoader is not used: on Python 3.11 it can execute a
+    module twice when two threads touch it at once (the warm-up and
+    snapshot threads start alongside the server), while import_module
+    is serialized by the import lock.
+    """
+
+    def __getattr__(self, attr: str):
+        module = self.__dict__.get("_lazy_target")
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            logger.debug("Deferred import loaded: %s", self.__name__)
+            self.__dict__.update(module.__dict__)
+            self.__dict__["_lazy_target"] = module
+        return getattr(module, attr)
+
+    def __dir__(self):
+        return dir(importlib.import_module(self.__name__))
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Module `name`, imported on first attribute access.
+
+    Returns the real module if it is already imported.
+
+    Example:
+        np = lazy_import("numpy")  # nothing imported yet
+        np.zeros(3)                 # numpy imported here
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
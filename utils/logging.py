@@ -1,85 +1,249 @@
 """
 Logging configuration for Market Analysis Bot MCP server.
 Provides structured logging with debug mode support.
+
+Request threads only put records on a queue; a background QueueListener
+formats them (as JSON lines or text) and writes them to the console and
+optional file, so a slow stdout never blocks a tool call. Per-call INFO
+lines from tool modules can be sampled, and records logged inside a traced
+tool call carry its trace_id.
 """
 
+import atexit
+import datetime
+import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from typing import Optional
+import threading
+from typing import Optional, Sequence, Tuple
+
+from utils.tracing import current_trace_id
+
+
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_RECORD_FIELDS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+# Loggers whose INFO lines are written once per tool call
+SAMPLED_LOGGER_PREFIX = "tools."
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: time, level, logger, message, any `extra=`
+    fields, and the formatted exception if there is one.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc)
+            .isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep one in `every` INFO records from per-call tool loggers.
+
+    Counting is per logger, so every tool still shows up. DEBUG, WARNING
+    and above, and records from other loggers always pass.
+
+    Attributes:
+        every: Keep every Nth sampled record (1 keeps all)
+        prefix: Logger name prefix that is sampled
+    """
+
+    def __init__(self, every: int = 1, prefix: str = SAMPLED_LOGGER_PREFIX):
+        super().__init__()
+        self.every = max(1, every)
+        self.prefix = prefix
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.every == 1 or record.levelno != logging.INFO or not record.name.startswith(self.prefix):
+            return True
+        with self._lock:
+            count = self._counts.get(record.name, 0)
+            self._counts[record.name] = count + 1
+        return count % self.every == 0
+
+
+class TraceContextFilter(logging.Filter):
+    """
+    Stamp records with the active trace_id (if any).
+
+    Runs on the logging thread, before the record is queued, since the
+    listener thread has no span context.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        trace_id = current_trace_id()
+        if trace_id is not None:
+            record.trace_id = trace_id
+        return True
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues the record as is.
+
+    The stock prepare() formats the message on the calling thread so the
+    record can cross a process boundary; in-process, the listener thread
+    can do that work instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
-def setup_logging(debug: bool = False, log_file: Optional[str] = None) -> None:
+def create_queue_handler(
+    handlers: Sequence[logging.Handler],
+    sample_every: int = 1
+) -> Tuple[logging.handlers.QueueHandler, logging.handlers.QueueListener]:
+    """
+    Build a non-blocking front end for `handlers`.
+
+    Callers only enqueue records (after sampling); the returned listener,
+    once started, formats and writes them on its own thread.
+
+    Returns:
+        (handler to attach to a logger, listener to start and stop)
+    """
+    log_queue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_every))
+    queue_handler.addFilter(TraceContextFilter())
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    return queue_handler, listener
+
+
+def setup_logging(
+    debug: bool = False,
+    log_file: Optional[str] = None,
+    json_format: Optional[bool] = None,
+    sample_every: Optional[int] = None
+) -> None:
     """
     Configure logging for the application.
-    
+
     Args:
         debug: If True, set log level to DEBUG for detailed output
         log_file: Optional path to log file. If None, only log to console.
+        json_format: Write JSON lines instead of text (default: LOG_FORMAT=json)
+        sample_every: Keep one in N per-call INFO lines from tool modules
+            (default: LOG_SAMPLE_EVERY, or 1 in debug mode)
     """
+    global _listener
+
     # Determine log level
     log_level = logging.DEBUG if debug else logging.INFO
-    
+
+    if json_format is None:
+        json_format = os.getenv("LOG_FORMAT", "text").lower() == "json"
+    if sample_every is None:
+        sample_every = 1 if debug else int(os.getenv("LOG_SAMPLE_EVERY", "1"))
+
     # Create formatters
-    if debug:
-        # Detailed format for debug mode
-        log_format = (
-            "%(asctime)s - %(name)s - %(levelname)s - "
-            "%(filename)s:%(lineno)d - %(message)s"
-        )
+    if json_format:
+        formatter = JsonFormatter()
     else:
-        # Simpler format for normal operation
-        log_format = "%(asctime)s - %(levelname)s - %(message)s"
-    
-    formatter = logging.Formatter(
-        log_format,
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    
+        if debug:
+            # Detailed format for debug mode
+            log_format = (
+                "%(asctime)s - %(name)s - %(levelname)s - "
+                "%(filename)s:%(lineno)d - %(message)s"
+            )
+        else:
+            # Simpler format for normal operation
+            log_format = "%(asctime)s - %(levelname)s - %(message)s"
+
+        formatter = logging.Formatter(
+            log_format,
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+
+    stop_logging()
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    
+
     # Remove existing handlers
     root_logger.handlers.clear()
-    
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
-    
+    handlers = [console_handler]
+
     # File handler (optional)
+    file_error = None
     if log_file:
         try:
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(log_level)
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
-            logging.info(f"Logging to file: {log_file}")
+            handlers.append(file_handler)
         except Exception as e:
-            logging.error(f"Failed to setup file logging: {e}")
-    
+            file_error = e
+
+    queue_handler, _listener = create_queue_handler(handlers, sample_every)
+    root_logger.addHandler(queue_handler)
+    _listener.start()
+
+    if log_file and file_error is None:
+        logging.info("Logging to file: %s", log_file)
+    elif file_error is not None:
+        logging.error("Failed to setup file logging: %s", file_error)
+
     # Set third-party library log levels
     # Reduce noise from verbose libraries
     if not debug:
         logging.getLogger("urllib3").setLevel(logging.WARNING)
         logging.getLogger("requests").setLevel(logging.WARNING)
-    
+
     # Log initial configuration
     if debug:
         logging.debug("Debug mode enabled - verbose logging active")
-        logging.debug(f"Log level set to: {logging.getLevelName(log_level)}")
+        logging.debug("Log level set to: %s", logging.getLevelName(log_level))
+    if sample_every > 1:
+        logging.info("Sampling per-call tool INFO logs: 1 in %d", sample_every)
+
+
+def stop_logging() -> None:
+    """Flush queued log records and stop the listener thread (safe to call twice)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name.
-    
+
     Args:
         name: Logger name (typically __name__ of the module)
-    
+
     Returns:
         Configured logger instance
     """
     return logging.getLogger(name)
-
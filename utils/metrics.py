@@ -0,0 +1,265 @@
+"""
+Runtime metrics for Market Analysis Bot.
+Per-tool call counts, errors, response cache hits and latency percentiles,
+EIA upstream request latency as a separate series, and series cache
+hit/miss counts. Rendered as Prometheus text for the /metrics route and as
+markdown for the server_stats tool.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from north_mcp_python_sdk import NorthMCPServer
+
+
+logger = logging.getLogger(__name__)
+
+
+# Latency percentiles are computed over the most recent samples per series
+LATENCY_WINDOW = 1024
+QUANTILES = (0.5, 0.95, 0.99)
+
+METRICS_PREFIX = "market_analysis"
+METRICS_PATH = "/metrics"
+
+
+class LatencySeries:
+    """
+    Call counts and a rolling latency window for one tool or upstream.
+
+    Attributes:
+        calls: Total calls recorded
+        errors: Calls that raised or returned an error response
+        cache_hits: Calls answered from a response cache (not in the latency window)
+        total_seconds: Sum of recorded latencies
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.total_seconds = 0.0
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            self.calls += 1
+            self.errors += error
+            self.total_seconds += seconds
+            self._samples.append(seconds)
+
+    def record_cache_hit(self) -> None:
+        with self._lock:
+            self.calls += 1
+            self.cache_hits += 1
+
+    def quantiles(self, probs: Sequence[float] = QUANTILES) -> List[Optional[float]]:
+        """Nearest-rank quantiles of the latency window in seconds; None when empty."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return [None] * len(probs)
+        last = len(samples) - 1
+        return [samples[min(last, int(p * len(samples)))] for p in probs]
+
+
+class MetricsRegistry:
+    """
+    Process-wide metric store.
+
+    Attributes:
+        tools: Latency series per tool name
+        eia: Latency series per EIA API path
+        series_cache: Series cache lookups as {"hits": n, "misses": n}
+        started: Wall-clock start time (epoch seconds)
+    """
+
+    def __init__(self):
+        self.tools: Dict[str, LatencySeries] = {}
+        self.eia: Dict[str, LatencySeries] = {}
+        self.series_cache = {"hits": 0, "misses": 0}
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def _series(self, table: Dict[str, LatencySeries], name: str) -> LatencySeries:
+        series = table.get(name)
+        if series is None:
+            with self._lock:
+                series = table.setdefault(name, LatencySeries())
+        return series
+
+    def record_tool_call(self, tool: str, seconds: float, error: bool = False) -> None:
+        self._series(self.tools, tool).record(seconds, error)
+
+    def record_tool_cache_hit(self, tool: str) -> None:
+        self._series(self.tools, tool).record_cache_hit()
+
+    def record_eia_request(self, path: str, seconds: float, error: bool = False) -> None:
+        self._series(self.eia, path).record(seconds, error)
+
+    def record_series_cache(self, hit: bool) -> None:
+        with self._lock:
+            self.series_cache["hits" if hit else "misses"] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.tools = {}
+            self.eia = {}
+            self.series_cache = {"hits": 0, "misses": 0}
+            self.started = time.time()
+
+    def snapshot(self) -> Tuple[List[Tuple[str, LatencySeries]], List[Tuple[str, LatencySeries]], Dict[str, int]]:
+        """
+        Copy the tool and EIA series lists and the series cache counts.
+
+        Taken under the lock, so rendering is safe while tool threads add
+        series for first-time tools or paths.
+        """
+        with self._lock:
+            return list(self.tools.items()), list(self.eia.items()), dict(self.series_cache)
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition (version 0.0.4) of every metric."""
+        tools, eia, series_cache = self.snapshot()
+        p = METRICS_PREFIX
+        lines = [
+            f"# HELP {p}_uptime_seconds Seconds since the metrics were started",
+            f"# TYPE {p}_uptime_seconds gauge",
+            f"{p}_uptime_seconds {time.time() - self.started:.3f}",
+        ]
+        lines += _render_family(
+            tools, "tool", f"{p}_tool",
+            "MCP tool calls", include_cache_hits=True,
+        )
+        lines += _render_family(
+            eia, "path", f"{p}_eia",
+            "EIA API requests", include_cache_hits=False,
+        )
+        lines += [
+            f"# HELP {p}_series_cache_lookups_total Series cache lookups by result",
+            f"# TYPE {p}_series_cache_lookups_total counter",
+            f'{p}_series_cache_lookups_total{{result="hit"}} {series_cache["hits"]}',
+            f'{p}_series_cache_lookups_total{{result="miss"}} {series_cache["misses"]}',
+        ]
+        return "\n".join(lines) + "\n"
+
+    def render_markdown(self) -> str:
+        """Per-tool and EIA latency tables for the server_stats tool."""
+        tools, eia, series_cache = self.snapshot()
+        uptime = time.time() - self.started
+        response = f"## Server Stats\n\n"
+        response += f"**Uptime**: {uptime / 3600:.1f} h\n\n"
+
+        response += f"### Tools\n"
+        if not tools:
+            response += f"No tool calls recorded yet.\n"
+        else:
+            response += _markdown_table(tools, "Tool", include_cache_hits=True)
+
+        response += f"\n### EIA API\n"
+        if not eia:
+            response += f"No EIA requests recorded yet.\n"
+        else:
+            response += _markdown_table(eia, "Path", include_cache_hits=False)
+
+        lookups = series_cache["hits"] + series_cache["misses"]
+        if lookups:
+            response += (
+                f"\n**Series cache**: {series_cache['hits']:,} hits / {lookups:,} lookups "
+                f"({series_cache['hits'] / lookups:.0%})\n"
+            )
+        return response
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _render_family(
+    table: List[Tuple[str, LatencySeries]],
+    label: str,
+    name: str,
+    description: str,
+    include_cache_hits: bool
+) -> List[str]:
+    lines = [
+        f"# HELP {name}_calls_total {description}",
+        f"# TYPE {name}_calls_total counter",
+    ]
+    series = sorted(table, key=lambda item: item[0])
+    for key, s in series:
+        lines.append(f'{name}_calls_total{{{label}="{_escape_label(key)}"}} {s.calls}')
+    lines += [f"# HELP {name}_errors_total {description} that failed", f"# TYPE {name}_errors_total counter"]
+    for key, s in series:
+        lines.append(f'{name}_errors_total{{{label}="{_escape_label(key)}"}} {s.errors}')
+    if include_cache_hits:
+        lines += [
+            f"# HELP {name}_cache_hits_total {description} answered from the response cache",
+            f"# TYPE {name}_cache_hits_total counter",
+        ]
+        for key, s in series:
+            lines.append(f'{name}_cache_hits_total{{{label}="{_escape_label(key)}"}} {s.cache_hits}')
+    lines += [
+        f"# HELP {name}_latency_seconds {description} latency over the last {LATENCY_WINDOW} calls",
+        f"# TYPE {name}_latency_seconds summary",
+    ]
+    for key, s in series:
+        escaped = _escape_label(key)
+        for q, value in zip(QUANTILES, s.quantiles()):
+            if value is not None:
+                lines.append(f'{name}_latency_seconds{{{label}="{escaped}",quantile="{q}"}} {value:.6f}')
+        lines.append(f'{name}_latency_seconds_sum{{{label}="{escaped}"}} {s.total_seconds:.6f}')
+        lines.append(f'{name}_latency_seconds_count{{{label}="{escaped}"}} {s.calls - s.cache_hits}')
+    return lines
+
+
+def _markdown_table(table: List[Tuple[str, LatencySeries]], heading: str, include_cache_hits: bool) -> str:
+    def ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value * 1000:,.1f}"
+
+    columns = ["Calls", "Errors"] + (["Cache Hits"] if include_cache_hits else []) + ["p50 ms", "p95 ms", "p99 ms"]
+    response = f"| {heading} | {' | '.join(columns)} |\n"
+    response += f"|{'---|' * (len(columns) + 1)}\n"
+    for key, s in sorted(table, key=lambda item: -item[1].calls):
+        cells = [f"{s.calls:,}", f"{s.errors:,}"]
+        if include_cache_hits:
+            cells.append(f"{s.cache_hits:,}")
+        cells += [ms(value) for value in s.quantiles()]
+        response += f"| {key} | {' | '.join(cells)} |\n"
+    return response
+
+
+metrics = MetricsRegistry()
+
+
+def register_metrics_route(mcp: "NorthMCPServer", path: str = METRICS_PATH) -> bool:
+    """
+    Serve Prometheus metrics on the server's HTTP port.
+
+    Uses the server's custom_route hook (FastMCP's Starlette routes), so the
+    endpoint sits next to /mcp.
+
+    Returns:
+        True if the route was added, False if the server has no custom routes
+    """
+    custom_route = getattr(mcp, "custom_route", None)
+    if custom_route is None:
+        logger.warning("Server does not support custom routes; %s not available", path)
+        return False
+
+    @custom_route(path, methods=["GET"])
+    async def prometheus_metrics(request):
+        from starlette.responses import PlainTextResponse
+
+        return PlainTextResponse(
+            metrics.render_prometheus(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    logger.info("Prometheus metrics available at %s", path)
+    return True
@@ -0,0 +1,92 @@
+"""
+EIA series warm-up for Market Analysis Bot.
+Fetches a configurable list of popular series into the shared series cache
+on a background thread at startup, so the first user request finds a hot
+cache and an open connection pool instead of paying cold-start latency.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Sequence, Tuple
+
+from utils.series_cache import SeriesCache, get_series_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+# Series documented in the eia_data_extractor docstring plus Henry Hub
+DEFAULT_WARMUP_SERIES: Tuple[str, ...] = ("RWTC", "RBRTE", "MCRFPUS1", "WTIPUUS", "RNGWHHD")
+
+
+def parse_series_list(text: Optional[str]) -> Tuple[str, ...]:
+    """
+    Parse a comma-separated warm-up list.
+
+    None means the default list; "" or "none" disables warm-up.
+    """
+    if text is None:
+        return DEFAULT_WARMUP_SERIES
+    if text.strip().lower() in ("", "none", "off"):
+        return ()
+    return tuple(dict.fromkeys(s.strip().upper() for s in text.split(",") if s.strip()))
+
+
+def warm_up(
+    series_ids: Sequence[str],
+    cache: Optional[SeriesCache] = None,
+    max_workers: int = 8
+) -> Dict[str, Optional[str]]:
+    """
+    Fetch series into the cache concurrently.
+
+    Failures are logged and reported rather than raised, so one bad series
+    does not stop the others.
+
+    Returns:
+        Dict mapping each series ID to None on success or an error message
+    """
+    cache = cache or get_series_cache()
+
+    def fetch(series_id: str) -> Optional[str]:
+        try:
+            cache.get(series_id)
+            return None
+        except Exception as e:
+            logger.warning("Warm-up failed for %s: %s", series_id, e)
+            return str(e)
+
+    if not series_ids:
+        return {}
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(series_ids)),
+                            thread_name_prefix="warmup") as pool:
+        results = dict(zip(series_ids, pool.map(fetch, series_ids)))
+    loaded = sum(error is None for error in results.values())
+    logger.info(
+        "Warm-up loaded %d/%d series in %.2fs",
+        loaded, len(series_ids), time.perf_counter() - started
+    )
+    return results
+
+
+def start_warm_up(
+    series_ids: Sequence[str] = DEFAULT_WARMUP_SERIES,
+    cache: Optional[SeriesCache] = None
+) -> Optional[threading.Thread]:
+    """
+    Run warm_up on a daemon thread and return immediately.
+
+    Returns:
+        The started thread, or None if there is nothing to fetch
+    """
+    if not series_ids:
+        return None
+    thread = threading.Thread(
+        target=warm_up, args=(tuple(series_ids), cache), name="eia-warmup", daemon=True
+    )
+    thread.start()
+    logger.info("EIA warm-up started: %s", ', '.join(series_ids))
+    return thread
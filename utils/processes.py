@@ -0,0 +1,266 @@
+"""
+Stochastic price processes for Market Analysis Bot.
+A registry of price models, each defined as a vectorized step function that
+advances an array of path prices by one trading day. The simulation engine
+in utils/simulation.py supplies shocks, chunking and parallelism, so every
+registered model runs on the same infrastructure.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional
+
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+logger = logging.getLogger(__name__)
+
+
+TRADING_DAYS = 252
+DT = 1.0 / TRADING_DAYS
+
+
+class PriceProcess:
+    """
+    Base class for a price model.
+
+    Subclasses implement step(), which updates prices in place for one day
+    given that day's standard-normal shock per path. Models that need extra
+    randomness (e.g., jumps) draw it from the per-block generator passed in,
+    which keeps results independent of how paths are split across workers.
+
+    Attributes:
+        name: Registry key (e.g., "gbm")
+        label: Human-readable model name
+        description: One-line description shown in tool output
+        defaults: Default model parameters
+    """
+
+    name = ""
+    label = ""
+    description = ""
+    defaults: Dict[str, float] = {}
+
+    def resolve_params(
+        self,
+        current_price: float,
+        volatility: float,
+        drift: float,
+        overrides: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, float]:
+        """
+        Merge defaults, overrides and the common simulation inputs.
+
+        Raises:
+            ValueError: If an override is not a parameter of this model
+        """
+        overrides = overrides or {}
+        unknown = set(overrides) - set(self.defaults)
+        if unknown:
+            raise ValueError(
+                f"Unknown parameter(s) for {self.name}: {', '.join(sorted(unknown))}. "
+                f"Valid: {', '.join(self.defaults) or 'none'}"
+            )
+        params = {k: float(v) for k, v in self.defaults.items()}
+        params.update({k: float(v) for k, v in overrides.items()})
+        params.update(
+            current_price=float(current_price),
+            volatility=float(volatility),
+            daily_vol=float(volatility) * np.sqrt(DT),
+            drift=float(drift),
+        )
+        return params
+
+    def step(
+        self,
+        prices: np.ndarray,
+        shocks: np.ndarray,
+        rng: np.random.Generator,
+        params: Dict[str, float]
+    ) -> None:
+        """Advance prices by one day in place."""
+        raise NotImplementedError
+
+    def terminal(
+        self,
+        current_price: float,
+        shocks: np.ndarray,
+        rng: np.random.Generator,
+        params: Dict[str, float]
+    ) -> np.ndarray:
+        """
+        Terminal prices for a block of paths.
+
+        Args:
+            current_price: Starting price
+            shocks: Standard-normal shocks of shape (paths, days)
+            rng: Generator for any additional randomness in this block
+            params: Resolved model parameters
+
+        Returns:
+            Terminal price per path
+        """
+        prices = np.full(shocks.shape[0], float(current_price))
+        # One contiguous row of shocks per day
+        for day_shocks in np.ascontiguousarray(shocks.T):
+            self.step(prices, day_shocks, rng, params)
+        return prices
+
+
+def _compound_returns(
+    current_price: float,
+    shocks: np.ndarray,
+    params: Dict[str, float]
+) -> np.ndarray:
+    """Terminal prices from compounding daily GBM returns in one reduction."""
+    returns = shocks * params["daily_vol"]
+    returns += params["drift"]
+    returns += 1.0
+    return current_price * np.prod(returns, axis=1)
+
+
+class GeometricBrownianMotion(PriceProcess):
+    """Compounded daily returns N(drift, sigma * sqrt(dt))."""
+
+    name = "gbm"
+    label = "Geometric Brownian motion"
+    description = "Prices compound normally distributed daily returns."
+    defaults: Dict[str, float] = {}
+
+    def step(self, prices, shocks, rng, params):
+        prices *= 1.0 + params["drift"] + params["daily_vol"] * shocks
+
+    def terminal(self, current_price, shocks, rng, params):
+        return _compound_returns(current_price, shocks, params)
+
+
+class OrnsteinUhlenbeck(PriceProcess):
+    """
+    Schwartz one-factor model: the log price mean-reverts.
+
+    d ln S = kappa * (mu - ln S) dt + sigma dW, simulated with the exact
+    Ornstein-Uhlenbeck transition so large mean-reversion speeds stay stable.
+    mu is set so the long-run median price equals long_run_price. There is
+    no separate drift: the pull toward long_run_price replaces it, so a
+    non-zero drift is rejected rather than ignored.
+    """
+
+    name = "ou"
+    label = "Mean-reverting (Schwartz one-factor)"
+    description = "Log price reverts toward a long-run level; suited to natural gas."
+    defaults = {
+        "mean_reversion": 3.0,  # kappa, per year (half-life ln2/kappa years)
+        "long_run_price": 0.0,  # 0 = current price
+    }
+
+    def resolve_params(self, current_price, volatility, drift, overrides=None):
+        if drift:
+            raise ValueError(
+                "The mean-reverting model has no drift; mean reversion toward "
+                "long_run_price sets the trend. Set drift=0 and use model_params "
+                "{\"long_run_price\": ...} instead"
+            )
+        params = super().resolve_params(current_price, volatility, drift, overrides)
+        kappa = params["mean_reversion"]
+        if kappa <= 0:
+            raise ValueError("mean_reversion must be positive")
+        long_run = params["long_run_price"] or current_price
+        if long_run <= 0 or current_price <= 0:
+            raise ValueError("Mean-reverting model requires positive prices")
+        decay = np.exp(-kappa * DT)
+        params.update(
+            decay=float(decay),
+            level=float(np.log(long_run)) * (1.0 - decay),
+            step_sd=float(volatility * np.sqrt((1.0 - decay ** 2) / (2.0 * kappa))),
+        )
+        return params
+
+    def step(self, prices, shocks, rng, params):
+        log_prices = np.log(prices)
+        log_prices *= params["decay"]
+        log_prices += params["level"] + params["step_sd"] * shocks
+        np.exp(log_prices, out=prices)
+
+
+class MertonJumpDiffusion(PriceProcess):
+    """
+    Merton jump-diffusion: GBM plus Poisson-arriving lognormal jumps.
+
+    The diffusion part matches GBM; jumps are compensated so the expected
+    daily return still equals drift.
+    """
+
+    name = "merton"
+    label = "Merton jump-diffusion"
+    description = "GBM with random price spikes; captures fat tails from supply shocks."
+    defaults = {
+        "jump_intensity": 5.0,    # expected jumps per year
+        "jump_mean": 0.0,         # mean log jump size
+        "jump_volatility": 0.08,  # std dev of log jump size
+    }
+
+    def resolve_params(self, current_price, volatility, drift, overrides=None):
+        params = super().resolve_params(current_price, volatility, drift, overrides)
+        if params["jump_intensity"] < 0 or params["jump_volatility"] < 0:
+            raise ValueError("jump_intensity and jump_volatility must be non-negative")
+        mean_jump = np.exp(params["jump_mean"] + 0.5 * params["jump_volatility"] ** 2) - 1.0
+        params.update(
+            daily_intensity=params["jump_intensity"] * DT,
+            compensation=float(np.exp(-params["jump_intensity"] * DT * mean_jump)),
+        )
+        return params
+
+    def step(self, prices, shocks, rng, params):
+        prices *= 1.0 + params["drift"] + params["daily_vol"] * shocks
+        counts = rng.poisson(params["daily_intensity"], size=prices.shape)
+        jumped = np.flatnonzero(counts)
+        if jumped.size:
+            n = counts[jumped]
+            log_jump = rng.normal(n * params["jump_mean"], np.sqrt(n) * params["jump_volatility"])
+            prices[jumped] *= np.exp(log_jump)
+        prices *= params["compensation"]
+
+    def terminal(self, current_price, shocks, rng, params):
+        # Jumps multiply, so only the total per path matters at the horizon:
+        # draw one Poisson count per path instead of one per path per day
+        days = shocks.shape[1]
+        prices = _compound_returns(current_price, shocks, params)
+        counts = rng.poisson(params["daily_intensity"] * days, size=prices.shape)
+        jumped = np.flatnonzero(counts)
+        if jumped.size:
+            n = counts[jumped]
+            log_jump = rng.normal(n * params["jump_mean"], np.sqrt(n) * params["jump_volatility"])
+            prices[jumped] *= np.exp(log_jump)
+        prices *= params["compensation"] ** days
+        return prices
+
+
+PROCESSES: Dict[str, PriceProcess] = {}
+
+
+def register_process(process: PriceProcess) -> PriceProcess:
+    """Add a price process to the registry (replacing any with the same name)."""
+    PROCESSES[process.name] = process
+    return process
+
+
+def get_process(name: str) -> PriceProcess:
+    """
+    Look up a registered price process.
+
+    Raises:
+        ValueError: If no process is registered under that name
+    """
+    try:
+        return PROCESSES[name.strip().lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown model '{name}'. Valid options: {', '.join(PROCESSES)}"
+        )
+
+
+for _process in (GeometricBrownianMotion(), OrnsteinUhlenbeck(), MertonJumpDiffusion()):
+    register_process(_process)
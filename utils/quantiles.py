@@ -0,0 +1,146 @@
+"""
+Batch quantile computation for Market Analysis Bot.
+Computes every requested quantile, Value-at-Risk cutoff and Expected
+Shortfall tail mean from a single np.partition call instead of one
+np.percentile/np.median call (and one re-partition) per statistic.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import List, Sequence, Tuple
+
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+logger = logging.getLogger(__name__)
+
+
+def quantile_summary(
+    values: np.ndarray,
+    probs: Sequence[float],
+    tail_probs: Sequence[float] = ()
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantiles and lower-tail means from one partition of the data.
+
+    Quantiles use linear interpolation (np.quantile's default). The tail
+    mean for probability p is the average of the smallest ceil(p * n)
+    values, i.e. the Expected Shortfall / CVaR at confidence 1 - p.
+
+    Args:
+        values: Sample values (any shape; flattened)
+        probs: Quantile probabilities in [0, 1]
+        tail_probs: Lower-tail probabilities for tail means (e.g., 0.01 for 99% CVaR)
+
+    Returns:
+        Tuple of (quantiles aligned with probs, tail means aligned with tail_probs)
+
+    Raises:
+        ValueError: If values is empty or a probability is outside [0, 1]
+    """
+    values = np.asarray(values, dtype=np.float64).ravel()
+    n = values.size
+    if n == 0:
+        raise ValueError("Cannot compute quantiles of an empty dataset")
+
+    probs = np.asarray(probs, dtype=np.float64)
+    tail_probs = np.asarray(tail_probs, dtype=np.float64)
+    for p in (probs, tail_probs):
+        if p.size and (p.min() < 0.0 or p.max() > 1.0):
+            raise ValueError("Probabilities must be between 0 and 1")
+
+    position = probs * (n - 1)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    tail_counts = np.maximum(np.ceil(tail_probs * n).astype(np.intp), 1)
+
+    kth = np.unique(np.concatenate((lower, upper, tail_counts - 1)))
+    partitioned = np.partition(values, kth)
+
+    quantiles = partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (position - lower)
+
+    # Everything left of a kth position is <= it, so each tail is a prefix;
+    # tails are nested, so one cumulative sum serves all of them
+    if tail_counts.size:
+        prefix = np.cumsum(partitioned[: tail_counts.max()])
+        tail_means = prefix[tail_counts - 1] / tail_counts
+    else:
+        tail_means = np.empty(0)
+
+    return quantiles, tail_means
+
+
+def batch_quantiles(values: np.ndarray, probs: Sequence[float]) -> np.ndarray:
+    """
+    Compute several quantiles with a single partition.
+
+    Args:
+        values: Sample values
+        probs: Quantile probabilities in [0, 1]
+
+    Returns:
+        Quantiles aligned with probs (same results as np.quantile)
+    """
+    return quantile_summary(values, probs)[0]
+
+
+def row_quantiles(values: np.ndarray, probs: Sequence[float]) -> np.ndarray:
+    """
+    Quantiles of every row of a 2-D array from one partition call.
+
+    Args:
+        values: Array of shape (rows, samples)
+        probs: Quantile probabilities in [0, 1]
+
+    Returns:
+        Array of shape (rows, len(probs)); row i equals batch_quantiles(values[i], probs)
+
+    Raises:
+        ValueError: If rows are empty or a probability is outside [0, 1]
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = values.shape[-1]
+    if n == 0:
+        raise ValueError("Cannot compute quantiles of an empty dataset")
+
+    probs = np.asarray(probs, dtype=np.float64)
+    if probs.size and (probs.min() < 0.0 or probs.max() > 1.0):
+        raise ValueError("Probabilities must be between 0 and 1")
+
+    position = probs * (n - 1)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+
+    partitioned = np.partition(values, np.unique(np.concatenate((lower, upper))), axis=-1)
+    return partitioned[..., lower] + (partitioned[..., upper] - partitioned[..., lower]) * (position - lower)
+
+
+def parse_percentiles(text: str) -> List[float]:
+    """
+    Parse a comma-separated list of percentiles into probabilities.
+
+    Args:
+        text: Percentiles between 0 and 100, e.g. "1,5,50,95,99.5"
+
+    Returns:
+        Probabilities, e.g. [0.01, 0.05, 0.5, 0.95, 0.995]
+
+    Raises:
+        ValueError: If an entry is not a number between 0 and 100
+    """
+    probs = []
+    for item in text.split(","):
+        item = item.strip().rstrip("%")
+        if not item:
+            continue
+        try:
+            pct = float(item)
+        except ValueError:
+            raise ValueError(f"Invalid percentile '{item}'. Use numbers like 5,50,95")
+        if not 0.0 <= pct <= 100.0:
+            raise ValueError(f"Percentile {pct:g} must be between 0 and 100")
+        probs.append(pct / 100.0)
+    return probs
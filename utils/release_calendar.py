@@ -0,0 +1,205 @@
+"""
+EIA release calendar for Market Analysis Bot.
+Publication schedules for the EIA datasets the tools use, so caches can keep
+data until the next release instead of expiring on a fixed TTL. Times are
+US Eastern. Federal holidays are not modelled; delayed releases are caught
+by the series cache's conditional-refresh probe.
+"""
+
+import calendar
+import datetime
+import logging
+from typing import Callable, Dict, Optional
+from zoneinfo import ZoneInfo
+
+
+logger = logging.getLogger(__name__)
+
+
+EASTERN = ZoneInfo("America/New_York")
+
+# How often to re-probe a series after a release until EIA publishes it
+PROBE_INTERVAL_SECONDS = 15 * 60
+
+# How long after a release to keep probing; after this the cached data is
+# assumed current (e.g. a holiday-delayed or skipped release)
+RELEASE_WINDOW_SECONDS = 24 * 3600
+
+
+class ReleaseSchedule:
+    """
+    Base class for a recurring EIA publication.
+
+    Attributes:
+        key: Short identifier (e.g., "wpsr")
+        name: Publication name
+    """
+
+    def __init__(self, key: str, name: str):
+        self.key = key
+        self.name = name
+
+    def last_release(self, now: Optional[datetime.datetime] = None) -> datetime.datetime:
+        """Most recent release at or before now (timezone-aware, Eastern)."""
+        raise NotImplementedError
+
+    def next_release(self, now: Optional[datetime.datetime] = None) -> datetime.datetime:
+        """First release after now (timezone-aware, Eastern)."""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(key='{self.key}', name='{self.name}')"
+
+
+class WeeklyRelease(ReleaseSchedule):
+    """
+    A release on the same weekday and time every week.
+
+    Attributes:
+        weekday: Monday=0 ... Sunday=6
+        time: Release time of day (Eastern)
+    """
+
+    def __init__(self, key: str, name: str, weekday: int, time: datetime.time):
+        super().__init__(key, name)
+        self.weekday = weekday
+        self.time = time
+
+    def last_release(self, now=None):
+        now = _eastern(now)
+        day = now.date() - datetime.timedelta(days=(now.weekday() - self.weekday) % 7)
+        release = datetime.datetime.combine(day, self.time, tzinfo=EASTERN)
+        if release > now:
+            release -= datetime.timedelta(days=7)
+        return release
+
+    def next_release(self, now=None):
+        now = _eastern(now)
+        release = self.last_release(now)
+        while release <= now:
+            release = datetime.datetime.combine(
+                release.date() + datetime.timedelta(days=7), self.time, tzinfo=EASTERN
+            )
+        return release
+
+
+class MonthlyRelease(ReleaseSchedule):
+    """
+    A release once a month on a rule-defined day.
+
+    Attributes:
+        day_rule: Function (year, month) -> release date in that month
+        time: Release time of day (Eastern)
+    """
+
+    def __init__(
+        self,
+        key: str,
+        name: str,
+        day_rule: Callable[[int, int], datetime.date],
+        time: datetime.time
+    ):
+        super().__init__(key, name)
+        self.day_rule = day_rule
+        self.time = time
+
+    def release_in(self, year: int, month: int) -> datetime.datetime:
+        """Release time within a given month."""
+        return datetime.datetime.combine(self.day_rule(year, month), self.time, tzinfo=EASTERN)
+
+    def last_release(self, now=None):
+        now = _eastern(now)
+        release = self.release_in(now.year, now.month)
+        if release > now:
+            year, month = _shift_month(now.year, now.month, -1)
+            release = self.release_in(year, month)
+        return release
+
+    def next_release(self, now=None):
+        now = _eastern(now)
+        release = self.release_in(now.year, now.month)
+        if release <= now:
+            year, month = _shift_month(now.year, now.month, 1)
+            release = self.release_in(year, month)
+        return release
+
+
+def _eastern(now: Optional[datetime.datetime]) -> datetime.datetime:
+    """Current time, or the given time, in US Eastern."""
+    if now is None:
+        return datetime.datetime.now(EASTERN)
+    if now.tzinfo is None:
+        return now.replace(tzinfo=EASTERN)
+    return now.astimezone(EASTERN)
+
+
+def _shift_month(year: int, month: int, delta: int):
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+
+def first_weekday_on_or_after(weekday: int, day: int) -> Callable[[int, int], datetime.date]:
+    """Day rule: first `weekday` on or after `day` of the month."""
+    def rule(year: int, month: int) -> datetime.date:
+        start = datetime.date(year, month, day)
+        return start + datetime.timedelta(days=(weekday - start.weekday()) % 7)
+    return rule
+
+
+def last_business_day(year: int, month: int) -> datetime.date:
+    """Day rule: last Monday-Friday of the month."""
+    last = datetime.date(year, month, calendar.monthrange(year, month)[1])
+    return last - datetime.timedelta(days=max(last.weekday() - 4, 0))
+
+
+# EIA publication schedules keyed by short name
+RELEASE_SCHEDULES: Dict[str, ReleaseSchedule] = {
+    schedule.key: schedule
+    for schedule in (
+        WeeklyRelease(
+            "wpsr", "Weekly Petroleum Status Report", weekday=2, time=datetime.time(10, 30)
+        ),
+        WeeklyRelease(
+            "wngsr", "Weekly Natural Gas Storage Report", weekday=3, time=datetime.time(10, 30)
+        ),
+        MonthlyRelease(
+            "steo", "Short-Term Energy Outlook",
+            day_rule=first_weekday_on_or_after(1, 6), time=datetime.time(12, 0)
+        ),
+        MonthlyRelease(
+            "psm", "Petroleum Supply Monthly",
+            day_rule=last_business_day, time=datetime.time(10, 0)
+        ),
+    )
+}
+
+# API path prefixes mapped to the release that updates them (longest prefix
+# wins). EIA refreshes its daily spot and futures price tables weekly,
+# alongside the Wednesday petroleum report.
+PATH_SCHEDULES: Dict[str, str] = {
+    "petroleum/pri/spt": "wpsr",
+    "petroleum/pri/fut": "wpsr",
+    "petroleum/stoc/wstk": "wpsr",
+    "petroleum/sum/sndw": "wpsr",
+    "natural-gas/pri/fut": "wpsr",
+    "natural-gas/stor/wkly": "wngsr",
+    "petroleum/prod/sum": "psm",
+    "petroleum/sum/snd": "psm",
+    "steo": "steo",
+}
+
+
+def schedule_for_path(path: Optional[str]) -> Optional[ReleaseSchedule]:
+    """
+    Release schedule that updates an EIA API path.
+
+    Returns:
+        The matching ReleaseSchedule, or None if the path's schedule is unknown
+    """
+    if not path:
+        return None
+    path = path.strip("/").lower()
+    matches = [prefix for prefix in PATH_SCHEDULES if path == prefix or path.startswith(prefix + "/")]
+    if not matches:
+        return None
+    return RELEASE_SCHEDULES[PATH_SCHEDULES[max(matches, key=len)]]
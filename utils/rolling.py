@@ -0,0 +1,277 @@
+"""
+Rolling-window analytics for Market Analysis Bot.
+Rolling and expanding statistics over a price series. Prefix sums are
+built once per series and shared by every window size, so means,
+volatilities, z-scores and drawdowns are O(n) per window and several
+windows are evaluated without recomputing each window from scratch.
+Percentiles keep a sorted window and cost O(n·w).
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from utils.lazy import lazy_import
+from utils.volatility import periods_per_year
+
+np = lazy_import("numpy")
+
+
+logger = logging.getLogger(__name__)
+
+
+ROLLING_METRICS = ("mean", "volatility", "zscore", "drawdown", "percentile")
+
+# Percentiles reported by the "percentile" metric
+DEFAULT_PERCENTILES = (0.05, 0.50, 0.95)
+
+# Window value meaning "expanding" (all observations to date)
+EXPANDING = 0
+
+
+class RollingEngine:
+    """
+    Incremental rolling/expanding statistics over one series.
+
+    Prefix sums of values and log-returns are computed once in the
+    constructor; each rolling mean, standard deviation or z-score is then a
+    single vectorized difference of prefix sums (O(n) per window).
+
+    Attributes:
+        values: Float64 values ordered oldest to newest
+        frequency: Data frequency used to annualize volatility
+    """
+
+    def __init__(self, values: Sequence[float], frequency: str = "daily"):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.frequency = frequency
+        n = len(self.values)
+
+        # Center before accumulating to keep sum-of-squares differences stable
+        self._offset = float(self.values.mean()) if n else 0.0
+        centered = self.values - self._offset
+        self._csum = np.concatenate(([0.0], np.cumsum(centered)))
+        self._csum_sq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(np.log(self.values)) if n > 1 else np.empty(0)
+        # returns[i] is the return into observation i + 1; undefined returns count as 0
+        valid = np.isfinite(returns)
+        returns = np.where(valid, returns, 0.0)
+        self._rsum = np.concatenate(([0.0], np.cumsum(returns)))
+        self._rsum_sq = np.concatenate(([0.0], np.cumsum(returns * returns)))
+        self._rcount = np.concatenate(([0], np.cumsum(valid)))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _window_bounds(self, window: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Start (inclusive) and end (exclusive) prefix indices for each observation."""
+        end = np.arange(1, len(self.values) + 1)
+        if window == EXPANDING:
+            start = np.zeros_like(end)
+        else:
+            start = np.maximum(end - window, 0)
+        return start, end
+
+    def _mask_incomplete(self, result: np.ndarray, window: int) -> np.ndarray:
+        """Set observations without a full window to NaN."""
+        if window != EXPANDING and window > 1:
+            result[: window - 1] = np.nan
+        return result
+
+    def mean(self, window: int) -> np.ndarray:
+        """Rolling mean of values (window=0 for expanding)."""
+        start, end = self._window_bounds(window)
+        count = end - start
+        result = (self._csum[end] - self._csum[start]) / count + self._offset
+        return self._mask_incomplete(result, window)
+
+    def std(self, window: int) -> np.ndarray:
+        """Rolling sample standard deviation of values (window=0 for expanding)."""
+        start, end = self._window_bounds(window)
+        count = (end - start).astype(np.float64)
+        total = self._csum[end] - self._csum[start]
+        total_sq = self._csum_sq[end] - self._csum_sq[start]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = (total_sq - total * total / count) / (count - 1)
+        result = np.sqrt(np.maximum(var, 0.0))
+        result[count < 2] = np.nan
+        return self._mask_incomplete(result, window)
+
+    def zscore(self, window: int) -> np.ndarray:
+        """Z-score of each value against its trailing window."""
+        std = self.std(window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = (self.values - self.mean(window)) / std
+        result[std == 0] = np.nan
+        return result
+
+    def volatility(self, window: int) -> np.ndarray:
+        """
+        Rolling annualized volatility of log-returns.
+
+        A window of N observations spans N - 1 returns, matching how traders
+        quote "20-day vol" on 20 closing prices.
+        """
+        n = len(self.values)
+        end = np.arange(0, n)  # returns available up to observation i
+        if window == EXPANDING:
+            start = np.zeros_like(end)
+        else:
+            start = np.maximum(end - (window - 1), 0)
+        count = (self._rcount[end] - self._rcount[start]).astype(np.float64)
+        total = self._rsum[end] - self._rsum[start]
+        total_sq = self._rsum_sq[end] - self._rsum_sq[start]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = (total_sq - total * total / count) / (count - 1)
+        result = np.sqrt(np.maximum(var, 0.0) * periods_per_year(self.frequency))
+        result[count < 2] = np.nan
+        return self._mask_incomplete(result, window)
+
+    def drawdown(self, window: int = EXPANDING) -> np.ndarray:
+        """
+        Drawdown from the trailing peak as a negative fraction (e.g., -0.12).
+
+        Expanding drawdown uses a running maximum; rolling drawdown keeps a
+        monotonic deque of candidate peaks, so both are O(n).
+        """
+        if window == EXPANDING:
+            peak = np.maximum.accumulate(self.values)
+        else:
+            peak = _rolling_max(self.values, window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = self.values / peak - 1.0
+        return self._mask_incomplete(result, window)
+
+    def quantiles(
+        self,
+        window: int,
+        probs: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> np.ndarray:
+        """
+        Rolling quantiles of values, one column per probability.
+
+        Maintains a sorted window with one insert and one removal per step,
+        and reads every requested quantile from it (linear interpolation,
+        matching numpy's default). Each insert and removal shifts up to `w`
+        list entries, so this is O(n·w) (O(n²) expanding). The shifts are
+        memmoves, cheap for the window sizes used here; the benchmark in
+        benchmarks/bench_rolling.py times this metric on its own.
+
+        Returns:
+            Array of shape (n, len(probs))
+        """
+        n = len(self.values)
+        probs = [float(p) for p in probs]
+        result = np.full((n, len(probs)), np.nan)
+        window_sorted: List[float] = []
+        values = self.values.tolist()
+
+        for i, value in enumerate(values):
+            bisect.insort(window_sorted, value)
+            if window != EXPANDING and i >= window:
+                del window_sorted[bisect.bisect_left(window_sorted, values[i - window])]
+            if window != EXPANDING and i < window - 1:
+                continue
+            last = len(window_sorted) - 1
+            row = result[i]
+            for j, prob in enumerate(probs):
+                pos = prob * last
+                lower = int(pos)
+                low_value = window_sorted[lower]
+                high_value = window_sorted[min(lower + 1, last)]
+                row[j] = low_value + (high_value - low_value) * (pos - lower)
+
+        return result
+
+    def compute(
+        self,
+        windows: Iterable[int],
+        metrics: Iterable[str] = ROLLING_METRICS,
+        probs: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[Tuple[str, int], np.ndarray]:
+        """
+        Compute several metrics for several windows in one call.
+
+        Args:
+            windows: Window sizes in observations (0 for expanding)
+            metrics: Metric names from ROLLING_METRICS
+            probs: Probabilities for the "percentile" metric
+
+        Returns:
+            Dict keyed by (metric, window). "percentile" values have one
+            column per probability.
+        """
+        metrics = list(metrics)
+        unknown = [m for m in metrics if m not in ROLLING_METRICS]
+        if unknown:
+            raise ValueError(
+                f"Invalid metric(s): {', '.join(unknown)}. "
+                f"Valid options: {', '.join(ROLLING_METRICS)}"
+            )
+
+        results: Dict[Tuple[str, int], np.ndarray] = {}
+        for window in windows:
+            validate_window(window)
+            for metric in metrics:
+                if metric == "percentile":
+                    results[(metric, window)] = self.quantiles(window, probs)
+                else:
+                    results[(metric, window)] = getattr(self, metric)(window)
+        return results
+
+
+def _rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing-window maximum using a monotonic deque (O(n))."""
+    items = values.tolist()
+    result = [0.0] * len(items)
+    candidates: deque = deque()
+    for i, value in enumerate(items):
+        while candidates and items[candidates[-1]] <= value:
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        result[i] = items[candidates[0]]
+    return np.array(result)
+
+
+def validate_window(window: int) -> None:
+    """
+    Check a window size is 0 (expanding) or at least 2 observations.
+
+    Raises:
+        ValueError: If the window is negative or 1
+    """
+    if window < 0 or (window != EXPANDING and window < 2):
+        raise ValueError(f"Invalid window {window}: use 0 (expanding) or >= 2")
+
+
+def parse_windows(windows: str) -> List[int]:
+    """
+    Parse a comma-separated window list such as "20,60,expanding".
+
+    Raises:
+        ValueError: If a window is not an integer or "expanding"
+    """
+    parsed = []
+    for item in windows.split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        parsed.append(EXPANDING if item == "expanding" else int(item))
+    if not parsed:
+        raise ValueError("At least one window is required")
+    return parsed
+
+
+def window_label(window: int, frequency: Optional[str] = None) -> str:
+    """Human-readable window label, e.g. "20-day" or "expanding"."""
+    if window == EXPANDING:
+        return "expanding"
+    unit = {"daily": "day", "weekly": "week", "monthly": "month", "annual": "year"}
+    return f"{window}-{unit.get(frequency, 'period')}"
@@ -0,0 +1,477 @@
+"""
+EIA Series Cache for Market Analysis Bot.
+Keeps recently fetched EIA series in memory as NumPy arrays so analysis tools
+can reuse them without another API round-trip. Series whose EIA release
+schedule is known are kept until the next release, then revalidated with a
+one-row probe before refetching.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from utils.eia_client import EIAClient
+from utils.lazy import lazy_import
+from utils.metrics import metrics
+from utils.release_calendar import (
+    EASTERN,
+    PROBE_INTERVAL_SECONDS,
+    RELEASE_WINDOW_SECONDS,
+    ReleaseSchedule,
+    schedule_for_path,
+)
+from utils.volatility import log_returns
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+requests = lazy_import("requests")
+
+
+logger = logging.getLogger(__name__)
+
+
+# Known EIA series with the API path and default frequency used to fetch them
+SERIES_CATALOG: Dict[str, Dict[str, str]] = {
+    "RWTC": {
+        "path": "petroleum/pri/spt",
+        "frequency": "daily",
+        "name": "WTI Cushing Spot Price",
+        "units": "$/barrel",
+    },
+    "RBRTE": {
+        "path": "petroleum/pri/spt",
+        "frequency": "daily",
+        "name": "Brent Europe Spot Price",
+        "units": "$/barrel",
+    },
+    "RNGWHHD": {
+        "path": "natural-gas/pri/fut",
+        "frequency": "daily",
+        "name": "Henry Hub Natural Gas Spot Price",
+        "units": "$/MMBtu",
+    },
+    "EER_EPMRU_PF4_Y35NY_DPG": {
+        "path": "petroleum/pri/spt",
+        "frequency": "daily",
+        "name": "New York Harbor Conventional Gasoline Spot Price",
+        "units": "$/gallon",
+    },
+    "EER_EPD2DXL0_PF4_Y35NY_DPG": {
+        "path": "petroleum/pri/spt",
+        "frequency": "daily",
+        "name": "New York Harbor Ultra-Low Sulfur Diesel Spot Price",
+        "units": "$/gallon",
+    },
+    "EER_EPD2F_PF4_Y35NY_DPG": {
+        "path": "petroleum/pri/spt",
+        "frequency": "daily",
+        "name": "New York Harbor No. 2 Heating Oil Spot Price",
+        "units": "$/gallon",
+    },
+    "MCRFPUS1": {
+        "path": "petroleum/prod/sum",
+        "frequency": "monthly",
+        "name": "U.S. Field Production of Crude Oil",
+        "units": "thousand barrels/day",
+    },
+    "WTIPUUS": {
+        "path": "steo",
+        "frequency": "monthly",
+        "name": "STEO WTI Price Forecast",
+        "units": "$/barrel",
+    },
+}
+
+
+class CachedSeries:
+    """
+    An EIA series held in memory, sorted oldest to newest.
+
+    Attributes:
+        series_id: EIA series ID (e.g., "RWTC")
+        frequency: Data frequency (daily, weekly, monthly, annual)
+        periods: Array of period strings, oldest first
+        values: Read-only float64 array of values aligned with periods
+        fetched_at: Unix timestamp when the data was fetched
+        checked_at: Unix timestamp when the data was last confirmed current
+            (fetched, or revalidated by a release probe)
+        path: EIA API path the series came from, if known
+        returns: Read-only log-returns of values, computed on first use
+    """
+
+    def __init__(
+        self,
+        series_id: str,
+        frequency: str,
+        periods: np.ndarray,
+        values: np.ndarray,
+        fetched_at: Optional[float] = None,
+        path: Optional[str] = None
+    ):
+        self.series_id = series_id
+        self.frequency = frequency
+        self.periods = np.asarray(periods)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.values.flags.writeable = False
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.checked_at = self.fetched_at
+        self.path = path
+        self._returns: Optional[np.ndarray] = None
+
+    @property
+    def returns(self) -> np.ndarray:
+        """Log-returns of the series, computed once and shared by all callers."""
+        if self._returns is None:
+            returns = log_returns(self.values)
+            returns.flags.writeable = False
+            self._returns = returns
+        return self._returns
+
+    @property
+    def latest(self) -> float:
+        """Most recent value in the series."""
+        return float(self.values[-1])
+
+    @property
+    def latest_period(self) -> str:
+        """Period label of the most recent value."""
+        return str(self.periods[-1])
+
+    @property
+    def name(self) -> str:
+        """Human-readable series name from the catalog, or the series ID."""
+        return SERIES_CATALOG.get(self.series_id, {}).get("name", self.series_id)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return (
+            f"CachedSeries(series_id='{self.series_id}', frequency='{self.frequency}', "
+            f"points={len(self)})"
+        )
+
+
+def records_to_series(
+    series_id: str,
+    frequency: str,
+    records: list,
+    path: Optional[str] = None
+) -> CachedSeries:
+    """
+    Convert EIA API records into a CachedSeries.
+
+    Values are coerced to float (the API sometimes returns strings), rows
+    without a numeric value are dropped and the result is sorted by period.
+
+    Args:
+        series_id: EIA series ID
+        frequency: Data frequency of the records
+        records: List of record dicts with "period" and "value" keys
+        path: EIA API path the records came from
+
+    Returns:
+        CachedSeries sorted oldest to newest
+    """
+    df = pd.DataFrame.from_records(records, columns=["period", "value"])
+    df["value"] = pd.to_numeric(df["value"], errors="coerce")
+    df = df.dropna(subset=["value"]).sort_values("period", kind="stable")
+
+    return CachedSeries(
+        series_id=series_id,
+        frequency=frequency,
+        periods=df["period"].astype(str).to_numpy(),
+        values=df["value"].to_numpy(dtype=np.float64),
+        path=path,
+    )
+
+
+class SeriesCache:
+    """
+    In-memory cache of EIA series keyed by (series_id, frequency).
+
+    Series from a path with a known release schedule (see
+    utils.release_calendar) stay fresh until the next release. After a
+    release the cache sends a one-row probe; if EIA has not published new
+    data yet the cached copy is kept and the probe repeated every
+    PROBE_INTERVAL_SECONDS, otherwise the series is refetched. Series with
+    no known schedule expire after a fixed TTL. Thread-safe so it can be
+    shared by concurrently executing tools.
+    """
+
+    DEFAULT_TTL = 3600  # seconds
+    FETCH_LIMIT = 5000  # EIA API maximum rows per request
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        ttl_seconds: float = DEFAULT_TTL,
+        client: Optional[EIAClient] = None
+    ):
+        """
+        Initialize the series cache.
+
+        Args:
+            api_key: EIA API key used to create a client on first fetch
+            ttl_seconds: Seconds before a series with no release schedule is refetched
+            client: Optional pre-built EIAClient (takes precedence over api_key)
+        """
+        self.api_key = api_key
+        self.ttl_seconds = ttl_seconds
+        self._client = client
+        self._entries: Dict[tuple, CachedSeries] = {}
+        self._fetch_locks: Dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        series_id: str,
+        frequency: Optional[str] = None,
+        path: Optional[str] = None
+    ) -> CachedSeries:
+        """
+        Return a series from the cache, fetching it from EIA if missing or stale.
+
+        Args:
+            series_id: EIA series ID (e.g., "RWTC")
+            frequency: Data frequency (defaults to the catalog frequency)
+            path: API path (defaults to the catalog path)
+
+        Returns:
+            CachedSeries with the full available history (up to 5000 points)
+
+        Raises:
+            ValueError: If the series is unknown and no path is given, the API
+                key is missing, or EIA returns no data
+        """
+        series_id = series_id.strip().upper()
+        spec = SERIES_CATALOG.get(series_id, {})
+        frequency = frequency or spec.get("frequency", "monthly")
+        key = (series_id, frequency)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and self._is_fresh(cached):
+                logger.debug("Series cache hit: %s (%s)", series_id, frequency)
+                metrics.record_series_cache(hit=True)
+                return cached
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        # One fetch per key at a time: concurrent callers (e.g. prefetch and a
+        # user request) wait for the in-flight fetch instead of duplicating it
+        with fetch_lock:
+            with self._lock:
+                cached = self._entries.get(key)
+            if cached is not None and (self._is_fresh(cached) or self._revalidate(cached)):
+                metrics.record_series_cache(hit=True)
+                return cached
+            metrics.record_series_cache(hit=False)
+            series = self._fetch(series_id, frequency, path or spec.get("path"))
+            self.put(series)
+        return series
+
+    def get_many(
+        self,
+        series_ids: Iterable[str],
+        frequency: Optional[str] = None,
+        max_workers: int = 4
+    ) -> Dict[str, CachedSeries]:
+        """
+        Return several series, fetching the missing or stale ones concurrently.
+
+        Args:
+            series_ids: EIA series IDs from the catalog
+            frequency: Data frequency (defaults to each series' catalog frequency)
+            max_workers: Maximum concurrent EIA requests
+
+        Returns:
+            Dict mapping each (normalized) series ID to its CachedSeries
+
+        Raises:
+            ValueError: If any series cannot be fetched (see get)
+        """
+        series_ids = list(dict.fromkeys(s.strip().upper() for s in series_ids))
+        result: Dict[str, CachedSeries] = {}
+        missing = []
+        for series_id in series_ids:
+            freq = frequency or SERIES_CATALOG.get(series_id, {}).get("frequency", "monthly")
+            with self._lock:
+                cached = self._entries.get((series_id, freq))
+            if cached is not None and self._is_fresh(cached):
+                metrics.record_series_cache(hit=True)
+                result[series_id] = cached
+            else:
+                missing.append(series_id)
+
+        if len(missing) == 1:
+            result[missing[0]] = self.get(missing[0], frequency)
+        elif missing:
+            logger.info("Fetching %s series concurrently: %s", len(missing), ', '.join(missing))
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+                fetched = pool.map(lambda sid: self.get(sid, frequency), missing)
+                result.update(zip(missing, fetched))
+        return {series_id: result[series_id] for series_id in series_ids}
+
+    def put(self, series: CachedSeries) -> None:
+        """Store a series in the cache, replacing any existing entry."""
+        with self._lock:
+            self._entries[(series.series_id, series.frequency)] = series
+
+    def invalidate(self, series_id: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            series_id: Series to drop (all frequencies). If None, clear everything.
+        """
+        with self._lock:
+            if series_id is None:
+                self._entries.clear()
+            else:
+                series_id = series_id.strip().upper()
+                for key in [k for k in self._entries if k[0] == series_id]:
+                    del self._entries[key]
+
+    def _is_fresh(self, series: CachedSeries) -> bool:
+        """
+        Check whether a cached series can be served without contacting EIA.
+
+        A scheduled series is fresh if it was fetched after the latest
+        release, or if a probe since the release found nothing new and the
+        probe is recent (or the release window has passed). Unscheduled
+        series use the TTL.
+        """
+        now = time.time()
+        schedule = schedule_for_path(series.path)
+        if schedule is None:
+            return (now - series.fetched_at) < self.ttl_seconds
+
+        released = _last_release_timestamp(schedule, now)
+        if series.fetched_at >= released:
+            return True
+        if series.checked_at < released:
+            return False
+        if now - released >= RELEASE_WINDOW_SECONDS:
+            return True
+        return (now - series.checked_at) < PROBE_INTERVAL_SECONDS
+
+    def awaiting_release(self, series: CachedSeries) -> bool:
+        """
+        Check whether a release is due for a series but has not reached it.
+
+        True when the latest scheduled release is newer than the cached data
+        and still within the release window, i.e. the data is expected to
+        change once EIA publishes.
+        """
+        schedule = schedule_for_path(series.path)
+        if schedule is None:
+            return False
+        now = time.time()
+        released = _last_release_timestamp(schedule, now)
+        return series.fetched_at < released and now - released < RELEASE_WINDOW_SECONDS
+
+    def _revalidate(self, series: CachedSeries) -> bool:
+        """
+        Probe EIA for the latest observation of a scheduled series.
+
+        Returns:
+            True if the latest period and value are unchanged (the cached
+            copy is marked current) or EIA could not be reached (the cached
+            copy is served and the probe retried on the next call), False
+            if the series must be refetched
+        """
+        if schedule_for_path(series.path) is None:
+            return False
+
+        try:
+            data = self._get_client().query(
+                path=series.path,
+                facets={"series": [series.series_id]},
+                frequency=series.frequency,
+                sort=[{"column": "period", "direction": "desc"}],
+                limit=1,
+            )
+        except requests.RequestException as e:
+            # checked_at is left alone, so the series stays awaiting release
+            logger.warning("Release probe for %s failed, serving cached copy: %s", series.series_id, e)
+            return True
+        records = data.get("response", {}).get("data", [])
+        if not records:
+            return False
+        latest = records[0]
+        try:
+            unchanged = (
+                str(latest.get("period")) == series.latest_period
+                and float(latest.get("value")) == series.latest
+            )
+        except (TypeError, ValueError):
+            return False
+        if unchanged:
+            series.checked_at = time.time()
+            logger.debug("Release probe: %s unchanged at %s", series.series_id, series.latest_period)
+        else:
+            logger.info("Release probe: %s has new data (%s)", series.series_id, latest.get('period'))
+        return unchanged
+
+    def _get_client(self) -> EIAClient:
+        """Create the EIA client on first use."""
+        if self._client is None:
+            if not self.api_key:
+                raise ValueError(
+                    "EIA_API_KEY not configured. Register at: "
+                    "https://signups.eia.gov/api/signup/"
+                )
+            self._client = EIAClient(self.api_key)
+        return self._client
+
+    def _fetch(self, series_id: str, frequency: str, path: Optional[str]) -> CachedSeries:
+        """Fetch the full history of a series from the EIA API."""
+        if not path:
+            raise ValueError(
+                f"Unknown series '{series_id}'. Known series: "
+                f"{', '.join(SERIES_CATALOG)}. Provide an API path for other series."
+            )
+
+        logger.info("Fetching EIA series %s (%s) from %s", series_id, frequency, path)
+        data = self._get_client().query(
+            path=path,
+            facets={"series": [series_id]},
+            frequency=frequency,
+            sort=[{"column": "period", "direction": "desc"}],
+            limit=self.FETCH_LIMIT,
+        )
+        records = data.get("response", {}).get("data", [])
+        if not records:
+            raise ValueError(f"EIA returned no data for series '{series_id}' ({frequency})")
+
+        return records_to_series(series_id, frequency, records, path=path)
+
+
+def _last_release_timestamp(schedule: ReleaseSchedule, now: float) -> float:
+    """Unix timestamp of the schedule's latest release at or before now."""
+    return schedule.last_release(datetime.datetime.fromtimestamp(now, EASTERN)).timestamp()
+
+
+_series_cache: Optional[SeriesCache] = None
+_series_cache_lock = threading.Lock()
+
+
+def get_series_cache() -> SeriesCache:
+    """
+    Get the process-wide series cache, creating it on first use.
+
+    Returns:
+        Shared SeriesCache configured from the EIA_API_KEY environment variable
+    """
+    global _series_cache
+    if _series_cache is None:
+        with _series_cache_lock:
+            if _series_cache is None:
+                _series_cache = SeriesCache(api_key=os.getenv("EIA_API_KEY"))
+    return _series_cache
@@ -0,0 +1,553 @@
+"""
+Vectorized Monte Carlo price simulation for Market Analysis Bot.
+Simulates price paths as NumPy arrays (one row per path). Standard-normal
+shock matrices are pooled per (seed, days, simulations) so parameter sweeps
+rescale them instead of redrawing, and recent terminal-price distributions
+are cached so position-only changes do not resimulate. Any model in the
+utils.processes registry runs on the same chunked, thread-parallel engine.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from utils.lazy import lazy_import
+from utils.processes import TRADING_DAYS, get_process
+
+np = lazy_import("numpy")
+
+
+logger = logging.getLogger(__name__)
+
+
+# Default RNG seed; fixed so demo results are reproducible
+DEFAULT_SEED = 42
+
+# Paths simulated per block, bounding peak memory to ~rows * days * 8 bytes
+PATH_CHUNK_ROWS = 50_000
+
+# Working-set budget for one broadcast block of a parameter grid
+GRID_BLOCK_BYTES = 64 * 2**20
+
+# Default memory budget for pooled shock matrices (override with SHOCK_POOL_MB)
+DEFAULT_POOL_BYTES = 256 * 2**20
+
+# Threads used to simulate path blocks (override with SIMULATION_WORKERS);
+# NumPy releases the GIL inside array kernels, so blocks run concurrently
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+class ShockPool:
+    """
+    Bounded LRU pool of standard-normal shock matrices.
+
+    Matrices are keyed by (seed, days, simulations) and shared read-only, so
+    a what-if sweep over volatility, drift or starting price rescales the
+    same shocks instead of redrawing them. Matrices larger than the pool are
+    never stored.
+
+    Attributes:
+        max_bytes: Memory budget for all pooled matrices
+        hits: Number of lookups served from the pool
+        misses: Number of lookups that had to draw new shocks
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_POOL_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[int, int, int], np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently held by pooled matrices."""
+        return self._bytes
+
+    def get(self, seed: int, days: int, simulations: int) -> Optional[np.ndarray]:
+        """
+        Return the (simulations, days) shock matrix for a seed.
+
+        Returns:
+            Read-only matrix of standard-normal draws, or None if it would
+            not fit in the pool (callers then draw shocks block by block)
+        """
+        key = (int(seed), int(days), int(simulations))
+        size = simulations * days * 8
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        if size > self.max_bytes:
+            return None
+
+        shocks = np.random.RandomState(seed).standard_normal((simulations, days))
+        shocks.flags.writeable = False
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = shocks
+                self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+        return shocks
+
+    def clear(self) -> None:
+        """Release all pooled matrices."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+shock_pool = ShockPool(
+    max_bytes=int(os.getenv("SHOCK_POOL_MB", DEFAULT_POOL_BYTES // 2**20)) * 2**20
+)
+
+
+def shock_blocks(
+    seed: int,
+    days: int,
+    simulations: int
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yield (first_row, block) pieces of the standard-normal shock matrix.
+
+    Uses the pooled matrix when it fits, otherwise draws blocks of
+    PATH_CHUNK_ROWS rows from the same seeded stream. Either way the
+    concatenated blocks are identical.
+    """
+    shocks = shock_pool.get(seed, days, simulations)
+    if shocks is not None:
+        for start in range(0, simulations, PATH_CHUNK_ROWS):
+            yield start, shocks[start:start + PATH_CHUNK_ROWS]
+        return
+
+    rng = np.random.RandomState(seed)
+    for start in range(0, simulations, PATH_CHUNK_ROWS):
+        rows = min(PATH_CHUNK_ROWS, simulations - start)
+        yield start, rng.standard_normal((rows, days))
+
+
+def simulate_gbm(
+    current_price: float,
+    volatility: float,
+    days: int,
+    simulations: int,
+    drift: float = 0.0,
+    seed: int = DEFAULT_SEED
+) -> np.ndarray:
+    """
+    Simulate terminal prices under geometric Brownian motion.
+
+    Each path compounds daily returns drift + volatility / sqrt(252) * Z with
+    Z from the seeded shock matrix, so results are identical to drawing one
+    N(drift, daily_vol) shock per path per day in a Python loop. Shocks come
+    from the shared pool, so reruns with new volatility, drift or price only
+    rescale existing draws.
+
+    Args:
+        current_price: Starting price
+        volatility: Annual volatility as decimal
+        days: Number of days to simulate
+        simulations: Number of paths
+        drift: Expected daily return as decimal
+        seed: RNG seed
+
+    Returns:
+        Array of terminal prices, one per path
+
+    Raises:
+        ValueError: For non-positive days/simulations or negative volatility
+    """
+    _validate(volatility, days, simulations)
+    daily_vol = volatility / np.sqrt(TRADING_DAYS)
+
+    terminal = np.empty(simulations)
+    buffer = np.empty((min(PATH_CHUNK_ROWS, simulations), days))
+    for start, shocks in shock_blocks(seed, days, simulations):
+        rows = len(shocks)
+        returns = buffer[:rows]
+        np.multiply(shocks, daily_vol, out=returns)
+        returns += drift
+        returns += 1.0
+        np.prod(returns, axis=1, out=terminal[start:start + rows])
+    terminal *= current_price
+    return terminal
+
+
+def simulate_process(
+    model: str,
+    current_price: float,
+    volatility: float,
+    days: int,
+    simulations: int,
+    drift: float = 0.0,
+    seed: int = DEFAULT_SEED,
+    params: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None
+) -> np.ndarray:
+    """
+    Simulate terminal prices under any registered price process.
+
+    Paths are split into the same PATH_CHUNK_ROWS blocks as simulate_gbm and
+    the blocks are simulated on a thread pool. Each block gets its own
+    generator for model-specific randomness (jumps), seeded from (seed,
+    block index), so results do not depend on the number of workers. For
+    "gbm" the output is identical to simulate_gbm.
+
+    Args:
+        model: Registered process name ("gbm", "ou", "merton", ...)
+        current_price: Starting price
+        volatility: Annual volatility as decimal
+        days: Number of days to simulate
+        simulations: Number of paths
+        drift: Expected daily return as decimal
+        seed: RNG seed
+        params: Model-specific parameter overrides
+        workers: Threads to use (default SIMULATION_WORKERS or DEFAULT_WORKERS)
+
+    Returns:
+        Array of terminal prices, one per path
+
+    Raises:
+        ValueError: For an unknown model, invalid parameters or
+            non-positive days/simulations
+    """
+    _validate(volatility, days, simulations)
+    process = get_process(model)
+    resolved = process.resolve_params(current_price, volatility, drift, params)
+    if workers is None:
+        workers = int(os.getenv("SIMULATION_WORKERS", DEFAULT_WORKERS))
+
+    terminal = np.empty(simulations)
+
+    def run_block(start: int, shocks: np.ndarray) -> None:
+        rng = np.random.default_rng([seed, start // PATH_CHUNK_ROWS])
+        terminal[start:start + len(shocks)] = process.terminal(
+            current_price, shocks, rng, resolved
+        )
+
+    blocks = shock_blocks(seed, days, simulations)
+    if workers <= 1 or simulations <= PATH_CHUNK_ROWS:
+        for start, shocks in blocks:
+            run_block(start, shocks)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_block, start, shocks) for start, shocks in blocks]
+            for future in futures:
+                future.result()
+    return terminal
+
+
+def simulate_bootstrap(
+    current_price: float,
+    returns: np.ndarray,
+    days: int,
+    simulations: int,
+    block_size: int = 5,
+    drift: Optional[float] = 0.0,
+    seed: int = DEFAULT_SEED
+) -> np.ndarray:
+    """
+    Simulate terminal prices by block-bootstrapping historical log-returns.
+
+    Each path concatenates ceil(days / block_size) randomly chosen runs of
+    block_size consecutive returns (moving block bootstrap), which keeps
+    fat tails and short-range volatility clustering from the history. The
+    sum of every possible block is precomputed from one cumulative sum, so
+    a path costs one gather per block and no per-day work.
+
+    Args:
+        current_price: Starting price
+        returns: Historical log-returns, oldest first
+        days: Number of periods to simulate
+        simulations: Number of paths
+        block_size: Consecutive returns per resampled block
+        drift: Expected return per period as decimal; the history is
+            shifted so the mean resampled growth factor is 1 + drift.
+            None keeps the historical drift.
+        seed: RNG seed
+
+    Returns:
+        Array of terminal prices, one per path
+
+    Raises:
+        ValueError: If there are fewer returns than one block, or for
+            non-positive days/simulations/block_size
+    """
+    _validate(0.0, days, simulations)
+    returns = np.asarray(returns, dtype=np.float64)
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1")
+    if returns.size < block_size:
+        raise ValueError(
+            f"Need at least {block_size} historical returns for block_size={block_size}, "
+            f"got {returns.size}"
+        )
+
+    if drift is not None:
+        centre = returns.max()
+        log_mean_growth = centre + np.log(np.mean(np.exp(returns - centre)))
+        returns = returns - log_mean_growth + np.log1p(drift)
+
+    # Sum of returns[i:i + length] for every start i, from one cumulative sum
+    cumulative = np.concatenate(([0.0], np.cumsum(returns)))
+    full_blocks, remainder = divmod(days, block_size)
+    block_sums = cumulative[block_size:] - cumulative[:-block_size]
+    partial_sums = cumulative[remainder:] - cumulative[:-remainder] if remainder else None
+
+    rng = np.random.default_rng(seed)
+    terminal = np.empty(simulations)
+    for start in range(0, simulations, PATH_CHUNK_ROWS):
+        rows = min(PATH_CHUNK_ROWS, simulations - start)
+        log_growth = np.zeros(rows)
+        if full_blocks:
+            picks = rng.integers(0, block_sums.size, size=(rows, full_blocks))
+            log_growth += block_sums[picks].sum(axis=1)
+        if remainder:
+            log_growth += partial_sums[rng.integers(0, block_sums.size, size=rows)]
+        np.exp(log_growth, out=terminal[start:start + rows])
+    terminal *= current_price
+    return terminal
+
+
+def simulate_gbm_grid(
+    current_price: float,
+    volatilities: Sequence[float],
+    drifts: Sequence[float],
+    days: Union[int, Sequence[int]],
+    simulations: int,
+    seed: int = DEFAULT_SEED
+) -> np.ndarray:
+    """
+    Simulate terminal prices for every (volatility, drift) pair at once.
+
+    All grid points share one shock matrix and are evaluated in a single
+    broadcast per block of paths, with block size chosen so the
+    (grid, paths, days) working array stays within GRID_BLOCK_BYTES.
+    Several horizons are read off the same paths, simulated once to the
+    longest one.
+
+    Args:
+        current_price: Starting price
+        volatilities: Annual volatilities as decimals
+        drifts: Expected daily returns as decimals
+        days: Number of days to simulate, or a sequence of horizons
+        simulations: Number of paths per grid point
+        seed: RNG seed
+
+    Returns:
+        Array of shape (len(volatilities) * len(drifts), simulations) in
+        volatility-major order; row i matches simulate_gbm for that pair.
+        For a sequence of horizons, shape (len(days), points, simulations)
+    """
+    horizons = np.atleast_1d(np.asarray(days, dtype=np.intp))
+    if horizons.size == 0 or horizons.min() < 1:
+        raise ValueError("days must be at least 1")
+    max_days = int(horizons.max())
+    vols = np.asarray(volatilities, dtype=np.float64)
+    drift_values = np.asarray(drifts, dtype=np.float64)
+    for vol in vols:
+        _validate(vol, max_days, simulations)
+
+    daily_vol = np.repeat(vols / np.sqrt(TRADING_DAYS), len(drift_values))[:, None, None]
+    daily_drift = np.tile(drift_values, len(vols))[:, None, None]
+    points = daily_vol.shape[0]
+    block_rows = max(1, GRID_BLOCK_BYTES // (points * max_days * 8))
+    single = np.ndim(days) == 0
+
+    terminal = np.empty((horizons.size, points, simulations))
+    for start, shocks in shock_blocks(seed, max_days, simulations):
+        for offset in range(0, len(shocks), block_rows):
+            block = shocks[offset:offset + block_rows]
+            returns = daily_vol * block[None, :, :]
+            returns += daily_drift
+            returns += 1.0
+            first = start + offset
+            if single:
+                np.prod(returns, axis=2, out=terminal[0, :, first:first + len(block)])
+            else:
+                np.cumprod(returns, axis=2, out=returns)
+                terminal[:, :, first:first + len(block)] = np.moveaxis(returns[:, :, horizons - 1], 2, 0)
+    terminal *= current_price
+    return terminal[0] if single else terminal
+
+
+def analytic_gbm_quantiles(
+    current_price: float,
+    volatilities: Sequence[float],
+    drifts: Sequence[float],
+    days: int,
+    probs: Sequence[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed-form mean and lognormal-approximation quantiles of the terminal price.
+
+    The mean is exact for compounded daily returns, S0 * (1 + drift)^days.
+    Quantiles approximate the log price as normal with the matching
+    per-day log-return mean and variance.
+
+    Returns:
+        Tuple of (means with shape (points,), quantiles with shape
+        (points, len(probs))) in volatility-major order
+    """
+    daily_vol = np.repeat(np.asarray(volatilities, float) / np.sqrt(TRADING_DAYS), len(drifts))
+    drift = np.tile(np.asarray(drifts, float), len(volatilities))
+    growth = 1.0 + drift
+
+    mean = current_price * growth ** days
+    log_sd = daily_vol / growth
+    log_mean = days * (np.log(growth) - 0.5 * log_sd ** 2)
+    z = _normal_ppf(np.asarray(probs, dtype=np.float64))
+    quantiles = current_price * np.exp(
+        log_mean[:, None] + np.sqrt(days) * log_sd[:, None] * z[None, :]
+    )
+    return mean, quantiles
+
+
+def _normal_ppf(probs: np.ndarray) -> np.ndarray:
+    """Standard normal quantile function (Acklam's rational approximation)."""
+    a = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+         1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+    b = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+         6.680131188771972e+01, -1.328068155288572e+01)
+    c = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+         -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+    d = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+         3.754408661907416e+00)
+
+    p = np.clip(probs, 1e-12, 1 - 1e-12)
+    result = np.empty_like(p)
+    low, high = p < 0.02425, p > 1 - 0.02425
+    mid = ~(low | high)
+
+    q = np.sqrt(-2 * np.log(p[low]))
+    result[low] = (((((c[0]*q + c[1])*q + c[2])*q + c[3])*q + c[4])*q + c[5]) / \
+        ((((d[0]*q + d[1])*q + d[2])*q + d[3])*q + 1)
+    q = np.sqrt(-2 * np.log(1 - p[high]))
+    result[high] = -(((((c[0]*q + c[1])*q + c[2])*q + c[3])*q + c[4])*q + c[5]) / \
+        ((((d[0]*q + d[1])*q + d[2])*q + d[3])*q + 1)
+    q = p[mid] - 0.5
+    r = q * q
+    result[mid] = (((((a[0]*r + a[1])*r + a[2])*r + a[3])*r + a[4])*r + a[5]) * q / \
+        (((((b[0]*r + b[1])*r + b[2])*r + b[3])*r + b[4])*r + 1)
+    return result
+
+
+def _validate(volatility: float, days: int, simulations: int) -> None:
+    """Validate simulation parameters."""
+    if days < 1:
+        raise ValueError("days must be at least 1")
+    if simulations < 1:
+        raise ValueError("simulations must be at least 1")
+    if volatility < 0:
+        raise ValueError("volatility must be non-negative")
+
+
+class TerminalPriceCache:
+    """
+    LRU cache of simulated terminal-price arrays keyed by simulation inputs.
+
+    Risk tools revalue the same distribution for different positions, so
+    caching terminal prices makes a position change a single vectorized
+    multiply instead of a new simulation.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        model: str,
+        current_price: float,
+        volatility: float,
+        days: int,
+        simulations: int,
+        drift: float = 0.0,
+        seed: int = DEFAULT_SEED,
+        params: Optional[Dict[str, Any]] = None
+    ) -> np.ndarray:
+        """
+        Return cached terminal prices for a model, simulating on a miss.
+
+        The returned array is read-only; callers must not modify it.
+        """
+        overrides = tuple(sorted((k, float(v)) for k, v in (params or {}).items()))
+        key = (model.strip().lower(), float(current_price), float(volatility), int(days),
+               int(simulations), float(drift), int(seed), overrides)
+
+        def simulate() -> np.ndarray:
+            if key[0] == "gbm" and not overrides:
+                return simulate_gbm(current_price, volatility, days, simulations, drift, seed)
+            return simulate_process(
+                model, current_price, volatility, days, simulations, drift, seed, params
+            )
+
+        return self._get_or_simulate(key, simulate)
+
+    def get_bootstrap(
+        self,
+        series: Any,
+        current_price: float,
+        days: int,
+        simulations: int,
+        block_size: int = 5,
+        drift: Optional[float] = 0.0,
+        lookback: int = 0,
+        seed: int = DEFAULT_SEED
+    ) -> np.ndarray:
+        """
+        Return cached block-bootstrap terminal prices for a CachedSeries.
+
+        Keyed on the series ID and fetch time, so a refreshed series is
+        resampled while repeat requests against the same data are not.
+        lookback limits resampling to the most recent returns (0 = all).
+        """
+        key = ("bootstrap", series.series_id, series.fetched_at, float(current_price),
+               int(days), int(simulations), int(block_size), drift, int(lookback), int(seed))
+        returns = series.returns[-lookback:] if lookback > 0 else series.returns
+        return self._get_or_simulate(
+            key,
+            lambda: simulate_bootstrap(
+                current_price, returns, days, simulations, block_size, drift, seed
+            ),
+        )
+
+    def _get_or_simulate(self, key: Tuple, simulate: Callable[[], np.ndarray]) -> np.ndarray:
+        """Look up key, running simulate() and storing a read-only result on a miss."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        terminal = simulate()
+        terminal.flags.writeable = False
+        with self._lock:
+            self._entries[key] = terminal
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return terminal
+
+    def clear(self) -> None:
+        """Drop all cached distributions."""
+        with self._lock:
+            self._entries.clear()
+
+
+terminal_price_cache = TerminalPriceCache()
@@ -0,0 +1,326 @@
+"""
+Materialized market snapshot for Market Analysis Bot.
+Keeps a pre-rendered summary of benchmark prices (latest, week-over-week and
+month-over-month change, 30-day volatility) in memory. A background
+scheduler rebuilds it at startup and after each EIA data release, so the
+snapshot tool answers without touching the EIA API.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+import time
+from typing import List, Optional, Sequence
+
+from utils.lazy import lazy_import
+from utils.release_calendar import (
+    EASTERN,
+    PROBE_INTERVAL_SECONDS,
+    RELEASE_SCHEDULES,
+    schedule_for_path,
+)
+from utils.series_cache import SERIES_CATALOG, CachedSeries, SeriesCache, get_series_cache
+from utils.volatility import close_to_close_vol
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+logger = logging.getLogger(__name__)
+
+
+# Benchmarks in the snapshot, in display order
+SNAPSHOT_SERIES = ("RWTC", "RBRTE", "RNGWHHD")
+
+# Delay after a release before refreshing, so EIA has published the data
+RELEASE_GRACE = datetime.timedelta(minutes=5)
+
+# Retry interval after a failed refresh (seconds)
+RETRY_SECONDS = 15 * 60
+
+VOL_WINDOW_DAYS = 30
+
+
+class SnapshotRow:
+    """
+    Snapshot figures for one benchmark.
+
+    Attributes:
+        series_id: EIA series ID
+        name: Benchmark name
+        latest: Latest price
+        period: Date of the latest price
+        week_change: Percent change from the last price at least 7 days earlier
+        month_change: Percent change from the last price at least 30 days earlier
+        volatility: Annualized close-to-close volatility over the last 30 days
+    """
+
+    def __init__(
+        self,
+        series_id: str,
+        name: str,
+        latest: float,
+        period: str,
+        week_change: float,
+        month_change: float,
+        volatility: float
+    ):
+        self.series_id = series_id
+        self.name = name
+        self.latest = latest
+        self.period = period
+        self.week_change = week_change
+        self.month_change = month_change
+        self.volatility = volatility
+
+
+class MarketSnapshot:
+    """
+    An immutable, pre-rendered market snapshot.
+
+    Attributes:
+        rows: One SnapshotRow per benchmark
+        built_at: Unix timestamp when the snapshot was built
+        rendered: Markdown served by the snapshot tool
+    """
+
+    def __init__(self, rows: List[SnapshotRow], built_at: Optional[float] = None):
+        self.rows = tuple(rows)
+        self.built_at = built_at if built_at is not None else time.time()
+        self.rendered = render_snapshot(self.rows, self.built_at)
+
+
+def _change_since(dates: pd.DatetimeIndex, values: np.ndarray, days: int) -> float:
+    """Percent change from the last value at least `days` before the latest."""
+    cutoff = dates[-1] - pd.Timedelta(days=days)
+    idx = dates.searchsorted(cutoff, side="right") - 1
+    if idx < 0 or values[idx] == 0:
+        return float("nan")
+    return (values[-1] / values[idx] - 1.0) * 100
+
+
+def snapshot_row(series: CachedSeries) -> SnapshotRow:
+    """Compute snapshot figures for a daily price series."""
+    dates = pd.DatetimeIndex(pd.to_datetime(series.periods))
+    values = series.values
+    recent = values[dates.searchsorted(dates[-1] - pd.Timedelta(days=VOL_WINDOW_DAYS)):]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(np.log(recent))
+    returns = returns[np.isfinite(returns)]
+
+    return SnapshotRow(
+        series_id=series.series_id,
+        name=series.name,
+        latest=series.latest,
+        period=series.latest_period,
+        week_change=_change_since(dates, values, 7),
+        month_change=_change_since(dates, values, 30),
+        volatility=close_to_close_vol(returns) if returns.size > 1 else float("nan"),
+    )
+
+
+def render_snapshot(rows: Sequence[SnapshotRow], built_at: float) -> str:
+    """Render snapshot rows as the markdown served by the snapshot tool."""
+    def pct(value: float, sign: str = "+") -> str:
+        return f"{value:{sign}.1f}%" if np.isfinite(value) else "—"
+
+    updated = datetime.datetime.fromtimestamp(built_at, EASTERN).strftime("%Y-%m-%d %H:%M ET")
+    lines = [
+        "## Market Snapshot",
+        "",
+        f"**Updated**: {updated}",
+        "",
+        "| Benchmark | Latest | Date | WoW | MoM | 30d Vol |",
+        "|-----------|--------|------|-----|-----|---------|",
+    ]
+    lines += [
+        f"| {row.name} | ${row.latest:.2f} | {row.period} | {pct(row.week_change)} | "
+        f"{pct(row.month_change)} | {pct(row.volatility * 100, sign='')} |"
+        for row in rows
+    ]
+    lines += [
+        "",
+        "*EIA daily spot prices, refreshed after each weekly EIA release. "
+        "Use eia_data_extractor for full history.*",
+    ]
+    return "\n".join(lines)
+
+
+def next_refresh(
+    now: Optional[datetime.datetime] = None,
+    series_ids: Sequence[str] = SNAPSHOT_SERIES
+) -> datetime.datetime:
+    """Next refresh time (timezone-aware): the next release of any snapshot series, plus grace."""
+    now = (now or datetime.datetime.now(EASTERN)).astimezone(EASTERN)
+    schedules = {
+        schedule_for_path(SERIES_CATALOG.get(series_id, {}).get("path"))
+        for series_id in series_ids
+    } - {None}
+    schedules = schedules or {RELEASE_SCHEDULES["wpsr"]}
+    return min(schedule.next_release(now - RELEASE_GRACE) for schedule in schedules) + RELEASE_GRACE
+
+
+class SnapshotStore:
+    """
+    Holds the current snapshot and rebuilds it from the series cache.
+
+    Readers get the current MarketSnapshot reference; a refresh builds a
+    new snapshot and swaps the reference, so readers never see a partial
+    update and never wait on a refresh. Without the scheduler (or between
+    its runs) readers see is_stale() and can start a background refresh.
+    """
+
+    def __init__(self, series_ids: Sequence[str] = SNAPSHOT_SERIES, cache: Optional[SeriesCache] = None):
+        self.series_ids = tuple(series_ids)
+        self._cache = cache
+        self._snapshot: Optional[MarketSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._background: Optional[threading.Thread] = None
+        self._background_lock = threading.Lock()
+        # True when the last refresh ran before EIA published a due release
+        self.awaiting_release = False
+        # Message of the last failed background refresh, None after a success
+        self.last_error: Optional[str] = None
+
+    @property
+    def current(self) -> Optional[MarketSnapshot]:
+        return self._snapshot
+
+    def refresh(self, force: bool = True) -> MarketSnapshot:
+        """
+        Rebuild the snapshot.
+
+        Args:
+            force: Drop cached copies of the series first so fresh data is
+                fetched (otherwise the series cache revalidates after releases)
+
+        Raises:
+            ValueError: If a series cannot be fetched
+        """
+        cache = self._cache or get_series_cache()
+        with self._refresh_lock:
+            if force:
+                for series_id in self.series_ids:
+                    cache.invalidate(series_id)
+            series = cache.get_many(self.series_ids)
+            snapshot = MarketSnapshot([snapshot_row(series[s]) for s in self.series_ids])
+            self._snapshot = snapshot
+            self.awaiting_release = any(cache.awaiting_release(s) for s in series.values())
+        logger.info("Market snapshot refreshed (%s)", ", ".join(self.series_ids))
+        return snapshot
+
+    def is_stale(self, snapshot: MarketSnapshot) -> bool:
+        """
+        Check whether a snapshot should be rebuilt.
+
+        True once the release refresh due after it was built has passed, or
+        when it was built before EIA published a due release and has not
+        been rechecked for PROBE_INTERVAL_SECONDS.
+        """
+        built = datetime.datetime.fromtimestamp(snapshot.built_at, EASTERN)
+        if datetime.datetime.now(EASTERN) >= next_refresh(built, self.series_ids):
+            return True
+        return self.awaiting_release and time.time() - snapshot.built_at >= PROBE_INTERVAL_SECONDS
+
+    def get(self) -> MarketSnapshot:
+        """
+        Current snapshot, building it inline if missing or stale.
+
+        Blocks on EIA when it rebuilds, so tools running on the event loop
+        use current and refresh_in_background() instead. A failed rebuild
+        of a stale snapshot serves the stale one.
+
+        Raises:
+            ValueError: If there is no snapshot yet and one cannot be built
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.refresh(force=False)
+        if self.is_stale(snapshot):
+            try:
+                snapshot = self.refresh(force=False)
+            except Exception as e:
+                logger.warning("Market snapshot refresh failed, serving previous snapshot: %s", e)
+        return snapshot
+
+    def refresh_in_background(self) -> threading.Thread:
+        """
+        Start a refresh on a daemon thread unless one is already running.
+
+        Returns:
+            The running refresh thread (new or already in flight)
+        """
+        with self._background_lock:
+            if self._background is None or not self._background.is_alive():
+                self._background = threading.Thread(
+                    target=self._refresh_quietly, name="snapshot-refresh", daemon=True
+                )
+                self._background.start()
+            return self._background
+
+    def _refresh_quietly(self) -> None:
+        try:
+            self.refresh(force=False)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.warning("Market snapshot refresh failed: %s", e)
+
+
+class SnapshotScheduler(threading.Thread):
+    """
+    Daemon thread that refreshes a SnapshotStore at startup and after each
+    scheduled EIA release. If a release has not been published yet it
+    rechecks every PROBE_INTERVAL_SECONDS; failed refreshes are retried
+    every RETRY_SECONDS.
+    """
+
+    def __init__(self, store: SnapshotStore):
+        super().__init__(name="snapshot-scheduler", daemon=True)
+        self.store = store
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        delay = 0.0
+        while not self._stop_event.wait(delay):
+            try:
+                # The series cache knows the release calendar, so cached
+                # series (e.g. from warm-up) are reused until a release
+                self.store.refresh(force=False)
+                if self.store.awaiting_release:
+                    delay = PROBE_INTERVAL_SECONDS
+                    logger.info("EIA release not published yet, rechecking snapshot in %ss", delay)
+                    continue
+                due = next_refresh()
+                delay = (due - datetime.datetime.now(EASTERN)).total_seconds()
+                logger.info("Next market snapshot refresh at %s", due)
+            except Exception as e:
+                logger.warning("Market snapshot refresh failed, retrying in %ss: %s", RETRY_SECONDS, e)
+                delay = RETRY_SECONDS
+
+    def stop(self) -> None:
+        """Ask the scheduler to exit at its next wake-up."""
+        self._stop_event.set()
+
+
+snapshot_store = SnapshotStore()
+
+_scheduler: Optional[SnapshotScheduler] = None
+
+
+def start_snapshot_scheduler() -> SnapshotScheduler:
+    """Start the background snapshot scheduler (once per process)."""
+    global _scheduler
+    if _scheduler is None or not _scheduler.is_alive():
+        _scheduler = SnapshotScheduler(snapshot_store)
+        _scheduler.start()
+        logger.info("Market snapshot scheduler started")
+    return _scheduler
+
+
+def stop_snapshot_scheduler() -> None:
+    """Stop the background snapshot scheduler if it is running."""
+    if _scheduler is not None:
+        _scheduler.stop()
@@ -0,0 +1,174 @@
+"""
+Spread calculations for Market Analysis Bot.
+Inter-market and crack spreads built from several EIA series aligned on
+their period with one indexed join, then combined with a single weighted
+matrix product.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, List, Sequence, Tuple, Union
+
+from utils.lazy import lazy_import
+from utils.series_cache import CachedSeries
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+logger = logging.getLogger(__name__)
+
+
+GALLONS_PER_BARREL = 42
+
+WTI = "RWTC"
+BRENT = "RBRTE"
+NYH_GASOLINE = "EER_EPMRU_PF4_Y35NY_DPG"
+NYH_ULSD = "EER_EPD2DXL0_PF4_Y35NY_DPG"
+
+# Named spreads: weighted legs (series ID, weight in $/barrel terms) and a
+# divisor that expresses the result per barrel of crude
+SPREAD_DEFINITIONS: Dict[str, Dict[str, Union[str, float, List[Tuple[str, float]]]]] = {
+    "brent-wti": {
+        "name": "Brent-WTI Arb",
+        "legs": [(BRENT, 1.0), (WTI, -1.0)],
+        "divisor": 1.0,
+        "units": "$/barrel",
+    },
+    "3-2-1": {
+        "name": "3-2-1 Crack Spread (NY Harbor)",
+        "legs": [
+            (NYH_GASOLINE, 2.0 * GALLONS_PER_BARREL),
+            (NYH_ULSD, 1.0 * GALLONS_PER_BARREL),
+            (WTI, -3.0),
+        ],
+        "divisor": 3.0,
+        "units": "$/barrel",
+    },
+    "2-1-1": {
+        "name": "2-1-1 Crack Spread (NY Harbor)",
+        "legs": [
+            (NYH_GASOLINE, 1.0 * GALLONS_PER_BARREL),
+            (NYH_ULSD, 1.0 * GALLONS_PER_BARREL),
+            (WTI, -2.0),
+        ],
+        "divisor": 2.0,
+        "units": "$/barrel",
+    },
+    "gasoline crack": {
+        "name": "Gasoline Crack (NY Harbor)",
+        "legs": [(NYH_GASOLINE, float(GALLONS_PER_BARREL)), (WTI, -1.0)],
+        "divisor": 1.0,
+        "units": "$/barrel",
+    },
+    "diesel crack": {
+        "name": "ULSD Crack (NY Harbor)",
+        "legs": [(NYH_ULSD, float(GALLONS_PER_BARREL)), (WTI, -1.0)],
+        "divisor": 1.0,
+        "units": "$/barrel",
+    },
+}
+
+SPREAD_ALIASES = {
+    "arb": "brent-wti",
+    "brent wti": "brent-wti",
+    "321": "3-2-1",
+    "crack": "3-2-1",
+    "211": "2-1-1",
+    "rbob crack": "gasoline crack",
+    "gas crack": "gasoline crack",
+    "ulsd crack": "diesel crack",
+    "heating oil crack": "diesel crack",
+}
+
+
+def resolve_spread(name: str) -> Dict:
+    """
+    Look up a named spread definition.
+
+    Raises:
+        ValueError: If the spread is unknown
+    """
+    key = " ".join(name.lower().replace("_", " ").split())
+    key = SPREAD_ALIASES.get(key, key)
+    if key not in SPREAD_DEFINITIONS:
+        raise ValueError(
+            f"Unknown spread '{name}'. Known spreads: {', '.join(SPREAD_DEFINITIONS)} "
+            f"(or give custom legs like \"RBRTE:1,RWTC:-1\")"
+        )
+    return SPREAD_DEFINITIONS[key]
+
+
+def parse_legs(text: str) -> List[Tuple[str, float]]:
+    """
+    Parse custom spread legs such as "RBRTE:1,RWTC:-1".
+
+    Raises:
+        ValueError: If a leg is malformed or fewer than two legs are given
+    """
+    legs = []
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        series_id, sep, weight = item.partition(":")
+        try:
+            legs.append((series_id.strip().upper(), float(weight) if sep else 1.0))
+        except ValueError:
+            raise ValueError(f"Invalid leg '{item.strip()}'. Use SERIES:WEIGHT, e.g. RBRTE:1,RWTC:-1")
+    if len(legs) < 2:
+        raise ValueError("A spread needs at least two legs, e.g. RBRTE:1,RWTC:-1")
+    return legs
+
+
+def align_series(series: Sequence[CachedSeries]) -> pd.DataFrame:
+    """
+    Align several series on period with an inner join.
+
+    Returns:
+        DataFrame indexed by period (oldest first), one column per series,
+        containing only periods present in every series
+    """
+    columns = [
+        pd.Series(s.values, index=pd.Index(s.periods, name="period"), name=s.series_id)
+        for s in series
+    ]
+    columns = [c[~c.index.duplicated(keep="last")] for c in columns]
+    return pd.concat(columns, axis=1, join="inner").sort_index()
+
+
+def compute_spread(
+    frame: pd.DataFrame,
+    legs: Sequence[Tuple[str, float]],
+    divisor: float = 1.0
+) -> pd.Series:
+    """
+    Weighted spread of aligned legs: sum(weight * leg) / divisor per period.
+
+    Args:
+        frame: Aligned leg prices (see align_series)
+        legs: (series ID, weight) pairs
+        divisor: Scale applied to the weighted sum
+
+    Returns:
+        Spread values indexed by period
+    """
+    ids = [series_id for series_id, _ in legs]
+    weights = np.array([weight for _, weight in legs], dtype=np.float64)
+    values = frame[ids].to_numpy(dtype=np.float64) @ (weights / divisor)
+    return pd.Series(values, index=frame.index, name="spread")
+
+
+def describe_legs(legs: Sequence[Tuple[str, float]], divisor: float = 1.0) -> str:
+    """Formula such as "(84×EER_EPMRU... + 42×... − 3×RWTC) / 3"."""
+    terms = []
+    for i, (series_id, weight) in enumerate(legs):
+        sign = "−" if weight < 0 else "+"
+        magnitude = abs(weight)
+        term = series_id if magnitude == 1 else f"{magnitude:g}×{series_id}"
+        if i == 0:
+            terms.append(f"-{term}" if weight < 0 else term)
+        else:
+            terms.append(f"{sign} {term}")
+    formula = " ".join(terms)
+    return f"({formula}) / {divisor:g}" if divisor != 1 else formula
@@ -0,0 +1,116 @@
+"""
+Startup import profiling for Market Analysis Bot.
+Runs the server's imports in a fresh interpreter under `python -X importtime`
+and summarizes where cold-start time goes, so regressions (a tool module
+importing pandas at load time again) show up before deployment.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+from typing import List, Sequence, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+# Project modules server.py imports before it can register tools
+STARTUP_MODULES = ("tools", "utils.logging", "utils.prefetch", "utils.snapshot")
+
+# Heavy dependencies that should only load on the first tool call
+DEFERRED_MODULES = ("numpy", "pandas", "requests")
+
+# Cold-start budget for the startup modules, in milliseconds
+STARTUP_BUDGET_MS = 150.0
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        (module, self microseconds, cumulative microseconds, nesting depth)
+        per imported module, in the order the interpreter reported them
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append((
+                name.strip(),
+                int(self_us),
+                int(cumulative_us),
+                (len(name) - len(name.lstrip()) - 1) // 2,
+            ))
+        except ValueError:
+            continue
+    return rows
+
+
+def measure_startup(modules: Sequence[str] = STARTUP_MODULES) -> Tuple[float, List[Tuple[str, int, int, int]]]:
+    """
+    Import `modules` in a fresh interpreter under `-X importtime`.
+
+    Returns:
+        (wall-clock import time in ms, parsed importtime rows)
+
+    Raises:
+        RuntimeError: If the imports fail
+    """
+    statements = "; ".join(f"import {module}" for module in modules)
+    code = (
+        "import time; _t = time.perf_counter(); "
+        f"{statements}; "
+        "print((time.perf_counter() - _t) * 1000)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=_PROJECT_ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup imports failed: {result.stderr.strip().splitlines()[-1:]}")
+    return float(result.stdout.strip().splitlines()[-1]), parse_importtime(result.stderr)
+
+
+def startup_report(modules: Sequence[str] = STARTUP_MODULES, limit: int = 15) -> str:
+    """
+    Human-readable cold-start report: total import time against the budget,
+    the slowest imports by cumulative time, and whether the deferred heavy
+    dependencies stayed unloaded.
+    """
+    wall_ms, rows = measure_startup(modules)
+    loaded = {name for name, _, _, _ in rows}
+
+    # importtime lists children before their parent; keep only the trees of
+    # the project's packages, not interpreter startup (site, encodings)
+    packages = {module.split(".")[0] for module in modules}
+    project_rows = []
+    pending = []
+    for row in rows:
+        pending.append(row)
+        if row[3] == 0:
+            if row[0].split(".")[0] in packages:
+                project_rows.extend(pending)
+            pending = []
+
+    status = "within" if wall_ms <= STARTUP_BUDGET_MS else "OVER"
+    report = f"Startup imports ({', '.join(modules)}): {wall_ms:.1f} ms "
+    report += f"({status} the {STARTUP_BUDGET_MS:.0f} ms budget)\n\n"
+
+    report += f"{'cumulative ms':>14}  {'self ms':>8}  module\n"
+    slowest = sorted(project_rows, key=lambda row: row[2], reverse=True)[:limit]
+    for name, self_us, cumulative_us, depth in slowest:
+        report += f"{cumulative_us / 1000:14.1f}  {self_us / 1000:8.1f}  {'  ' * depth}{name}\n"
+
+    report += "\nDeferred until first tool call:\n"
+    for name in DEFERRED_MODULES:
+        state = "imported at startup" if name in loaded else "deferred"
+        report += f"  {name}: {state}\n"
+    return report
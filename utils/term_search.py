@@ -0,0 +1,199 @@
+"""
+Glossary search for Market Analysis Bot.
+A precomputed index over glossary terms, full names, aliases and definitions
+that resolves exact lookups with one dict hit and ranks fuzzy matches by
+trigram and edit-distance similarity, so a misspelled term resolves in a
+single tool call.
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+# Weight applied to matches against a single word of a multi-word name
+# (e.g. "crack" in "crack spread") relative to the whole name
+WORD_MATCH_WEIGHT = 0.9
+
+# Weight applied to the fraction of query words found in a definition
+DEFINITION_MATCH_WEIGHT = 0.6
+
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def normalize_term(text: str) -> str:
+    """Lowercase and collapse whitespace: the form used for exact lookups."""
+    return " ".join(text.lower().split())
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Character trigrams of a normalized string, padded per word.
+
+    Punctuation is dropped first so "3-2-1" and "321" share trigrams. Each
+    word is padded with two leading and one trailing space, so short terms
+    like "cl" still produce trigrams.
+    """
+    grams: Set[str] = set()
+    for word in _NON_ALNUM.sub("", normalize_term(text)).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two trigram sets."""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Optimal string alignment distance: insertions, deletions, substitutions
+    and adjacent transpositions each cost 1.
+    """
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            )
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def edit_similarity(a: str, b: str) -> float:
+    """1 - edit distance / longer length; catches transposed letters that trigrams miss."""
+    if not a or not b:
+        return 0.0
+    return 1.0 - edit_distance(a, b) / max(len(a), len(b))
+
+
+class TermMatch:
+    """
+    A ranked search result.
+
+    Attributes:
+        key: Glossary key of the matched term
+        score: Similarity in [0, 1]; 1.0 for an exact match
+        matched: The key, full name, alias or definition word that matched
+    """
+
+    def __init__(self, key: str, score: float, matched: str):
+        self.key = key
+        self.score = score
+        self.matched = matched
+
+    def __repr__(self) -> str:
+        return f"TermMatch(key='{self.key}', score={self.score:.2f}, matched='{self.matched}')"
+
+
+class TermIndex:
+    """
+    Search index over a glossary of {key: {"full_name", "definition", ...}}.
+
+    Built once: keys, full names and optional "aliases" go into an exact
+    lookup table and a trigram inverted index; definition words go into a
+    word index. A search only scores names that share a trigram with the
+    query, taking the better of trigram and edit-distance similarity.
+    """
+
+    def __init__(self, glossary: Dict[str, Dict]):
+        self._exact: Dict[str, str] = {}
+        self._names: List[Tuple[str, str, frozenset, float]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._words: Dict[str, Set[str]] = {}
+
+        for key, entry in glossary.items():
+            names = [key, entry.get("full_name", "")] + list(entry.get("aliases", []))
+            for name in filter(None, names):
+                self._exact.setdefault(normalize_term(name), key)
+                self._add_name(key, name, 1.0)
+                words = normalize_term(name).split()
+                if len(words) > 1:
+                    for word in words:
+                        if len(word) >= 3:
+                            self._add_name(key, word, WORD_MATCH_WEIGHT)
+            text = f"{entry.get('definition', '')} {entry.get('context', '')}"
+            for word in set(_WORD.findall(text.lower())):
+                self._words.setdefault(word, set()).add(key)
+
+        logger.debug("Term index built: %d terms, %d names", len(glossary), len(self._names))
+
+    def _add_name(self, key: str, name: str, weight: float) -> None:
+        grams = frozenset(trigrams(name))
+        if not grams:
+            return
+        index = len(self._names)
+        self._names.append((key, name, grams, weight))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(index)
+
+    def lookup(self, query: str) -> Optional[str]:
+        """Glossary key for an exact key, full name or alias (case-insensitive)."""
+        # Most queries are already normalized; skip the rewrite for those
+        return self._exact.get(query) or self._exact.get(normalize_term(query))
+
+    def search(self, query: str, limit: int = 5, min_score: float = 0.2) -> List[TermMatch]:
+        """
+        Rank glossary terms against a (possibly misspelled) query.
+
+        Args:
+            query: Search text
+            limit: Maximum number of results
+            min_score: Drop results scoring below this
+
+        Returns:
+            Best match per glossary key, highest score first
+        """
+        exact = self.lookup(query)
+        best: Dict[str, TermMatch] = {}
+        if exact is not None:
+            best[exact] = TermMatch(exact, 1.0, normalize_term(query))
+
+        query_grams = trigrams(query)
+        query_text = normalize_term(query)
+        candidates: Set[int] = set()
+        for gram in query_grams:
+            candidates.update(self._postings.get(gram, ()))
+        for index in candidates:
+            key, name, grams, weight = self._names[index]
+            score = max(
+                similarity(query_grams, grams),
+                edit_similarity(query_text, normalize_term(name)),
+            ) * weight
+            self._offer(best, key, score, name)
+
+        words = [w for w in _WORD.findall(query.lower()) if len(w) >= 3]
+        if words:
+            counts: Dict[str, List[str]] = {}
+            for word in words:
+                for key in self._words.get(word, ()):
+                    counts.setdefault(key, []).append(word)
+            for key, found in counts.items():
+                score = DEFINITION_MATCH_WEIGHT * len(found) / len(words)
+                self._offer(best, key, score, " ".join(found))
+
+        ranked = sorted(
+            (m for m in best.values() if m.score >= min_score),
+            key=lambda m: (-m.score, m.key),
+        )
+        return ranked[:limit]
+
+    @staticmethod
+    def _offer(best: Dict[str, TermMatch], key: str, score: float, matched: str) -> None:
+        current = best.get(key)
+        if current is None or score > current.score:
+            best[key] = TermMatch(key, score, matched)
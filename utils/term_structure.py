@@ -0,0 +1,208 @@
+"""
+Forward curve construction for Market Analysis Bot.
+Builds a monthly forward curve from an STEO price forecast, classifies its
+structure (contango/backwardation) from calendar spreads, and caches built
+curves per STEO release so repeat queries do not refetch.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from utils.lazy import lazy_import
+from utils.release_calendar import EASTERN, RELEASE_SCHEDULES
+from utils.series_cache import CachedSeries
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+logger = logging.getLogger(__name__)
+
+
+# Month-over-month spread (in price units) treated as flat when classifying
+DEFAULT_FLAT_TOLERANCE = 0.05
+
+
+class ForwardCurve:
+    """
+    A monthly forward curve indexed by calendar month.
+
+    Attributes:
+        series_id: Source series (e.g., "WTIPUUS")
+        release: STEO release the curve was built from ("YYYY-MM")
+        curve: Prices indexed by monthly PeriodIndex, front month first
+        spreads: Calendar spreads (next month minus this month)
+    """
+
+    def __init__(self, series_id: str, release: str, curve: pd.Series):
+        self.series_id = series_id
+        self.release = release
+        self.curve = curve
+        prices = curve.to_numpy(dtype=np.float64)
+        self.spreads = np.diff(prices)
+        prices.flags.writeable = False
+        self.spreads.flags.writeable = False
+
+    @property
+    def front(self) -> float:
+        return float(self.curve.iloc[0])
+
+    @property
+    def back(self) -> float:
+        return float(self.curve.iloc[-1])
+
+    def structure(self, tolerance: float = DEFAULT_FLAT_TOLERANCE) -> str:
+        """Overall structure of the curve (see classify_structure)."""
+        return classify_structure(self.spreads, tolerance)
+
+    def annualized_carry(self) -> float:
+        """Front-to-back return, annualized; positive in contango."""
+        months = len(self.curve) - 1
+        if months < 1 or self.front <= 0:
+            return 0.0
+        return (self.back / self.front) ** (12.0 / months) - 1.0
+
+    def __len__(self) -> int:
+        return len(self.curve)
+
+
+def classify_structure(spreads: np.ndarray, tolerance: float = DEFAULT_FLAT_TOLERANCE) -> str:
+    """
+    Classify a curve from its calendar spreads.
+
+    Args:
+        spreads: Month-over-month price differences, front first
+        tolerance: Absolute spread treated as flat
+
+    Returns:
+        "contango" (prices rise with maturity), "backwardation" (prices
+        fall), "flat", or "mixed" when the curve changes direction
+    """
+    spreads = np.asarray(spreads, dtype=np.float64)
+    rising = spreads > tolerance
+    falling = spreads < -tolerance
+    if not rising.any() and not falling.any():
+        return "flat"
+    if not falling.any():
+        return "contango"
+    if not rising.any():
+        return "backwardation"
+    return "mixed"
+
+
+def build_forward_curve(
+    series: CachedSeries,
+    release: str,
+    start: Optional[str] = None,
+    months: int = 12
+) -> ForwardCurve:
+    """
+    Build a forward curve from a monthly forecast series.
+
+    Args:
+        series: Monthly series with "YYYY-MM" periods (history and forecast)
+        release: Release label stored on the curve
+        start: First curve month "YYYY-MM" (default: the release month)
+        months: Maximum number of monthly points
+
+    Returns:
+        ForwardCurve of up to `months` points from `start`
+
+    Raises:
+        ValueError: If the series is not monthly or has no months from start
+    """
+    if series.frequency != "monthly":
+        raise ValueError(f"Forward curves need a monthly series; {series.series_id} is {series.frequency}")
+    if months < 2:
+        raise ValueError("months must be at least 2")
+
+    index = pd.PeriodIndex(series.periods, freq="M")
+    curve = pd.Series(series.values, index=index)
+    curve = curve[~curve.index.duplicated(keep="last")].sort_index()
+
+    first = pd.Period(start or release, freq="M")
+    curve = curve.loc[first:].iloc[:months]
+    if len(curve) < 2:
+        raise ValueError(
+            f"{series.series_id} has fewer than 2 months from {first} "
+            f"(latest period {series.latest_period})"
+        )
+    return ForwardCurve(series.series_id, release, curve)
+
+
+def steo_release(now: Optional[datetime.date] = None) -> str:
+    """
+    Month ("YYYY-MM") of the most recent STEO release as of a time.
+
+    Uses the STEO schedule from the release calendar (first Tuesday on or
+    after the 6th, noon ET); before that the previous month's release is
+    current. A plain date is treated as the end of that day.
+    """
+    if now is not None and not isinstance(now, datetime.datetime):
+        now = datetime.datetime.combine(now, datetime.time.max, tzinfo=EASTERN)
+    release = RELEASE_SCHEDULES["steo"].last_release(now)
+    return f"{release:%Y-%m}"
+
+
+class ForwardCurveCache:
+    """
+    Built forward curves keyed by (series_id, release, start, months).
+
+    A curve is valid until the next STEO release, so within a release a
+    repeat query neither refetches the series nor rebuilds the curve.
+    """
+
+    def __init__(self, release_fn: Callable[[], str] = steo_release, max_entries: int = 32):
+        self.release_fn = release_fn
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, ForwardCurve] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        series_id: str,
+        load: Callable[[str], CachedSeries],
+        start: Optional[str] = None,
+        months: int = 12
+    ) -> ForwardCurve:
+        """
+        Return the curve for the current release, building it on a miss.
+
+        Args:
+            series_id: Forecast series ID
+            load: Called with series_id to obtain the series on a miss
+            start: First curve month (default: release month)
+            months: Maximum number of monthly points
+        """
+        release = self.release_fn()
+        key = (series_id, release, start, months)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        curve = build_forward_curve(load(series_id), release, start, months)
+        with self._lock:
+            # Curves from older releases are never read again
+            for stale in [k for k in self._entries if k[1] != release]:
+                del self._entries[stale]
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = curve
+        return curve
+
+    def clear(self) -> None:
+        """Drop all cached curves."""
+        with self._lock:
+            self._entries.clear()
+
+
+forward_curve_cache = ForwardCurveCache()
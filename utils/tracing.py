@@ -0,0 +1,280 @@
+"""
+Request tracing for Market Analysis Bot.
+A small span API shaped like OpenTelemetry's (get_tracer,
+start_as_current_span, set_attribute, record_exception) so a tool call can
+be broken down into auth, EIA HTTP, JSON decoding, DataFrame build and
+formatting time. Spans are exported off the request thread to a JSON-lines
+file or the console, in a layout close to OTLP/JSON; swapping in the real
+OpenTelemetry SDK only needs a different get_tracer.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import queue
+import secrets
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+
+logger = logging.getLogger(__name__)
+
+
+# TRACE_EXPORTER: "none" (spans and trace IDs only), "console" or "file"
+DEFAULT_TRACE_FILE = "traces.jsonl"
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """
+    One timed operation within a trace.
+
+    Attributes:
+        name: Operation name (e.g., "eia.query")
+        trace_id: 32 hex digits shared by every span of one tool call
+        span_id: 16 hex digits
+        parent_id: span_id of the enclosing span, None for the root
+        attributes: Key/value details (path, row count, status code)
+        status: "UNSET", "OK" or "ERROR"
+        events: Timestamped events, e.g. recorded exceptions
+    """
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = "UNSET"
+        self.status_message = ""
+        self.events: List[Dict[str, Any]] = []
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_status(self, status: str, message: str = "") -> None:
+        self.status = status
+        self.status_message = message
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.events.append({
+            "name": "exception",
+            "time_unix_nano": time.time_ns(),
+            "attributes": {
+                "exception.type": type(exception).__name__,
+                "exception.message": str(exception),
+            },
+        })
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        """OTLP/JSON-style span record."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "start_time_unix_nano": self.start_time_ns,
+            "end_time_unix_nano": self.end_time_ns,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "status": {"code": self.status, "message": self.status_message},
+            "events": self.events,
+        }
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans in a list; for tests."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+
+    def export(self, spans: List[Span]) -> None:
+        self.spans.extend(spans)
+
+    def shutdown(self) -> None:
+        pass
+
+
+class JsonLinesSpanExporter:
+    """
+    Writes one JSON span per line to a stream or file.
+
+    Attributes:
+        path: File appended to, or None for the stream
+    """
+
+    def __init__(self, path: Optional[str] = None, stream: Optional[TextIO] = None):
+        self.path = path
+        self._stream = stream or (open(path, "a", encoding="utf-8") if path else sys.stderr)
+
+    def export(self, spans: List[Span]) -> None:
+        for span in spans:
+            self._stream.write(json.dumps(span.to_dict(), default=str) + "\n")
+        self._stream.flush()
+
+    def shutdown(self) -> None:
+        if self.path:
+            self._stream.close()
+
+
+class BatchSpanProcessor:
+    """
+    Hands finished spans to an exporter on a background thread.
+
+    Ending a span only enqueues it, so a slow exporter never adds latency
+    to a tool call.
+    """
+
+    def __init__(self, exporter, max_batch: int = 256):
+        self.exporter = exporter
+        self.max_batch = max_batch
+        self._queue: "queue.SimpleQueue[Optional[Span]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="span-export", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        self._queue.put(span)
+
+    def _run(self) -> None:
+        while True:
+            span = self._queue.get()
+            batch = []
+            while span is not None:
+                batch.append(span)
+                if len(batch) >= self.max_batch or self._queue.empty():
+                    break
+                span = self._queue.get()
+            if batch:
+                try:
+                    self.exporter.export(batch)
+                except Exception as e:
+                    logger.warning("Span export failed: %s", e)
+            if span is None:
+                return
+
+    def shutdown(self) -> None:
+        """Export what is queued, then stop."""
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+        self.exporter.shutdown()
+
+
+class SimpleSpanProcessor:
+    """Exports each span as it ends, on the calling thread; for tests."""
+
+    def __init__(self, exporter):
+        self.exporter = exporter
+
+    def on_end(self, span: Span) -> None:
+        self.exporter.export([span])
+
+    def shutdown(self) -> None:
+        self.exporter.shutdown()
+
+
+class Tracer:
+    """
+    Creates spans for one instrumented module.
+
+    Attributes:
+        name: Instrumentation scope, usually the module's __name__
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        """
+        Time the enclosed block as a child of the current span (or a new trace).
+
+        An exception escaping the block is recorded and marks the span ERROR.
+        """
+        span = Span(name, _current_span.get(), attributes)
+        span.set_attribute("instrumentation.scope", self.name)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            span.set_status("ERROR", str(e))
+            raise
+        finally:
+            span.end_time_ns = time.time_ns()
+            _current_span.reset(token)
+            processor = _processor
+            if processor is not None:
+                processor.on_end(span)
+
+
+_processor = None
+_processor_lock = threading.Lock()
+
+
+def set_span_processor(processor) -> None:
+    """Replace the span processor (None disables export); the old one is shut down."""
+    global _processor
+    with _processor_lock:
+        previous, _processor = _processor, processor
+    if previous is not None:
+        previous.shutdown()
+
+
+def configure_tracing(exporter: Optional[str] = None, path: Optional[str] = None) -> None:
+    """
+    Set up span export from arguments or TRACE_EXPORTER / TRACE_FILE.
+
+    Args:
+        exporter: "none", "console" or "file" (default: TRACE_EXPORTER or "none")
+        path: JSON-lines file for the file exporter (default: TRACE_FILE or traces.jsonl)
+
+    Raises:
+        ValueError: If the exporter name is unknown
+    """
+    exporter = (exporter or os.getenv("TRACE_EXPORTER", "none")).lower()
+    if exporter == "none":
+        set_span_processor(None)
+    elif exporter == "console":
+        set_span_processor(BatchSpanProcessor(JsonLinesSpanExporter()))
+    elif exporter == "file":
+        path = path or os.getenv("TRACE_FILE", DEFAULT_TRACE_FILE)
+        set_span_processor(BatchSpanProcessor(JsonLinesSpanExporter(path)))
+        logger.info("Exporting trace spans to %s", path)
+    else:
+        raise ValueError(f"Unknown TRACE_EXPORTER '{exporter}'. Use none, console or file")
+
+
+def exporting() -> bool:
+    """Whether finished spans go anywhere (TRACE_EXPORTER is not "none")."""
+    return _processor is not None
+
+
+def get_tracer(name: str) -> Tracer:
+    return Tracer(name)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    """Trace ID of the active span, or None outside a trace."""
+    span = _current_span.get()
+    return span.trace_id if span else None
+
+
+atexit.register(set_span_processor, None)
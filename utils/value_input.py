@@ -0,0 +1,167 @@
+"""
+Numeric input parsing for analysis tools.
+Turns tool string arguments (CSV, JSON array, base64 float64 buffer or a
+cached series reference) into float64 NumPy arrays. CSV, base64 and series
+inputs never build intermediate Python float lists; JSON goes through
+json.loads so nesting and non-numbers are caught.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import logging
+import re
+import warnings
+from typing import Tuple
+
+from utils.lazy import lazy_import
+from utils.series_cache import get_series_cache
+
+np = lazy_import("numpy")
+
+
+logger = logging.getLogger(__name__)
+
+
+INPUT_FORMATS = ("auto", "csv", "json", "base64", "series")
+
+BASE64_PREFIX = "base64:"
+SERIES_PREFIX = "series:"
+
+# A comma-separated field that is empty or only whitespace
+_EMPTY_FIELD = re.compile(r"(?:^|,)\s*(?:,|$)")
+
+
+def detect_format(values: str) -> str:
+    """
+    Detect the input format of a values string.
+
+    Rules: "[...]" is a JSON array, "base64:..." a base64 float64 buffer,
+    "series:ID" a cached EIA series reference, anything else CSV.
+    """
+    head = values.lstrip()[:8].lower()
+    if head.startswith("["):
+        return "json"
+    if head.startswith(BASE64_PREFIX):
+        return "base64"
+    if head.startswith(SERIES_PREFIX):
+        return "series"
+    return "csv"
+
+
+def parse_values(values: str, input_format: str = "auto") -> Tuple[np.ndarray, str]:
+    """
+    Parse a numeric dataset passed as a tool argument.
+
+    Args:
+        values: The dataset, e.g. "71.5,70.2", "[71.5, 70.2]",
+            "base64:<little-endian float64 bytes>" or "series:RWTC"
+            (optionally "series:RWTC@weekly")
+        input_format: One of INPUT_FORMATS (default: "auto")
+
+    Returns:
+        Tuple of (float64 array, resolved format). Base64 and series inputs
+        are returned as read-only views without copying.
+
+    Raises:
+        ValueError: If the format is unknown or the data cannot be parsed
+    """
+    if input_format not in INPUT_FORMATS:
+        raise ValueError(
+            f"Invalid input format: '{input_format}'. "
+            f"Valid options: {', '.join(INPUT_FORMATS)}"
+        )
+    if input_format == "auto":
+        input_format = detect_format(values)
+
+    if input_format == "csv":
+        arr = _parse_text(values)
+    elif input_format == "json":
+        arr = _parse_json(values)
+    elif input_format == "base64":
+        arr = _parse_base64(values)
+    else:
+        arr = _parse_series_ref(values)
+
+    if arr.size and not np.isfinite(arr).all():
+        raise ValueError("Values must be finite numbers")
+
+    return arr, input_format
+
+
+def encode_values(values: np.ndarray) -> str:
+    """
+    Encode an array as a "base64:" string accepted by parse_values.
+
+    Args:
+        values: Numeric array
+
+    Returns:
+        "base64:" followed by the little-endian float64 buffer
+    """
+    buffer = np.ascontiguousarray(values, dtype="<f8").tobytes()
+    return BASE64_PREFIX + base64.b64encode(buffer).decode("ascii")
+
+
+def _parse_text(text: str) -> np.ndarray:
+    """Parse comma-separated numbers in C without a Python-level loop."""
+    # np.fromstring reads blank text as [-1.0]
+    if not text.strip():
+        raise ValueError("No values provided")
+    # np.fromstring tolerates a trailing separator ("1,2,"); an empty field
+    # anywhere is an error, as with float("")
+    if _EMPTY_FIELD.search(text):
+        raise ValueError(
+            "Empty value in list. Use comma-separated values like: 71.5,70.2,72.1"
+        )
+    # Older NumPy releases only warn (and truncate) on malformed text
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype=np.float64, sep=",")
+        except (ValueError, DeprecationWarning):
+            raise ValueError(
+                "Invalid number format. Use comma-separated values like: 71.5,70.2,72.1"
+            )
+
+
+def _parse_json(values: str) -> np.ndarray:
+    """Parse a JSON array, which must be flat and hold only numbers."""
+    try:
+        data = json.loads(values)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON array: {e}")
+    if not isinstance(data, list) or not all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in data
+    ):
+        raise ValueError("JSON input must be a flat array of numbers like [71.5, 70.2]")
+    return np.array(data, dtype=np.float64)
+
+
+def _parse_base64(values: str) -> np.ndarray:
+    """Decode a base64 little-endian float64 buffer as a zero-copy view."""
+    payload = values.strip()
+    if payload.lower().startswith(BASE64_PREFIX):
+        payload = payload[len(BASE64_PREFIX):]
+    try:
+        raw = base64.b64decode(payload, validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid base64 data")
+    if len(raw) % 8:
+        raise ValueError(
+            f"Base64 buffer is {len(raw)} bytes; expected a multiple of 8 (float64)"
+        )
+    return np.frombuffer(raw, dtype="<f8")
+
+
+def _parse_series_ref(values: str) -> np.ndarray:
+    """Resolve "series:ID[@frequency]" to the cached series values."""
+    ref = values.strip()
+    if ref.lower().startswith(SERIES_PREFIX):
+        ref = ref[len(SERIES_PREFIX):]
+    series_id, _, frequency = ref.partition("@")
+    if not series_id.strip():
+        raise ValueError("Series reference must look like series:RWTC")
+    return get_series_cache().get(series_id, frequency.strip().lower() or None).values
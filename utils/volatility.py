@@ -0,0 +1,201 @@
+"""
+Volatility estimators for Market Analysis Bot.
+Annualized realized volatility from price series using close-to-close,
+EWMA (RiskMetrics) and GARCH(1,1) estimators.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Optional
+
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+logger = logging.getLogger(__name__)
+
+
+# Observations per year used to annualize volatility for each EIA frequency
+PERIODS_PER_YEAR = {
+    "daily": 252,
+    "weekly": 52,
+    "monthly": 12,
+    "annual": 1,
+}
+
+# Default number of recent returns used per frequency (about two years)
+DEFAULT_LOOKBACK = {
+    "daily": 252,
+    "weekly": 104,
+    "monthly": 60,
+    "annual": 20,
+}
+
+VOL_METHODS = ("close_to_close", "ewma", "garch")
+
+# GARCH(1,1) parameter grid searched by maximum likelihood, as
+# (start, stop, points) for np.linspace
+_GARCH_ALPHAS = (0.01, 0.30, 30)
+_GARCH_BETAS = (0.50, 0.98, 49)
+
+
+def log_returns(values: np.ndarray) -> np.ndarray:
+    """
+    Compute log-returns of a price series.
+
+    Returns involving non-positive prices (e.g., WTI on 2020-04-20) are
+    undefined and dropped.
+
+    Args:
+        values: Prices ordered oldest to newest
+
+    Returns:
+        Array of finite log-returns (length <= len(values) - 1)
+    """
+    prices = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(np.log(prices))
+    return returns[np.isfinite(returns)]
+
+
+def periods_per_year(frequency: str) -> int:
+    """
+    Get the annualization factor for a data frequency.
+
+    Raises:
+        ValueError: If the frequency is not recognized
+    """
+    try:
+        return PERIODS_PER_YEAR[frequency]
+    except KeyError:
+        raise ValueError(
+            f"Invalid frequency: '{frequency}'. "
+            f"Valid options: {', '.join(PERIODS_PER_YEAR)}"
+        )
+
+
+def close_to_close_vol(returns: np.ndarray, periods: int = 252) -> float:
+    """
+    Annualized sample standard deviation of log-returns.
+
+    Args:
+        returns: Log-returns
+        periods: Observations per year
+
+    Returns:
+        Annualized volatility as decimal (e.g., 0.25 for 25%)
+    """
+    if len(returns) < 2:
+        raise ValueError("At least 2 returns are required to estimate volatility")
+    return float(np.std(returns, ddof=1) * np.sqrt(periods))
+
+
+def ewma_vol(returns: np.ndarray, periods: int = 252, decay: float = 0.94) -> float:
+    """
+    Annualized exponentially weighted volatility (RiskMetrics).
+
+    Weights decay geometrically from the most recent return and are
+    normalized over the finite sample, so no seed variance is needed.
+
+    Args:
+        returns: Log-returns ordered oldest to newest
+        periods: Observations per year
+        decay: Decay factor lambda in (0, 1) (default: 0.94)
+
+    Returns:
+        Annualized volatility as decimal
+    """
+    if not 0.0 < decay < 1.0:
+        raise ValueError("EWMA decay must be between 0 and 1")
+    if len(returns) < 2:
+        raise ValueError("At least 2 returns are required to estimate volatility")
+
+    weights = decay ** np.arange(len(returns))[::-1]
+    variance = np.dot(weights, np.square(returns)) / weights.sum()
+    return float(np.sqrt(variance * periods))
+
+
+def garch11_vol(returns: np.ndarray, periods: int = 252) -> Dict[str, float]:
+    """
+    Fit GARCH(1,1) by grid-search maximum likelihood and forecast volatility.
+
+    Uses variance targeting (omega = var * (1 - alpha - beta)) and evaluates
+    the variance recursion for every (alpha, beta) pair at once, so the cost is
+    one pass over the returns regardless of grid size.
+
+    Args:
+        returns: Log-returns ordered oldest to newest
+        periods: Observations per year
+
+    Returns:
+        Dict with annualized one-step-ahead "volatility", fitted "alpha",
+        "beta", "omega" and annualized "long_run_volatility"
+    """
+    if len(returns) < 10:
+        raise ValueError("At least 10 returns are required to fit GARCH(1,1)")
+
+    eps = returns - returns.mean()
+    sq = np.square(eps)
+    sample_var = sq.mean()
+
+    alpha, beta = np.meshgrid(np.linspace(*_GARCH_ALPHAS), np.linspace(*_GARCH_BETAS), indexing="ij")
+    alpha, beta = alpha.ravel(), beta.ravel()
+    stationary = alpha + beta < 0.999
+    alpha, beta = alpha[stationary], beta[stationary]
+    omega = sample_var * (1.0 - alpha - beta)
+
+    variance = np.full(alpha.shape, sample_var)
+    neg_loglik = np.zeros(alpha.shape)
+    for sq_t in sq:
+        neg_loglik += np.log(variance) + sq_t / variance
+        variance = omega + alpha * sq_t + beta * variance
+
+    best = int(np.argmin(neg_loglik))
+    forecast = variance[best]
+
+    return {
+        "volatility": float(np.sqrt(forecast * periods)),
+        "alpha": float(alpha[best]),
+        "beta": float(beta[best]),
+        "omega": float(omega[best]),
+        "long_run_volatility": float(np.sqrt(sample_var * periods)),
+    }
+
+
+def estimate_volatility(
+    values: np.ndarray,
+    method: str = "close_to_close",
+    frequency: str = "daily",
+    lookback: Optional[int] = None,
+    ewma_decay: float = 0.94
+) -> float:
+    """
+    Estimate annualized volatility from a price series.
+
+    Args:
+        values: Prices ordered oldest to newest
+        method: One of "close_to_close", "ewma", "garch"
+        frequency: Data frequency used for annualization
+        lookback: Use only the most recent N returns (None for all)
+        ewma_decay: Decay factor for the EWMA estimator
+
+    Returns:
+        Annualized volatility as decimal
+    """
+    returns = log_returns(values)
+    if lookback:
+        returns = returns[-lookback:]
+    periods = periods_per_year(frequency)
+
+    if method == "close_to_close":
+        return close_to_close_vol(returns, periods)
+    if method == "ewma":
+        return ewma_vol(returns, periods, ewma_decay)
+    if method == "garch":
+        return garch11_vol(returns, periods)["volatility"]
+
+    raise ValueError(
+        f"Invalid volatility method: '{method}'. Valid options: {', '.join(VOL_METHODS)}"
+    )